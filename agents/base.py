@@ -0,0 +1,114 @@
+"""
+Base Agent - shared Claude call path
+
+Routes each agent task to its model/max_tokens profile from config.Settings,
+falls back to settings.fallback_model when the routed model is overloaded,
+optionally hedges slow calls on interactive tasks, and records every call
+in telemetry.
+"""
+
+import time
+
+from anthropic import Anthropic, APIStatusError
+
+from config import ModelRoute, get_settings
+
+from .hedging import Attempt, HedgeBudget, LatencyTracker, run_hedged
+from .telemetry import CallRecord, Telemetry
+
+# HTTP status the API returns when a model is overloaded
+OVERLOADED_STATUS = 529
+
+# Shared by every agent in the process; configured from settings by the first agent
+telemetry = Telemetry()
+first_token_latency = LatencyTracker()
+hedge_budget = HedgeBudget(0.0)
+
+
+class BaseAgent:
+    """
+    Base for all agents:
+    1. Owns the Anthropic client
+    2. Resolves task → model route
+    3. Hedges slow first tokens on tasks listed in settings.hedge_tasks
+    4. Retries on the fallback model when the routed model is overloaded
+    """
+
+    def __init__(self):
+        # Settings are read here, not at import, so importing an agent needs no API key
+        self.settings = get_settings()
+        telemetry.log_path = self.settings.telemetry_log
+        hedge_budget.fraction = self.settings.hedge_budget
+        self.client = Anthropic(api_key=self.settings.anthropic_api_key)
+
+    def route(self, task: str) -> ModelRoute:
+        """Resolve the model route for a task (model=None means claude_model)."""
+        route = self.settings.model_routes.get(task, ModelRoute())
+        model = route.model or self.settings.claude_model
+        return ModelRoute(model=model, max_tokens=route.max_tokens)
+
+    def _complete(self, task: str, system: str, content: str) -> str:
+        """Run a single-turn completion for a task and return the response text."""
+        route = self.route(task)
+        started = time.monotonic()
+
+        try:
+            response, model, hedged = self._request(
+                task, route.model, route.max_tokens, system, content
+            )
+        except APIStatusError as e:
+            if e.status_code != OVERLOADED_STATUS or not self.settings.fallback_model:
+                raise
+            response, model, hedged = self._request(
+                task, self.settings.fallback_model, route.max_tokens, system, content
+            )
+
+        telemetry.record(CallRecord(
+            task=task,
+            model=model,
+            routed_model=route.model,
+            latency_s=round(time.monotonic() - started, 3),
+            input_tokens=response.usage.input_tokens,
+            output_tokens=response.usage.output_tokens,
+            fallback=model != route.model and model == self.settings.fallback_model,
+            hedged=hedged,
+        ))
+        return response.content[0].text
+
+    def _request(self, task: str, model: str, max_tokens: int, system: str, content: str):
+        """Send the request, hedged when enabled for the task. Returns (response, model, hedged)."""
+        if task not in self.settings.hedge_tasks:
+            return self._create(model, max_tokens, system, content), model, False
+
+        def call(attempt: Attempt):
+            with self.client.messages.stream(
+                model=attempt.model,
+                max_tokens=max_tokens,
+                system=system,
+                messages=[{"role": "user", "content": content}],
+            ) as stream:
+                attempt.on_cancel(stream.close)
+                for event in stream:
+                    if attempt.cancelled.is_set():
+                        return None
+                    if event.type == "content_block_delta":
+                        attempt.mark_first_token()
+                return stream.get_final_message()
+
+        delay = first_token_latency.percentile(
+            task, self.settings.hedge_percentile, self.settings.hedge_min_samples
+        )
+        response, winner, hedged = run_hedged(
+            call, model, self.settings.hedge_model or model, delay, hedge_budget
+        )
+        if winner.first_token_at is not None:
+            first_token_latency.add(task, winner.first_token_at)
+        return response, winner.model, hedged
+
+    def _create(self, model: str, max_tokens: int, system: str, content: str):
+        return self.client.messages.create(
+            model=model,
+            max_tokens=max_tokens,
+            system=system,
+            messages=[{"role": "user", "content": content}],
+        )
@@ -4,22 +4,40 @@ Draft Agent - Phase 1
 Generates full prose from outline, matching existing blog style.
 """
 
-import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-from anthropic import Anthropic
+from .base import BaseAgent
+from .sections import (
+    OUTLINE_ONLY,
+    Section,
+    align_sections,
+    changed_sections,
+    deleted_sections,
+    join_sections,
+    split_sections,
+)
+
+
+# Style guide cache: (mtime_ns, content), refreshed when the file changes
+_style_guide_cache: tuple[int, str] | None = None
 
 
 # Load blog style guide for prompt context
-def _load_style_guide -> str:
- """Load BLOG_STYLE_GUIDE.md content for prompt context."""
- style_guide_path = Path(__file__).parent.parent / "BLOG_STYLE_GUIDE.md"
- if style_guide_path.exists:
- return style_guide_path.read_text
- return ""
+def _load_style_guide() -> str:
+    """Load BLOG_STYLE_GUIDE.md content for prompt context (cached by mtime)."""
+    global _style_guide_cache
+    style_guide_path = Path(__file__).parent.parent / "BLOG_STYLE_GUIDE.md"
+    if not style_guide_path.exists():
+        return ""
 
+    mtime = style_guide_path.stat().st_mtime_ns
+    if _style_guide_cache is None or _style_guide_cache[0] != mtime:
+        _style_guide_cache = (mtime, style_guide_path.read_text())
+    return _style_guide_cache[1]
 
-class DraftAgent:
+
+class DraftAgent(BaseAgent):
  """
  Draft agent that:
  1. Generates full article text from outline
@@ -29,10 +47,6 @@ class DraftAgent:
  5. Adds image/diagram placeholders with specs
  """
 
- def __init__(self):
- self.client = Anthropic(api_key=os.getenv("ANTHROPIC_API_KEY"))
- self.model = os.getenv("CLAUDE_MODEL", "claude-3-5-sonnet-20241022")
-
  def generate_draft(self, outline_content: str, style_refs: list[str] = None) -> str:
  """
  Generate full draft from outline.
@@ -160,17 +174,134 @@ The {{concept-name}} approach differs because...
  if style_section:
  user_message += f"\n{style_section}\nPlease match the style and tone of these references."
 
- # Call Claude API
- response = self.client.messages.create(
- model=self.model,
- max_tokens=8000,
- system=system_prompt,
- messages=[
- {
- "role": "user",
- "content": user_message
- }
- ]
- )
-
- return response.content[0].text
+ # Call Claude API (routed via settings.model_routes["draft"])
+ return self._complete("draft", system_prompt, user_message)
+
+    def redraft_sections(
+        self,
+        outline_content: str,
+        previous_outline: str,
+        draft_content: str,
+        style_refs: list[str] = None,
+    ) -> tuple[str, list[str], list[str]]:
+        """
+        Regenerate only the draft sections whose outline section changed.
+
+        Draft sections whose outline section was deleted are removed.
+
+        Args:
+            outline_content: Current outline_final.md
+            previous_outline: outline_final.md as of the last draft run
+            draft_content: Existing (possibly hand-edited) draft.md
+            style_refs: Optional list of reference post contents for style matching
+
+        Returns:
+            Tuple of (updated draft, headings of regenerated sections, notes
+            for the user: removed sections and replies that needed repair)
+        """
+        outline = split_sections(outline_content)
+        previous = split_sections(previous_outline)
+        draft = split_sections(draft_content)
+        changed = changed_sections(outline, previous)
+        mapping = align_sections(outline, draft)
+        removed = deleted_sections(outline, previous, draft)
+        notes = [f"Removed {draft[d].heading!r} (deleted from the outline)" for d in removed]
+
+        # (outline index, draft index or None for a new section)
+        jobs = [
+            (i, mapping.get(i))
+            for i, section in enumerate(outline)
+            if section.key in changed and section.key not in OUTLINE_ONLY
+        ]
+        if not jobs and not removed:
+            return draft_content, [], []
+
+        def regenerate(job: tuple[int, int | None]) -> str:
+            i, d = job
+            if d is None:
+                # New section: neighbours are the draft sections around its insertion point
+                prev_d = max((mapping[k] for k in mapping if k < i), default=-1)
+                current, next_d = None, prev_d + 1
+            else:
+                current, prev_d, next_d = draft[d], d - 1, d + 1
+            before, after = _section_at(draft, prev_d), _section_at(draft, next_d)
+            return self._redraft_section(outline[i], current, before, after, style_refs)
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            rewritten = list(pool.map(regenerate, jobs))
+
+        # Apply replacements, then insert new sections after their predecessor
+        inserts: dict[int, list[Section]] = {}
+        for (i, d), text in zip(jobs, rewritten):
+            heading = outline[i].heading if d is None else draft[d].heading
+            section, extra = _as_section(text, heading)
+            if extra:
+                notes.append(
+                    f"The reply for {section.heading!r} had {extra} more `## ` section(s); "
+                    "they were kept inside it, check the draft"
+                )
+            if d is not None:
+                draft[d] = section
+            else:
+                prev_d = max((mapping[k] for k in mapping if k < i), default=-1)
+                inserts.setdefault(prev_d, []).append(section)
+
+        result = list(inserts.get(-1, []))
+        for d, section in enumerate(draft):
+            if d not in removed:
+                result.append(section)
+            result.extend(inserts.get(d, []))
+
+        regenerated = [outline[i].heading or "(preamble)" for i, _ in jobs]
+        return join_sections(result), regenerated, notes
+
+    def _redraft_section(
+        self,
+        outline_section: Section,
+        current: Section | None,
+        before: Section | None,
+        after: Section | None,
+        style_refs: list[str] | None,
+    ) -> str:
+        """Rewrite one draft section from its outline section, keeping transitions intact."""
+        style_guide = _load_style_guide()
+        system_prompt = f"""You are a draft agent revising one section of a blog post.
+
+Rewrite ONLY the requested section so it follows its updated outline.
+- Keep the voice, tone and formatting of the surrounding sections
+- Write transitions that connect to the section before and after
+- Keep citation markers [^N], {{{{concept}}}} tags and image placeholders consistent
+- Return the section alone, starting with its `## ` heading
+
+{f"# Blog Style Guide{chr(10)}{chr(10)}{style_guide}" if style_guide else ""}"""
+
+        parts = [f"# Updated Outline Section\n\n{outline_section.text}"]
+        if current:
+            parts.append(f"# Current Draft Section (to be rewritten)\n\n{current.text}")
+        if before:
+            parts.append(f"# Preceding Section (context only, do not rewrite)\n\n{before.text}")
+        if after:
+            parts.append(f"# Following Section (context only, do not rewrite)\n\n{after.text}")
+        if style_refs:
+            refs = "\n...\n\n".join(ref[:1500] for ref in style_refs)
+            parts.append(f"# Style References\n\n{refs}")
+
+        return self._complete("draft_section", system_prompt, "\n\n".join(parts))
+
+
+def _as_section(text: str, fallback_heading: str) -> tuple[Section, int]:
+    """
+    Parse a regenerated section, keeping the old heading if the model dropped it.
+
+    The reply should be one section; any further `## ` sections are folded
+    into its body rather than dropped. Returns the section and how many
+    sections were folded in.
+    """
+    first, *extra = split_sections(text.strip())
+    heading = first.heading or fallback_heading
+    body = "\n".join([first.body, *(s.text for s in extra)])
+    return Section(heading, body.strip("\n") + "\n"), len(extra)
+
+
+def _section_at(sections: list[Section], index: int) -> Section | None:
+    return sections[index] if 0 <= index < len(sections) else None
@@ -0,0 +1,106 @@
+"""
+Research Findings Merge
+
+Reduce step for fan-out research: combines per-key-point findings into one
+research.md, deduplicating 3P citations, concepts and entities locally
+instead of spending another model call.
+"""
+
+import re
+
+from .sections import split_sections
+
+_LINK = re.compile(r"\*\*Link\*\*:\s*(\S+)")
+_CONCEPT = re.compile(r"^\s*[-*]\s*\{\{([^}]+)\}\}\s*:?\s*(.*)$")
+_ENTITY = re.compile(r"^\s*[-*]\s*\[?([^\]:]+?)\]?\s*:\s*(.*)$")
+
+
+def _entries(body: str) -> list[tuple[str, str]]:
+    """Split a section body into (### heading, text) entries."""
+    entries: list[tuple[str, str]] = []
+    for line in body.strip().split("\n"):
+        if line.startswith("### "):
+            entries.append((line[4:].strip(), ""))
+        elif entries:
+            entries[-1] = (entries[-1][0], f"{entries[-1][1]}\n{line}")
+    return [(heading, text.strip()) for heading, text in entries]
+
+
+def _demote(body: str) -> str:
+    """Push ### entries down one level so they nest under a per-point heading."""
+    return re.sub(r"^###", "####", body.strip(), flags=re.MULTILINE)
+
+
+def _citation_key(heading: str, text: str) -> str:
+    link = _LINK.search(text)
+    if link and link.group(1).startswith("http"):
+        return link.group(1).rstrip("/").lower()
+    return re.sub(r"[^a-z0-9]+", " ", heading.lower()).strip()
+
+
+def merge_findings(title: str, pov: str, results: list[tuple[str, str]]) -> str:
+    """
+    Merge (key point, findings markdown) pairs into a single research document.
+
+    Evidence stays grouped per key point; citations, concepts, entities and
+    quality notes are deduplicated across points.
+    """
+    citations: dict[str, tuple[str, str, list[int]]] = {}
+    concepts: dict[str, tuple[str, str]] = {}
+    entities: dict[str, str] = {}
+    notes: dict[str, None] = {}
+    point_blocks: list[str] = []
+
+    for n, (point, findings) in enumerate(results, 1):
+        sections = {s.key: s.body for s in split_sections(findings)}
+        block = [f"## Key Point {n}: {point}"]
+        for key, label in (
+            ("supporting evidence (1p)", "Supporting Evidence (1P)"),
+            ("refuting evidence / counterarguments", "Refuting Evidence / Counterarguments"),
+        ):
+            if sections.get(key, "").strip():
+                block.append(f"### {label}\n{_demote(sections[key])}")
+        point_blocks.append("\n\n".join(block))
+
+        for heading, text in _entries(sections.get("recommended 3p citations", "")):
+            key = _citation_key(heading, text)
+            if key in citations:
+                citations[key][2].append(n)
+            else:
+                citations[key] = (heading, text, [n])
+
+        for line in sections.get("key concepts", "").split("\n"):
+            match = _CONCEPT.match(line)
+            if match:
+                name, definition = match.group(1).strip(), match.group(2).strip()
+                current = concepts.get(name.lower())
+                if current is None or len(definition) > len(current[1]):
+                    concepts[name.lower()] = (name, definition)
+
+        for line in sections.get("entities to link", "").split("\n"):
+            match = _ENTITY.match(line)
+            if match:
+                entities.setdefault(match.group(1).strip(), match.group(2).strip())
+
+        for line in sections.get("research quality notes", "").split("\n"):
+            if line.strip():
+                notes.setdefault(line.rstrip(), None)
+
+    parts = [f"# Research Findings: {title}", f"## POV Summary\n{pov.strip()}", *point_blocks]
+    if citations:
+        parts.append("## Recommended 3P Citations\n" + "\n\n".join(
+            f"### {heading}\n{text}\n- **Supports**: "
+            + ", ".join(f"Key Point {p}" for p in points)
+            for heading, text, points in citations.values()
+        ))
+    if concepts:
+        parts.append("## Key Concepts\n" + "\n".join(
+            f"- {{{{{name}}}}}: {definition}" for name, definition in concepts.values()
+        ))
+    if entities:
+        parts.append("## Entities to Link\n" + "\n".join(
+            f"- {name}: {context}" for name, context in entities.items()
+        ))
+    if notes:
+        parts.append("## Research Quality Notes\n" + "\n".join(notes))
+    return "\n\n".join(parts) + "\n"
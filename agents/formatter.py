@@ -4,22 +4,18 @@ Formatter Agent - Phase 1
 Transforms final draft for different publishing platforms.
 """
 
-import os
-from anthropic import Anthropic
 from datetime import datetime
 
+from .base import BaseAgent
 
-class FormatterAgent:
+
+class FormatterAgent(BaseAgent):
  """
  Formatter agent that:
  1. Generates LinkedIn version (platform-appropriate formatting)
  2. Creates frontmatter for semops-core integration
  """
 
- def __init__(self):
- self.client = Anthropic(api_key=os.getenv("ANTHROPIC_API_KEY"))
- self.model = os.getenv("CLAUDE_MODEL", "claude-3-5-sonnet-20241022")
-
  def format_for_platforms(
  self, final_content: str, slug: str
  ) -> tuple[str, str]:
@@ -60,19 +56,7 @@ Transform the content to:
 Focus on the key insights and make it engaging for LinkedIn audience.
 """
 
- response = self.client.messages.create(
- model=self.model,
- max_tokens=4000,
- system=system_prompt,
- messages=[
- {
- "role": "user",
- "content": f"Adapt this for LinkedIn:\n\n{content}"
- }
- ]
- )
-
- return response.content[0].text
+ return self._complete("linkedin", system_prompt, f"Adapt this for LinkedIn:\n\n{content}")
 
  def _generate_frontmatter(self, content: str, slug: str) -> str:
  """Generate frontmatter YAML for semops-core"""
@@ -91,14 +75,10 @@ Extract and structure:
 Output as YAML format for frontmatter.
 """
 
- response = self.client.messages.create(
- model=self.model,
- max_tokens=2000,
- system=system_prompt,
- messages=[
- {
- "role": "user",
- "content": f"""Extract metadata from this content:
+ return self._complete(
+ "frontmatter",
+ system_prompt,
+ f"""Extract metadata from this content:
 
 Slug: {slug}
 Date: {datetime.now.isoformat}
@@ -106,9 +86,5 @@ Date: {datetime.now.isoformat}
 Content:
 {content}
 
-Generate frontmatter YAML."""
- }
- ]
+Generate frontmatter YAML.""",
  )
-
- return response.content[0].text
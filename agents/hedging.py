@@ -0,0 +1,130 @@
+"""
+Hedged Requests
+
+Cuts tail latency on interactive stages: when a call has not produced its
+first token within a percentile of recent time-to-first-token, a duplicate
+is fired (optionally on another model) and the first to complete wins.
+The loser is cancelled. A budget caps hedges at a fraction of traffic.
+"""
+
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+
+_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="hedge")
+
+
+class LatencyTracker:
+    """Rolling window of time-to-first-token samples per task."""
+
+    def __init__(self, window: int = 200):
+        self.window = window
+        self._samples: dict[str, deque[float]] = {}
+        self._lock = threading.Lock()
+
+    def add(self, task: str, seconds: float):
+        with self._lock:
+            self._samples.setdefault(task, deque(maxlen=self.window)).append(seconds)
+
+    def percentile(self, task: str, pct: float, min_samples: int) -> float | None:
+        """Latency at the given percentile, or None until enough samples exist."""
+        with self._lock:
+            samples = sorted(self._samples.get(task, ()))
+        if len(samples) < min_samples:
+            return None
+        index = min(len(samples) - 1, int(round(pct / 100 * (len(samples) - 1))))
+        return samples[index]
+
+
+class HedgeBudget:
+    """Allows a hedge only while hedges stay under a fraction of all calls."""
+
+    def __init__(self, fraction: float):
+        self.fraction = fraction
+        self.calls = 0
+        self.hedges = 0
+        self._lock = threading.Lock()
+
+    def count_call(self):
+        with self._lock:
+            self.calls += 1
+
+    def try_acquire(self) -> bool:
+        with self._lock:
+            if self.hedges + 1 > self.fraction * self.calls:
+                return False
+            self.hedges += 1
+            return True
+
+
+class Attempt:
+    """One in-flight request: signals its first token and can be cancelled."""
+
+    def __init__(self, model: str, started: float | None = None):
+        self.model = model
+        # first_token_at counts from here; a hedge shares its request's start
+        self.started = time.monotonic() if started is None else started
+        self.first_token = threading.Event()
+        self.first_token_at: float | None = None
+        self.cancelled = threading.Event()
+        self._on_cancel: list[Callable[[], None]] = []
+
+    def mark_first_token(self):
+        if not self.first_token.is_set():
+            self.first_token_at = time.monotonic() - self.started
+            self.first_token.set()
+
+    def on_cancel(self, callback: Callable[[], None]):
+        """Register a callback (e.g. closing the HTTP stream) run on cancel."""
+        self._on_cancel.append(callback)
+        if self.cancelled.is_set():
+            callback()
+
+    def cancel(self):
+        self.cancelled.set()
+        for callback in self._on_cancel:
+            try:
+                callback()
+            except Exception:  # the loser may already be closing
+                pass
+
+
+def run_hedged(
+    call: Callable[[Attempt], object],
+    primary_model: str,
+    hedge_model: str,
+    delay: float | None,
+    budget: HedgeBudget,
+) -> tuple[object, Attempt, bool]:
+    """
+    Run call(attempt) on the primary model, hedging after delay seconds
+    without a first token. Returns (result, winning_attempt, hedged).
+    """
+    budget.count_call()
+    primary = Attempt(primary_model)
+    futures: dict[Future, Attempt] = {_executor.submit(call, primary): primary}
+
+    hedged = False
+    if delay is not None:
+        done, _ = wait(futures, timeout=delay, return_when=FIRST_COMPLETED)
+        if not done and not primary.first_token.is_set() and budget.try_acquire():
+            # Time-to-first-token is what the caller waited, so it counts from
+            # the request's start, not the hedge's (else the p95 drifts down)
+            hedge = Attempt(hedge_model, started=primary.started)
+            futures[_executor.submit(call, hedge)] = hedge
+            hedged = True
+
+    pending = set(futures)
+    error: BaseException | None = None
+    while pending:
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            if future.exception() is None:
+                winner = futures[future]
+                for loser in pending:
+                    futures[loser].cancel()
+                return future.result(), winner, hedged
+            error = error or future.exception()
+    raise error
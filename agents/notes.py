@@ -0,0 +1,70 @@
+"""
+Notes Parser
+
+Reads the notes.md template created by `publish.py new` into its parts:
+topic, POV, key points, KB topics and pinned file references.
+"""
+
+from dataclasses import dataclass, field
+
+from .sections import split_sections
+
+
+@dataclass
+class Notes:
+    """Structured view of a notes.md file."""
+
+    title: str = ""
+    topic: str = ""
+    pov: str = ""
+    key_points: list[str] = field(default_factory=list)
+    kb_topics: list[str] = field(default_factory=list)
+    pinned_refs: list[str] = field(default_factory=list)
+    research_direction: str = ""
+
+
+def _bullets(lines: list[str]) -> list[str]:
+    """Non-empty `- ` / `* ` bullet items; indented continuation lines are joined on."""
+    items: list[str] = []
+    for line in lines:
+        stripped = line.strip()
+        if stripped.startswith(("- ", "* ")) or stripped in ("-", "*"):
+            items.append(stripped[1:].strip())
+        elif stripped and items and line.startswith((" ", "\t")):
+            items[-1] = f"{items[-1]} {stripped}".strip()
+    return [item for item in items if item]
+
+
+def _prose(body: str) -> str:
+    """Section text minus the template's guiding question lines."""
+    lines = [line for line in body.strip().split("\n") if not line.rstrip().endswith("?")]
+    return "\n".join(lines).strip()
+
+
+def parse_notes(content: str) -> Notes:
+    """Parse notes.md content following the `publish.py new` template."""
+    notes = Notes()
+    for section in split_sections(content):
+        key = section.key
+        lines = section.body.split("\n")
+
+        if not section.heading:
+            titles = [line for line in lines if line.startswith("# ")]
+            notes.title = titles[0][2:].strip() if titles else ""
+        elif key == "topic":
+            notes.topic = _prose(section.body)
+        elif key.startswith("pov"):
+            notes.pov = _prose(section.body)
+        elif key == "key points":
+            notes.key_points = _bullets(lines)
+        elif key == "knowledge base & references":
+            # Two bullet lists: KB search topics, then pinned file references
+            pinned_at = next(
+                (i for i, line in enumerate(lines) if line.lower().startswith("optional pinned")),
+                len(lines),
+            )
+            notes.kb_topics = _bullets(lines[:pinned_at])
+            notes.pinned_refs = _bullets(lines[pinned_at:])
+        elif key == "initial research direction":
+            notes.research_direction = _prose(section.body)
+    return notes
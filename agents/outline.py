@@ -4,11 +4,10 @@ Outline Agent - Phase 1
 Structures argument with citations, concepts, and image suggestions.
 """
 
-import os
-from anthropic import Anthropic
+from .base import BaseAgent
 
 
-class OutlineAgent:
+class OutlineAgent(BaseAgent):
  """
  Outline agent that:
  1. Structures argument based on POV
@@ -18,10 +17,6 @@ class OutlineAgent:
  5. Offers alternative perspectives
  """
 
- def __init__(self):
- self.client = Anthropic(api_key=os.getenv("ANTHROPIC_API_KEY"))
- self.model = os.getenv("CLAUDE_MODEL", "claude-3-5-sonnet-20241022")
-
  def generate_outline(self, notes_content: str, research_content: str) -> str:
  """
  Generate outline from notes and research.
@@ -125,15 +120,11 @@ Output Format:
 - [Specific examples to include]
 """
 
- # Call Claude API
- response = self.client.messages.create(
- model=self.model,
- max_tokens=4000,
- system=system_prompt,
- messages=[
- {
- "role": "user",
- "content": f"""Create an outline based on these inputs:
+ # Call Claude API (routed via settings.model_routes["outline"])
+ return self._complete(
+ "outline",
+ system_prompt,
+ f"""Create an outline based on these inputs:
 
 # Original Notes
 {notes_content}
@@ -141,9 +132,5 @@ Output Format:
 # Research Findings
 {research_content}
 
-Please create a comprehensive outline that structures the argument effectively."""
- }
- ]
+Please create a comprehensive outline that structures the argument effectively.""",
  )
-
- return response.content[0].text
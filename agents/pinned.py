@@ -0,0 +1,146 @@
+"""
+Pinned References
+
+Resolves the "Optional pinned file references" listed in notes.md and reads
+them directly, bypassing the KB. A reference may point at a whole file or
+at one section via an anchor (`docs/guide.md#heading`). Files are scanned
+through mmap so only the referenced section is decoded; extracted text is
+cached on disk keyed by path + mtime, and the combined result is trimmed to
+a token budget.
+"""
+
+import hashlib
+import mmap
+import re
+from dataclasses import dataclass
+from pathlib import Path
+
+# Rough chars-per-token ratio for budgeting (no tokenizer dependency)
+CHARS_PER_TOKEN = 4
+
+_HEADING = re.compile(rb"^(#{1,6})[ \t]+(.+?)[ \t#]*$", re.MULTILINE)
+_MD_LINK = re.compile(r"\[[^\]]*\]\(([^)]+)\)")
+_REPO_REF = re.compile(r"repo:(?:[\w.-]+/)?([\w.-]+)\s+path:(\S+)")
+
+
+@dataclass
+class PinnedRef:
+    """One pinned reference: file path plus optional heading anchor."""
+
+    path: Path
+    anchor: str | None = None
+
+    @property
+    def label(self) -> str:
+        return f"{self.path}#{self.anchor}" if self.anchor else str(self.path)
+
+
+def slugify(heading: str) -> str:
+    """GitHub-style anchor slug: 'Edit Capture (v2)' → 'edit-capture-v2'."""
+    slug = re.sub(r"[^\w\s-]", "", heading.strip().lower())
+    return re.sub(r"\s+", "-", slug)
+
+
+def parse_ref(entry: str, search_dirs: list[Path]) -> PinnedRef | None:
+    """Parse a notes bullet into a PinnedRef, resolving it against search_dirs."""
+    entry = entry.strip().strip("`")
+    if not entry:
+        return None
+
+    link = _MD_LINK.search(entry)
+    repo_ref = _REPO_REF.search(entry)
+    if link:
+        entry = link.group(1)
+    elif repo_ref:
+        # `repo:owner/name path:docs/x.md` → look for a local checkout named `name`
+        name, rel = repo_ref.groups()
+        search_dirs = [d for d in search_dirs if d.name == name] or search_dirs
+        entry = rel
+
+    raw_path, _, anchor = entry.partition("#")
+    candidates = [Path(raw_path).expanduser()]
+    candidates += [d / raw_path for d in search_dirs]
+    for candidate in candidates:
+        if candidate.is_file():
+            return PinnedRef(candidate, anchor or None)
+    return None
+
+
+def _section_span(mm: mmap.mmap, anchor: str) -> tuple[int, int] | None:
+    """Byte span of the anchored heading through the next heading at its level or above."""
+    target = slugify(anchor)
+    headings = _HEADING.finditer(mm)
+    for match in headings:
+        if slugify(match.group(2).decode("utf-8", errors="ignore")) != target:
+            continue
+        level = len(match.group(1))
+        for following in headings:
+            if len(following.group(1)) <= level:
+                return match.start(), following.start()
+        return match.start(), len(mm)
+    return None
+
+
+def extract_section(path: Path, anchor: str | None) -> str:
+    """Read the whole file, or just the section under the anchored heading."""
+    if path.stat().st_size == 0:
+        return ""
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        span = (0, len(mm)) if anchor is None else _section_span(mm, anchor)
+        return mm[span[0]:span[1]].decode("utf-8", errors="ignore") if span else ""
+
+
+class PinnedLoader:
+    """Loads pinned references with an on-disk cache keyed by path + mtime."""
+
+    def __init__(self, cache_dir: Path, search_dirs: list[Path] | None = None):
+        self.cache_dir = Path(cache_dir) / "pinned"
+        self.search_dirs = search_dirs or []
+
+    def _cache_path(self, ref: PinnedRef) -> Path:
+        stat = ref.path.stat()
+        key = f"{ref.path.resolve()}#{ref.anchor}:{stat.st_mtime_ns}:{stat.st_size}"
+        return self.cache_dir / f"{hashlib.sha1(key.encode()).hexdigest()}.md"
+
+    def read(self, ref: PinnedRef) -> str:
+        cache_path = self._cache_path(ref)
+        if cache_path.exists():
+            return cache_path.read_text()
+        text = extract_section(ref.path, ref.anchor)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        cache_path.write_text(text)
+        return text
+
+    def load(self, entries: list[str], token_budget: int) -> str:
+        """
+        Resolve, read and budget pinned references into one Markdown block.
+
+        The budget is shared evenly; room left by short references is passed
+        on to the ones after them. Unresolvable entries are listed, not fatal.
+        """
+        refs, missing = [], []
+        for entry in entries:
+            ref = parse_ref(entry, self.search_dirs)
+            if ref:
+                refs.append(ref)
+            else:
+                missing.append(entry)
+
+        blocks = []
+        remaining = token_budget * CHARS_PER_TOKEN
+        for i, ref in enumerate(refs):
+            share = remaining // (len(refs) - i)
+            text = self.read(ref).strip()
+            if not text:
+                missing.append(f"{ref.label} (section not found)")
+                continue
+            if len(text) > share:
+                cut = text.rfind("\n\n", 0, share)
+                text = text[: cut if cut > share // 2 else share].rstrip() + "\n\n[... truncated]"
+            remaining -= len(text)
+            blocks.append(f"## {ref.label}\n\n{text}")
+
+        if missing:
+            listing = "\n".join(f"- {m}" for m in missing)
+            blocks.append(f"## Unresolved pinned references\n{listing}")
+        return "\n\n".join(blocks)
@@ -4,12 +4,17 @@ Research Agent - Phase 1
 Understands POV, finds supporting/refuting evidence from 1P repos and 3P sources.
 """
 
-import os
-from anthropic import Anthropic
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+from .base import BaseAgent
+from .findings import merge_findings
+from .notes import parse_notes
+from .pinned import PinnedLoader
+from .retrieval import get_index
 
-class ResearchAgent:
+
+class ResearchAgent(BaseAgent):
  """
  Research agent that:
  1. Understands the POV/point being made
@@ -19,10 +24,6 @@ class ResearchAgent:
  5. Extracts key concepts and entities
  """
 
- def __init__(self):
- self.client = Anthropic(api_key=os.getenv("ANTHROPIC_API_KEY"))
- self.model = os.getenv("CLAUDE_MODEL", "claude-3-5-sonnet-20241022")
-
  def research(self, notes_content: str) -> str:
  """
  Execute research phase based on notes.
@@ -95,38 +96,55 @@ Output Format:
 - Questions to address
 """
 
- # Call Claude API
- response = self.client.messages.create(
- model=self.model,
- max_tokens=4000,
- system=system_prompt,
- messages=[
- {
- "role": "user",
- "content": f"Here are the notes for the blog post:\n\n{notes_content}\n\nPlease conduct research based on these notes."
- }
- ]
+ # Inline pinned file references (read directly, bypassing KB)
+ notes = parse_notes(notes_content)
+ pinned = self.load_pinned(notes.pinned_refs, self.settings.pinned_token_budget)
+ if pinned:
+ notes_content += f"\n\n# Pinned References\n\n{pinned}"
+
+ # Call Claude API (routed via settings.model_routes["research"])
+ return self._complete(
+ "research",
+ system_prompt,
+ f"Here are the notes for the blog post:\n\n{notes_content}\n\n"
+ "Please conduct research based on these notes.",
  )
 
- return response.content[0].text
+ def load_pinned(self, entries: list[str], token_budget: int) -> str:
+ """
+ Read pinned references (`path.md` or `path.md#heading`) within a token budget.
+
+ Args:
+ entries: Pinned reference bullets from notes.md
+ token_budget: Approximate token cap for all pinned content
 
- def search_repos(self, repo_paths: list[str], query: str) -> list[dict]:
+ Returns:
+ Pinned sections as markdown (empty if none)
+ """
+ if not entries:
+ return ""
+ loader = PinnedLoader(self.settings.cache_dir, [Path(p) for p in self.settings.local_repos])
+ return loader.load(entries, token_budget)
+
+ def search_repos(
+ self, repo_paths: list[str], query: str, limit: int = 5, refresh: bool = True
+ ) -> list[dict]:
  """
  Search local repos for relevant content.
 
- This is a placeholder for Phase 1 - manual lookup is expected.
- Phase 2 will implement actual repo searching with RAG.
+ Keyword (BM25) search over Markdown chunks; the index is built once per
+ process and refreshed by mtime. Phase 2 will add vector search via the KB.
 
  Args:
  repo_paths: List of repo directories to search
  query: Search query
+ limit: Maximum number of snippets
+ refresh: Re-check the repos for changed files first
 
  Returns:
- List of relevant documents/snippets
+ List of {path, heading, snippet, score} dicts
  """
- # Phase 1: Return empty - expect manual references in notes
- # Phase 2: Implement with grep/ripgrep + vector search
- return []
+ return get_index(repo_paths).search(query, limit, refresh)
 
  def find_external_sources(self, topic: str, keywords: list[str]) -> list[dict]:
  """
@@ -145,3 +163,92 @@ Output Format:
  # Phase 1: Return empty - agent makes suggestions in research.md
  # Phase 2: Implement with web search API
  return []
+
+    def research_fanout(self, notes_content: str, max_workers: int = 4) -> str:
+        """
+        Map-reduce research: one focused call per key point, run concurrently,
+        each with its own retrieved 1P context, then a local merge step.
+
+        Falls back to single-call research when the notes have no key points.
+
+        Args:
+            notes_content: Content from notes.md
+            max_workers: Concurrent sub-research calls
+
+        Returns:
+            Research findings as markdown
+        """
+        notes = parse_notes(notes_content)
+        if not notes.key_points:
+            return self.research(notes_content)
+
+        # Pinned references are shared by every point, so split the budget between them
+        pinned = self.load_pinned(
+            notes.pinned_refs, self.settings.pinned_token_budget // len(notes.key_points)
+        )
+
+        # One staleness walk over the repos for the whole fan-out, not one per point
+        get_index(self.settings.local_repos).refresh()
+
+        def research_point(point: str) -> str:
+            query = " ".join([point, *notes.kb_topics])
+            context = self.search_repos(self.settings.local_repos, query, refresh=False)
+            return self._research_point(notes, point, context, pinned)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            findings = list(pool.map(research_point, notes.key_points))
+
+        return merge_findings(
+            notes.topic or notes.title, notes.pov, list(zip(notes.key_points, findings))
+        )
+
+    def _research_point(self, notes, point: str, context: list[dict], pinned: str = "") -> str:
+        """Research a single key point against its retrieved 1P snippets."""
+        system_prompt = """You are a research agent investigating ONE key point of a blog post.
+
+Stay focused on the key point. Use the 1P snippets provided (cite their file paths)
+and suggest external sources worth citing, prioritizing industry bloggers and
+thought leaders over major corp blogs.
+
+Output exactly these sections (omit a section only if it would be empty):
+
+## Supporting Evidence (1P)
+### [Source/Repo Name]
+- **Location**: [file path]
+- **Relevance**: [why this supports the point]
+- **Key Quote/Data**: [extract]
+
+## Refuting Evidence / Counterarguments
+[Balance the perspective]
+
+## Recommended 3P Citations
+### [Source Name]
+- **Type**: [Industry blogger / Research paper / Case study]
+- **Why Cite**: [Traffic value / Networking / Authority]
+- **Key Point**: [what to reference]
+- **Link**: [URL if known]
+
+## Key Concepts
+- {{concept-name}}: [definition and relevance]
+
+## Entities to Link
+- [Entity name]: [context]
+
+## Research Quality Notes
+- [Gaps, additional sources needed, open questions]
+"""
+
+        snippets = "\n\n".join(
+            f"### {c['path']} — {c['heading']}\n{c['snippet']}" for c in context
+        ) or "(no 1P matches found)"
+
+        return self._complete(
+            "research_point",
+            system_prompt,
+            f"# Post Topic\n{notes.topic or notes.title}\n\n"
+            f"# POV\n{notes.pov}\n\n"
+            f"# Key Point\n{point}\n\n"
+            f"# Research Direction\n{notes.research_direction}\n\n"
+            f"# Retrieved 1P Context\n{snippets}"
+            + (f"\n\n# Pinned References\n\n{pinned}" if pinned else ""),
+        )
@@ -0,0 +1,164 @@
+"""
+Local Repo Retrieval
+
+Keyword index over Markdown files in the local 1P repos (settings.local_repos).
+Chunks are scored with BM25; the index refreshes only files whose mtime
+changed, so a warm process (e.g. the publisher daemon) pays the build once.
+Refreshing still walks and stats every repo file, so a fan-out of queries
+refreshes once up front and searches with refresh=False.
+"""
+
+import math
+import re
+import threading
+from collections import Counter
+from dataclasses import dataclass
+from pathlib import Path
+
+_TOKEN = re.compile(r"[a-z0-9][a-z0-9_-]+")
+_STOPWORDS = {
+    "the", "and", "for", "with", "that", "this", "are", "was", "from", "into",
+    "what", "how", "why", "not", "but", "can", "our", "your", "its", "use",
+}
+
+CHUNK_CHARS = 1200
+
+
+def tokenize(text: str) -> list[str]:
+    return [t for t in _TOKEN.findall(text.lower()) if t not in _STOPWORDS]
+
+
+@dataclass
+class Chunk:
+    """A heading-bounded slice of a Markdown file."""
+
+    path: str
+    heading: str
+    text: str
+
+
+def chunk_markdown(path: Path, text: str) -> list[Chunk]:
+    """Split at headings, then cap each piece at roughly CHUNK_CHARS on paragraph breaks."""
+    chunks: list[Chunk] = []
+    heading, buffer = "", []
+
+    def flush():
+        if "".join(buffer).strip():
+            chunks.append(Chunk(str(path), heading, "\n".join(buffer).strip()))
+        buffer.clear()
+
+    for line in text.split("\n"):
+        if line.startswith("#"):
+            flush()
+            heading = line.lstrip("#").strip()
+        elif not line.strip() and sum(len(b) for b in buffer) > CHUNK_CHARS:
+            flush()
+        else:
+            buffer.append(line)
+    flush()
+    return chunks
+
+
+class RepoIndex:
+    """BM25 index over Markdown chunks from a set of repo directories."""
+
+    def __init__(self, repo_paths: list[str]):
+        self.repo_paths = [Path(p).expanduser() for p in repo_paths]
+        self._files: dict[Path, tuple[int, list[int]]] = {}  # path → (mtime, chunk ids)
+        self._chunks: dict[int, Chunk] = {}
+        self._terms: dict[int, Counter] = {}
+        self._lengths: dict[int, int] = {}
+        self._total_length = 0
+        self._postings: dict[str, set[int]] = {}
+        self._next_id = 0
+        self._lock = threading.Lock()
+
+    def refresh(self):
+        """(Re)index new or modified files and drop deleted ones."""
+        with self._lock:
+            self._refresh()
+
+    def _refresh(self):
+        seen = set()
+        for repo in self.repo_paths:
+            if not repo.is_dir():
+                continue
+            for path in repo.rglob("*.md"):
+                parts = path.relative_to(repo).parts
+                if any(part.startswith(".") or part == "node_modules" for part in parts):
+                    continue
+                seen.add(path)
+                mtime = path.stat().st_mtime_ns
+                if path not in self._files or self._files[path][0] != mtime:
+                    self._remove(path)
+                    self._add(path, mtime)
+        for path in set(self._files) - seen:
+            self._remove(path)
+
+    def _add(self, path: Path, mtime: int):
+        ids = []
+        for chunk in chunk_markdown(path, path.read_text(errors="ignore")):
+            cid = self._next_id
+            self._next_id += 1
+            terms = Counter(tokenize(f"{chunk.heading} {chunk.text}"))
+            self._chunks[cid] = chunk
+            self._terms[cid] = terms
+            self._lengths[cid] = sum(terms.values())
+            self._total_length += self._lengths[cid]
+            for term in terms:
+                self._postings.setdefault(term, set()).add(cid)
+            ids.append(cid)
+        self._files[path] = (mtime, ids)
+
+    def _remove(self, path: Path):
+        _, ids = self._files.pop(path, (0, []))
+        for cid in ids:
+            for term in self._terms.pop(cid):
+                self._postings[term].discard(cid)
+            self._total_length -= self._lengths.pop(cid)
+            del self._chunks[cid]
+
+    def search(self, query: str, limit: int = 5, refresh: bool = True) -> list[dict]:
+        """Top chunks for the query as {path, heading, snippet, score} dicts.
+
+        refresh=False skips the staleness walk, for queries right after a refresh().
+        """
+        with self._lock:
+            if refresh:
+                self._refresh()
+            n = len(self._chunks)
+            if not n:
+                return []
+            avg_len = self._total_length / n
+
+            scores: Counter = Counter()
+            for term in set(tokenize(query)):
+                postings = self._postings.get(term, ())
+                if not postings:
+                    continue
+                idf = math.log(1 + (n - len(postings) + 0.5) / (len(postings) + 0.5))
+                for cid in postings:
+                    tf = self._terms[cid][term]
+                    norm = 0.25 + 0.75 * self._lengths[cid] / avg_len
+                    scores[cid] += idf * tf * 2.2 / (tf + 1.2 * norm)
+
+            return [
+                {
+                    "path": self._chunks[cid].path,
+                    "heading": self._chunks[cid].heading,
+                    "snippet": self._chunks[cid].text[:CHUNK_CHARS],
+                    "score": round(score, 3),
+                }
+                for cid, score in scores.most_common(limit)
+            ]
+
+
+_indexes: dict[tuple[str, ...], RepoIndex] = {}
+
+
+def get_index(repo_paths: list[str]) -> RepoIndex:
+    """Process-wide index per repo set (kept warm by the daemon)."""
+    key = tuple(repo_paths)
+    if key not in _indexes:
+        _indexes[key] = RepoIndex(repo_paths)
+    return _indexes[key]
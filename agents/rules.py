@@ -0,0 +1,35 @@
+"""
+Rule Extraction Agent
+
+Turns clusters of flagged edits into candidate style rules. Each call gets
+a compact batch of clusters (a few representative examples each) and returns
+one rule per cluster as JSON; batching, clustering and caching live in
+scripts/extract_rules.py.
+"""
+
+from .base import BaseAgent
+
+SYSTEM_PROMPT = """You are a style-rule extraction agent for an editorial team.
+
+You receive clusters of edits that editors flagged as important. Each cluster
+has an id, its content style, the style-guide rule it was filed under (if any),
+how many edits it contains, and a few representative examples written as
+"original" → "edited" with the editor's reason.
+
+For EACH cluster, write one rule that a writer could follow without seeing the
+examples:
+- statement: one imperative sentence, specific enough to apply ("Use third
+  person in whitepapers"), not a summary of the edits
+- confidence: high (examples agree and the rule is unambiguous), medium, or low
+- scope: "global" if the rule applies to any style, else "style-specific"
+
+Respond with ONLY a JSON array, one object per cluster, in any order:
+[{"cluster": "<id>", "statement": "...", "confidence": "high", "scope": "global"}]"""
+
+
+class RuleExtractionAgent(BaseAgent):
+    """Extracts candidate style rules from batches of flagged-edit clusters."""
+
+    def extract(self, batch: str) -> str:
+        """Run one batch of extract_rules.render_cluster outputs; returns the JSON text."""
+        return self._complete("rule_extraction", SYSTEM_PROMPT, batch)
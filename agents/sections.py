@@ -0,0 +1,126 @@
+"""
+Markdown Sections
+
+Splits posts into `## ` sections and aligns outline sections with the
+matching sections of an existing draft, for section-level re-drafting.
+"""
+
+import re
+from dataclasses import dataclass
+from difflib import SequenceMatcher
+
+# Outline sections that guide the draft but have no counterpart section in it
+OUTLINE_ONLY = {
+    "meta",
+    "concept glossary",
+    "alternative approaches considered",
+    "notes for draft phase",
+}
+
+_ROMAN_PREFIX = re.compile(r"^(?:[ivxlcdm]+|\d+)[.)]\s+", re.IGNORECASE)
+
+
+@dataclass
+class Section:
+    """A `## ` section: heading line (empty for the preamble) and body text."""
+
+    heading: str
+    body: str
+
+    @property
+    def key(self) -> str:
+        return normalize_heading(self.heading)
+
+    @property
+    def text(self) -> str:
+        return f"{self.heading}\n{self.body}" if self.heading else self.body
+
+
+def normalize_heading(heading: str) -> str:
+    """'## II. [Main Section 1]' → 'main section 1'."""
+    title = heading.lstrip("#").strip()
+    title = _ROMAN_PREFIX.sub("", title)
+    title = re.sub(r"[\[\]*_`:]", "", title)
+    return re.sub(r"\s+", " ", title).strip().lower()
+
+
+def split_sections(markdown: str) -> list[Section]:
+    """Split on level-2 headings, ignoring headings inside fenced code blocks."""
+    sections = [Section("", "")]
+    body: list[str] = []
+    in_fence = False
+
+    for line in markdown.split("\n"):
+        if line.lstrip().startswith("```"):
+            in_fence = not in_fence
+        if not in_fence and line.startswith("## "):
+            sections[-1].body = "\n".join(body)
+            sections.append(Section(line, ""))
+            body = []
+        else:
+            body.append(line)
+    sections[-1].body = "\n".join(body)
+
+    if not sections[0].body.strip() and len(sections) > 1:
+        sections.pop(0)
+    return sections
+
+
+def join_sections(sections: list[Section]) -> str:
+    return "\n".join(s.text for s in sections)
+
+
+def changed_sections(outline: list[Section], previous: list[Section]) -> set[str]:
+    """Keys of outline sections whose text differs from the previous outline."""
+    before = {s.key: s.body.strip() for s in previous}
+    return {s.key for s in outline if before.get(s.key) != s.body.strip()}
+
+
+def align_sections(outline: list[Section], draft: list[Section]) -> dict[int, int]:
+    """
+    Map outline section index → draft section index.
+
+    Headings are matched in order on their normalized text; sections left
+    unmatched between two anchors are paired by position when both gaps are
+    the same size, otherwise by heading similarity.
+    """
+    outline_idx = [i for i, s in enumerate(outline) if s.key not in OUTLINE_ONLY]
+    outline_keys = [outline[i].key for i in outline_idx]
+    draft_keys = [s.key for s in draft]
+
+    mapping: dict[int, int] = {}
+    matcher = SequenceMatcher(None, outline_keys, draft_keys, autojunk=False)
+    for tag, o1, o2, d1, d2 in matcher.get_opcodes():
+        if tag == "equal" or (tag == "replace" and o2 - o1 == d2 - d1):
+            for k in range(o2 - o1):
+                mapping[outline_idx[o1 + k]] = d1 + k
+        elif tag == "replace":
+            used = set()
+            for k in range(o1, o2):
+                best, best_ratio = None, 0.6
+                for d in range(d1, d2):
+                    ratio = SequenceMatcher(None, outline_keys[k], draft_keys[d]).ratio()
+                    if d not in used and ratio > best_ratio:
+                        best, best_ratio = d, ratio
+                if best is not None:
+                    mapping[outline_idx[k]] = best
+                    used.add(best)
+    return mapping
+
+
+def deleted_sections(
+    outline: list[Section], previous: list[Section], draft: list[Section]
+) -> list[int]:
+    """
+    Draft section indexes whose outline section was deleted since `previous`.
+
+    Only draft sections drafted from a previous outline section count; sections
+    added by hand, or taken over by a renamed outline section, are kept.
+    """
+    keys = {s.key for s in outline}
+    kept = set(align_sections(outline, draft).values())
+    return sorted(
+        d
+        for p, d in align_sections(previous, draft).items()
+        if previous[p].key not in keys and d not in kept
+    )
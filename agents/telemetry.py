@@ -0,0 +1,63 @@
+"""
+Agent Telemetry
+
+Per-call records of which model served each agent task, how long it took,
+token usage, and whether the overload fallback or a hedged duplicate served it.
+"""
+
+import json
+import threading
+from collections import deque
+from dataclasses import asdict, dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+
+
+@dataclass
+class CallRecord:
+    """One completed agent call."""
+
+    task: str
+    model: str
+    routed_model: str
+    latency_s: float
+    input_tokens: int = 0
+    output_tokens: int = 0
+    fallback: bool = False
+    hedged: bool = False
+    timestamp: str = field(default_factory=lambda: datetime.now(UTC).isoformat())
+
+
+class Telemetry:
+    """Keeps recent call records in memory and optionally appends them to a JSONL log."""
+
+    def __init__(self, log_path: Path | None = None, maxlen: int = 1000):
+        self.log_path = log_path
+        self.records: deque[CallRecord] = deque(maxlen=maxlen)
+        self._lock = threading.Lock()
+
+    def record(self, record: CallRecord):
+        with self._lock:
+            self.records.append(record)
+            if self.log_path:
+                with open(self.log_path, "a") as f:
+                    f.write(json.dumps(asdict(record)) + "\n")
+
+    def summary(self) -> dict:
+        """Call counts, fallbacks, hedges and mean latency per task."""
+        with self._lock:
+            records = list(self.records)
+
+        tasks = {}
+        for r in records:
+            t = tasks.setdefault(
+                r.task, {"calls": 0, "fallbacks": 0, "hedges": 0, "latency_s": 0.0}
+            )
+            t["calls"] += 1
+            t["fallbacks"] += int(r.fallback)
+            t["hedges"] += int(r.hedged)
+            t["latency_s"] += r.latency_s
+        for t in tasks.values():
+            t["latency_s"] = round(t["latency_s"] / t["calls"], 2)
+        return tasks
+
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Benchmark sentence-context lookup in edit capture.
+
+Builds synthetic documents of increasing size with one edit every 20 lines
+and times (a) the previous per-edit rescan, (b) a SentenceIndex built once
+per document, and (c) the full extract_edits capture path.
+
+Usage:
+    python benchmarks/bench_capture_edits.py [--sizes 1000,2500,5000,10000]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from scripts.sentence_index import SentenceIndex, split_into_sentences  # noqa: E402
+
+EDIT_EVERY = 20
+ROW = "{:>7} {:>6} {:>10} {:>9} {:>10} {:>8}"
+
+
+def make_document(n_lines: int) -> tuple[str, str]:
+    """Original and edited documents with a one-word change every EDIT_EVERY lines."""
+    original, edited = [], []
+    for i in range(n_lines):
+        if i % 50 == 0:
+            line = f"## Section {i // 50}"
+        else:
+            line = f"Sentence {i} explains the pipeline in detail. It also covers case {i}."
+        original.append(line)
+        edited.append(line.replace("explains", "describes") if i % EDIT_EVERY == 1 else line)
+    return "\n".join(original), "\n".join(edited)
+
+
+def legacy_context(lines: list[str], line_number: int) -> dict:
+    """The per-edit rescan used before SentenceIndex (reference for comparison)."""
+    full_text = "\n".join(lines)
+    char_pos = sum(len(lines[i]) + 1 for i in range(line_number - 1))
+    sentences = split_into_sentences(full_text)
+    current_pos, target = 0, 0
+    for i, sentence in enumerate(sentences):
+        start = full_text.find(sentence, current_pos)
+        end = start + len(sentence)
+        if start <= char_pos <= end:
+            target = i
+            break
+        current_pos = end
+    return {
+        "sentence_before": sentences[target - 1] if target > 0 else "",
+        "full_sentence": sentences[target] if target < len(sentences) else "",
+    }
+
+
+def timed(fn) -> float:
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--sizes", default="1000,2500,5000,10000")
+    parser.add_argument("--skip-legacy-above", type=int, default=5000,
+                        help="Skip the quadratic baseline for larger documents")
+    args = parser.parse_args()
+
+    try:
+        from scripts.capture_edits import extract_edits
+    except (ImportError, SyntaxError):
+        extract_edits = None
+
+    print(ROW.format("lines", "edits", "legacy s", "index s", "capture s", "us/line"))
+    for size in (int(s) for s in args.sizes.split(",")):
+        original, edited = make_document(size)
+        lines = original.split("\n")
+        edit_lines = [i + 1 for i in range(size) if i % EDIT_EVERY == 1]
+
+        legacy = "-"
+        if size <= args.skip_legacy_above:
+            legacy = f"{timed(lambda: [legacy_context(lines, n) for n in edit_lines]):.3f}"
+
+        def with_index():
+            index = SentenceIndex(lines)
+            for n in edit_lines:
+                index.context(n)
+
+        index_s = timed(with_index)
+
+        capture = "-"
+        if extract_edits:
+            capture_s = timed(lambda: extract_edits(original, edited))
+            capture = f"{capture_s:.3f}"
+
+        per_line = (capture_s if extract_edits else index_s) / size * 1e6
+        index = f"{index_s:.4f}"
+        print(ROW.format(size, len(edit_lines), legacy, index, capture, f"{per_line:.2f}"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Benchmark corpus serialization (scripts/edit_io.py).
+
+Builds a synthetic corpus of N edits and times, against the pure-Python
+yaml.safe_load / yaml.dump baseline: loading, writing (with peak traced
+memory), and counting flagged edits without loading the document.
+
+Usage:
+    python benchmarks/bench_edit_io.py [--edits 50000]
+"""
+
+import argparse
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+import yaml
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from scripts.edit_io import count_yaml_edits, load_yaml, write_document  # noqa: E402
+
+ROW = "{:<22} {:>10} {:>10} {:>8}"
+
+
+def make_corpus(n_edits: int) -> dict:
+    rng = random.Random(0)
+    edits = []
+    for i in range(n_edits):
+        edits.append({
+            "id": f"edit-{i + 1:03d}",
+            "original": f"The pipeline utilizes stage {i} to process inputs.",
+            "edited": f"The pipeline uses stage {i} to process inputs.",
+            "sentence_before": f"Section {i // 40} introduces the pipeline.",
+            "full_sentence_original": f"The pipeline utilizes stage {i} to process inputs.",
+            "full_sentence_edited": f"The pipeline uses stage {i} to process inputs.",
+            "line_number": i * 3 + 1,
+            "change_type": "replace",
+            "original_span": [i * 90, i * 90 + 8],
+            "edited_span": [i * 86, i * 86 + 4],
+            "reason": "Plain language" if rng.random() < 0.5 else None,
+            "rule_applied": "blog.md#plain-words" if rng.random() < 0.3 else None,
+            "editor_type": rng.choice(["human", "agent"]),
+            "style": "blog",
+            "flagged": rng.random() < 0.2,
+            "timestamp": None,
+        })
+    return {
+        "source_file": "posts/bench/final.md",
+        "ai_draft_commit": "abc1234",
+        "captured_at": "2026-01-01T00:00:00+00:00",
+        "editor_type": "human",
+        "style": "blog",
+        "session_reason": None,
+        "edits": edits,
+    }
+
+
+def timed(fn) -> tuple[float, object]:
+    start = time.perf_counter()
+    result = fn()
+    return time.perf_counter() - start, result
+
+
+def peak_mib(fn) -> float:
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak / 2**20
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--edits", type=int, default=50_000)
+    args = parser.parse_args()
+
+    corpus = make_corpus(args.edits)
+    with tempfile.TemporaryDirectory() as tmp:
+        baseline_path = Path(tmp) / "baseline.yaml"
+        streamed_path = Path(tmp) / "streamed.yaml"
+
+        def dump_baseline():
+            with open(baseline_path, "w") as f:
+                yaml.dump(corpus, f, default_flow_style=False, sort_keys=False,
+                          allow_unicode=True)
+
+        print(f"{args.edits} edits, libyaml: {yaml.__with_libyaml__}\n")
+        print(ROW.format("operation", "baseline", "edit_io", "speedup"))
+
+        t_base, _ = timed(dump_baseline)
+        t_new, _ = timed(lambda: write_document(streamed_path, corpus))
+        assert baseline_path.read_text() == streamed_path.read_text()
+        print(ROW.format("write", f"{t_base:.2f}s", f"{t_new:.2f}s", f"{t_base / t_new:.1f}x"))
+
+        m_base = peak_mib(dump_baseline)
+        m_new = peak_mib(lambda: write_document(streamed_path, corpus))
+        print(ROW.format("write peak memory", f"{m_base:.1f}MiB", f"{m_new:.1f}MiB", ""))
+
+        t_base, loaded = timed(lambda: yaml.safe_load(baseline_path.read_text()))
+        t_new, _ = timed(lambda: load_yaml(streamed_path))
+        print(ROW.format("load", f"{t_base:.2f}s", f"{t_new:.2f}s", f"{t_base / t_new:.1f}x"))
+
+        expected = sum(1 for e in loaded["edits"] if e.get("flagged"))
+        t_new, (count, flagged) = timed(lambda: count_yaml_edits(streamed_path))
+        assert (count, flagged) == (args.edits, expected)
+        print(ROW.format("flagged count", f"{t_base:.2f}s", f"{t_new:.2f}s",
+                         f"{t_base / t_new:.1f}x"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Benchmark the in-process text diff used by edit capture.
+
+Builds synthetic documents of increasing size in which every tenth paragraph
+is rewritten wholesale and every tenth (offset by five) has a one-word edit,
+then times diff_texts against difflib's line-level SequenceMatcher.
+
+Usage:
+    python benchmarks/bench_text_diff.py [--sizes 500,2000,5000]
+"""
+
+import argparse
+import difflib
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from scripts.text_diff import diff_texts  # noqa: E402
+
+WORDS = "agent corpus draft edit human pipeline rule style voice outline".split()
+ROW = "{:>7} {:>8} {:>7} {:>10} {:>10}"
+
+
+def paragraph(rng: random.Random, n: int) -> str:
+    return " ".join(
+        f"Point {n}-{k} " + " ".join(rng.choice(WORDS) for _ in range(10)) + "."
+        for k in range(5)
+    )
+
+
+def make_documents(n_paragraphs: int) -> tuple[str, str]:
+    rng = random.Random(n_paragraphs)
+    original = [paragraph(rng, i) for i in range(n_paragraphs)]
+    edited = list(original)
+    for i in range(0, n_paragraphs, 10):
+        edited[i] = paragraph(rng, n_paragraphs + i)
+    for i in range(5, n_paragraphs, 10):
+        edited[i] = edited[i].replace("Point", "Claim", 1)
+    return "\n\n".join(original), "\n\n".join(edited)
+
+
+def timed(fn) -> tuple[float, object]:
+    start = time.perf_counter()
+    result = fn()
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--sizes", default="500,2000,5000")
+    parser.add_argument("--skip-difflib-above", type=int, default=1000,
+                        help="Skip the (quadratic on this input) difflib baseline for larger sizes")
+    args = parser.parse_args()
+
+    print(ROW.format("paras", "kB", "edits", "diff s", "difflib s"))
+    for size in (int(s) for s in args.sizes.split(",")):
+        original, edited = make_documents(size)
+        diff_s, edits = timed(lambda: diff_texts(original, edited))
+        baseline = "-"
+        if size <= args.skip_difflib_above:
+            difflib_s, _ = timed(lambda: difflib.SequenceMatcher(
+                None, original.split("\n"), edited.split("\n"), autojunk=False
+            ).get_opcodes())
+            baseline = f"{difflib_s:.3f}"
+        kb = len(original) // 1024
+        print(ROW.format(size, kb, len(edits), f"{diff_s:.3f}", baseline))
+
+
+if __name__ == "__main__":
+    main()
@@ -3,10 +3,33 @@ Phase 1 Configuration
 Minimal settings for manual-first blog publishing workflow
 """
 
+from functools import cache
 from pathlib import Path
+
+from pydantic import BaseModel, Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
+class ModelRoute(BaseModel):
+    """Model and token profile for one agent task (model=None uses claude_model)"""
+
+    model: str | None = None
+    max_tokens: int = 4000
+
+
+# Per-task model routing: cheap extraction work off the flagship model
+DEFAULT_MODEL_ROUTES = {
+    "research": ModelRoute(max_tokens=4000),
+    "research_point": ModelRoute(max_tokens=2000),
+    "outline": ModelRoute(max_tokens=4000),
+    "draft": ModelRoute(max_tokens=8000),
+    "draft_section": ModelRoute(max_tokens=3000),
+    "linkedin": ModelRoute(model="claude-3-5-haiku-20241022", max_tokens=4000),
+    "frontmatter": ModelRoute(model="claude-3-5-haiku-20241022", max_tokens=2000),
+    "rule_extraction": ModelRoute(model="claude-3-5-haiku-20241022", max_tokens=4000),
+}
+
+
 class Settings(BaseSettings):
  """Phase 1 Settings - minimal configuration"""
 
@@ -14,10 +37,32 @@ class Settings(BaseSettings):
  anthropic_api_key: str
  claude_model: str = "claude-3-5-sonnet-20241022"
 
+ # Per-task model routing (DEFAULT_MODEL_ROUTES). Routes given via
+ # MODEL_ROUTES='{"draft": {"model": "...", "max_tokens": 8000}}' replace
+ # only the tasks they name; the other tasks keep their defaults.
+ model_routes: dict[str, ModelRoute] = Field(default_factory=lambda: dict(DEFAULT_MODEL_ROUTES))
+ # Model that takes over when the routed model is overloaded (None disables)
+ fallback_model: str | None = None
+
+ # Hedged requests (opt-in per task, e.g. ["outline", "linkedin", "frontmatter"]):
+ # fire a duplicate when no first token arrives within the latency percentile
+ hedge_tasks: list[str] = []
+ hedge_percentile: float = 95.0
+ hedge_min_samples: int = 20
+ hedge_budget: float = 0.05 # max fraction of calls that may be hedged
+ hedge_model: str | None = None # None hedges on the routed model
+
+ # Telemetry: per-call model/latency/token records (JSONL, None disables)
+ telemetry_log: Path | None = None
+
  # Paths
  content_dir: Path = Path("content")
  posts_dir: Path = Path("posts")
  prompts_dir: Path = Path("prompts")
+ cache_dir: Path = Path(".cache")
+
+ # Approximate token cap for pinned file references inlined into research
+ pinned_token_budget: int = 6000
 
  # Local repos for 1P research (add your repo paths)
  local_repos: list[str] = [
@@ -31,6 +76,20 @@ class Settings(BaseSettings):
  extra="ignore"
  )
 
+ @field_validator("model_routes")
+ @classmethod
+ def merge_default_routes(cls, routes: dict[str, ModelRoute]) -> dict[str, ModelRoute]:
+  return {**DEFAULT_MODEL_ROUTES, **routes}
+
+
+@cache
+def get_settings() -> Settings:
+    """The process-wide Settings, read from the environment on first use."""
+    return Settings()
+
 
-# Global settings instance
-settings = Settings
+def __getattr__(name: str):
+    # `config.settings` stays available, but is only built when first accessed
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,269 @@
+#!/usr/bin/env python3
+"""
+Publisher Daemon - optional long-lived runtime for publish.py
+
+Keeps agents (and their Anthropic clients), style guides and reference posts
+resident in a single process listening on a Unix socket. publish.py commands
+submit jobs as JSON lines and stream progress events back, so interactive
+commands skip SDK imports and client setup.
+
+Usage:
+    python publish.py daemon start [--detach]
+    python publish.py daemon status
+    python publish.py daemon stop
+
+Protocol (one JSON object per line):
+    request:  {"job": "research", "args": {"notes_content": "..."}}
+    events:   {"event": "progress", "message": "..."}
+              {"event": "result", "output": ...}
+              {"event": "error", "message": "..."}
+"""
+
+import json
+import os
+import socket
+import socketserver
+import sys
+import threading
+import time
+from collections.abc import Callable, Iterator
+from pathlib import Path
+
+
+def _default_socket() -> Path:
+    """A socket path only the current user can reach: $XDG_RUNTIME_DIR, else ~/.cache."""
+    if os.getenv("PUBLISHER_SOCKET"):
+        return Path(os.environ["PUBLISHER_SOCKET"])
+    runtime_dir = os.getenv("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return Path(runtime_dir) / "semops-publisher.sock"
+    return Path.home() / ".cache" / "semops-publisher" / "publisher.sock"
+
+
+DEFAULT_SOCKET = _default_socket()
+
+
+class DaemonError(RuntimeError):
+    """Raised when the daemon reports a failed job."""
+
+
+class PublisherRuntime:
+    """
+    Warm state shared by every job:
+    1. One agent instance per stage (each holds its Anthropic client)
+    2. Reference posts cached by path + mtime (the 1P retrieval index
+       in agents.retrieval is likewise process-wide)
+    3. Job dispatch used by both the daemon and the in-process fallback
+    """
+
+    def __init__(self):
+        self._agents = {}
+        self._references = {}
+        self._lock = threading.Lock()
+        self.started_at = time.time()
+        self.jobs_served = 0
+
+    def agent(self, name: str):
+        """Return the cached agent for a stage, constructing it on first use."""
+        with self._lock:
+            if name not in self._agents:
+                if name == "research":
+                    from agents.research import ResearchAgent as agent_cls
+                elif name == "outline":
+                    from agents.outline import OutlineAgent as agent_cls
+                elif name == "draft":
+                    from agents.draft import DraftAgent as agent_cls
+                elif name == "format":
+                    from agents.formatter import FormatterAgent as agent_cls
+                else:
+                    raise ValueError(f"Unknown agent: {name}")
+                self._agents[name] = agent_cls()
+            return self._agents[name]
+
+    def load_references(self, refs_dir: str | Path) -> list[str]:
+        """Load style reference posts, re-reading only files whose mtime changed."""
+        refs_dir = Path(refs_dir)
+        if not refs_dir.exists():
+            return []
+
+        refs = []
+        with self._lock:
+            for ref_file in sorted(refs_dir.glob("*.md")):
+                mtime = ref_file.stat().st_mtime_ns
+                cached = self._references.get(ref_file)
+                if cached is None or cached[0] != mtime:
+                    cached = (mtime, ref_file.read_text())
+                    self._references[ref_file] = cached
+                refs.append(cached[1])
+        return refs
+
+    def run(self, job: str, args: dict, emit: Callable[[str], None]):
+        """Execute a job and return its output. Progress goes through emit."""
+        started = time.monotonic()
+
+        if job == "ping":
+            base = sys.modules.get("agents.base")  # only loaded once an agent has run
+            with self._lock:
+                output = {
+                    "pid": os.getpid(),
+                    "uptime": round(time.time() - self.started_at, 1),
+                    "jobs_served": self.jobs_served,
+                    "agents": sorted(self._agents),
+                    "references": len(self._references),
+                }
+            output["telemetry"] = base.telemetry.summary() if base else {}
+        elif job == "research":
+            emit("Researching...")
+            output = self.agent("research").research(args["notes_content"])
+        elif job == "research_fanout":
+            emit("Researching key points concurrently...")
+            output = self.agent("research").research_fanout(args["notes_content"])
+        elif job == "outline":
+            emit("Generating outline...")
+            output = self.agent("outline").generate_outline(
+                args["notes_content"], args["research_content"]
+            )
+        elif job == "draft":
+            style_refs = self.load_references(args.get("references_dir", "posts/_references"))
+            emit(f"Generating draft ({len(style_refs)} style references)...")
+            output = self.agent("draft").generate_draft(args["outline_content"], style_refs)
+        elif job == "redraft":
+            style_refs = self.load_references(args.get("references_dir", "posts/_references"))
+            emit("Re-drafting changed sections...")
+            draft, regenerated, notes = self.agent("draft").redraft_sections(
+                args["outline_content"], args["previous_outline"], args["draft_content"], style_refs
+            )
+            output = {"draft": draft, "regenerated": regenerated, "notes": notes}
+        elif job == "format":
+            emit("Formatting for platforms...")
+            linkedin, frontmatter = self.agent("format").format_for_platforms(
+                args["final_content"], args["slug"]
+            )
+            output = {"linkedin": linkedin, "frontmatter": frontmatter}
+        else:
+            raise ValueError(f"Unknown job: {job}")
+
+        if job != "ping":
+            with self._lock:
+                self.jobs_served += 1
+            emit(f"Finished {job} in {time.monotonic() - started:.1f}s")
+        return output
+
+
+class _JobHandler(socketserver.StreamRequestHandler):
+    """Handle one job per connection, streaming events as JSON lines."""
+
+    def _send(self, event: dict):
+        self.wfile.write((json.dumps(event) + "\n").encode("utf-8"))
+        self.wfile.flush()
+
+    def handle(self):
+        line = self.rfile.readline()
+        if not line:
+            return
+
+        try:
+            request = json.loads(line)
+            job = request["job"]
+        except (json.JSONDecodeError, KeyError) as e:
+            self._send({"event": "error", "message": f"Bad request: {e}"})
+            return
+
+        if job == "shutdown":
+            self._send({"event": "result", "output": "stopping"})
+            threading.Thread(target=self.server.shutdown, daemon=True).start()
+            return
+
+        emit = lambda message: self._send({"event": "progress", "message": message})  # noqa: E731
+        try:
+            output = self.server.runtime.run(job, request.get("args", {}), emit)
+        except Exception as e:  # report every failure to the client
+            self._send({"event": "error", "message": f"{type(e).__name__}: {e}"})
+            return
+        self._send({"event": "result", "output": output})
+
+
+class PublisherDaemon(socketserver.ThreadingUnixStreamServer):
+    """Unix socket server wrapping a shared PublisherRuntime."""
+
+    daemon_threads = True
+
+    def __init__(self, socket_path: Path = DEFAULT_SOCKET):
+        self.socket_path = Path(socket_path)
+        if self.socket_path.exists():
+            if is_running(self.socket_path):
+                raise DaemonError(f"Daemon already running on {self.socket_path}")
+            self.socket_path.unlink()  # stale socket from a crashed daemon
+        self.socket_path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        self.runtime = PublisherRuntime()
+        # Owner-only from the moment bind() creates the socket file
+        umask = os.umask(0o177)
+        try:
+            super().__init__(str(self.socket_path), _JobHandler)
+        finally:
+            os.umask(umask)
+
+    def server_close(self):
+        super().server_close()
+        self.socket_path.unlink(missing_ok=True)
+
+
+def submit(
+    job: str, args: dict | None = None, socket_path: Path = DEFAULT_SOCKET
+) -> Iterator[dict]:
+    """Submit a job to the daemon and yield its events as they arrive."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(str(socket_path))
+        sock.sendall((json.dumps({"job": job, "args": args or {}}) + "\n").encode("utf-8"))
+        with sock.makefile("r", encoding="utf-8") as stream:
+            for line in stream:
+                yield json.loads(line)
+
+
+def is_running(socket_path: Path = DEFAULT_SOCKET) -> bool:
+    """Check whether a daemon is answering on the socket."""
+    if not Path(socket_path).exists():
+        return False
+    try:
+        for event in submit("ping", socket_path=socket_path):
+            if event["event"] == "result":
+                return True
+    except OSError:
+        return False
+    return False
+
+
+def run_job(
+    job: str,
+    args: dict,
+    on_progress: Callable[[str], None] | None = None,
+    socket_path: Path = DEFAULT_SOCKET,
+):
+    """Run a job on the daemon if one is up, otherwise in-process."""
+    on_progress = on_progress or (lambda message: None)
+
+    if not is_running(socket_path):
+        return PublisherRuntime().run(job, args, on_progress)
+
+    for event in submit(job, args, socket_path):
+        if event["event"] == "progress":
+            on_progress(event["message"])
+        elif event["event"] == "result":
+            return event["output"]
+        elif event["event"] == "error":
+            raise DaemonError(event["message"])
+    raise DaemonError("Daemon closed the connection without a result")
+
+
+def serve(socket_path: Path = DEFAULT_SOCKET):
+    """Run the daemon in the foreground until stopped."""
+    with PublisherDaemon(socket_path) as server:
+        print(f"Publisher daemon listening on {socket_path} (pid {os.getpid()})", file=sys.stderr)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == "__main__":
+    serve(Path(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_SOCKET)
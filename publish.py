@@ -14,6 +14,68 @@ from rich.markdown import Markdown
 console = Console
 
 
+def _on_progress(status):
+    """Route job progress events into a rich status spinner."""
+    return lambda message: status.update(f"[bold blue]{message}")
+
+
+# Snapshot of outline_final.md as of the last draft run (baseline for `draft -i`)
+DRAFTED_OUTLINE = ".outline_drafted.md"
+
+
+def _redraft(post_dir: Path, outline_content: str, refs_dir: Path) -> bool:
+    """Re-draft only changed sections. Returns False when a full draft is needed."""
+    from daemon import run_job
+
+    draft_file = post_dir / "draft.md"
+    snapshot_file = post_dir / DRAFTED_OUTLINE
+    if not draft_file.exists() or not snapshot_file.exists():
+        console.print("[yellow]No previous draft baseline - generating full draft[/yellow]")
+        return False
+
+    with console.status("[bold blue]Re-drafting changed sections...") as progress:
+        result = run_job(
+            "redraft",
+            {
+                "outline_content": outline_content,
+                "previous_outline": snapshot_file.read_text(),
+                "draft_content": draft_file.read_text(),
+                "references_dir": str(refs_dir.resolve()),
+            },
+            _on_progress(progress),
+        )
+
+    if not result["regenerated"] and not result["notes"]:
+        console.print("[dim]No outline sections changed since the last draft[/dim]")
+        return True
+
+    draft_file.write_text(result["draft"])
+    snapshot_file.write_text(outline_content)
+    console.print(Panel(
+        f"[green]✓[/green] Re-drafted {len(result['regenerated'])} section(s):\n"
+        + "".join(f"  • {heading}\n" for heading in result["regenerated"])
+        + "".join(f"[yellow]![/yellow] {note}\n" for note in result["notes"])
+        + f"\nOther sections of [cyan]{draft_file}[/cyan] were left untouched",
+        title="Draft Updated",
+        border_style="green"
+    ))
+    return True
+
+
+def _apply_rewrites(draft_file: Path):
+    """Apply learned rewrite rules to a fresh draft, logging each as an agent edit."""
+    from scripts.rewrite_draft import DEFAULT_RULES, rewrite_file
+
+    if not DEFAULT_RULES.exists():
+        console.print(f"[yellow]No rule set at {DEFAULT_RULES} - skipping rewrite pass[/yellow]")
+        return
+    applications = rewrite_file(draft_file, DEFAULT_RULES)
+    console.print(
+        f"[green]✓[/green] Applied {len(applications)} learned rewrite(s) "
+        f"(logged to the sidecar as agent edits)"
+    )
+
+
 @click.group
 def cli:
  """Blog publishing workflow - Phase 1: Manual & Learning"""
@@ -83,9 +145,10 @@ What should the research agent focus on?
 
 @cli.command
 @click.argument("slug")
-def research(slug: str):
+@click.option("--fanout", is_flag=True, help="Research each key point concurrently, then merge")
+def research(slug: str, fanout: bool):
  """Run research phase for a post"""
- from agents.research import ResearchAgent
+ from daemon import run_job
 
  post_dir = Path("posts") / slug
  notes_file = post_dir / "notes.md"
@@ -103,10 +166,13 @@ def research(slug: str):
  # Load notes
  notes_content = notes_file.read_text
 
- # Run research agent
- agent = ResearchAgent
- with console.status("[bold blue]Researching..."):
- research_output = agent.research(notes_content)
+ # Run research agent (on the daemon when one is running)
+ with console.status("[bold blue]Researching...") as progress:
+ research_output = run_job(
+ "research_fanout" if fanout else "research",
+ {"notes_content": notes_content},
+ _on_progress(progress),
+ )
 
  # Save research output
  research_file = post_dir / "research.md"
@@ -129,7 +195,7 @@ def research(slug: str):
 @click.option("--version", "-v", default=1, help="Outline version number")
 def outline(slug: str, version: int):
  """Generate outline for a post"""
- from agents.outline import OutlineAgent
+ from daemon import run_job
 
  post_dir = Path("posts") / slug
  notes_file = post_dir / "notes.md"
@@ -149,10 +215,13 @@ def outline(slug: str, version: int):
  notes_content = notes_file.read_text
  research_content = research_file.read_text
 
- # Run outline agent
- agent = OutlineAgent
- with console.status("[bold blue]Generating outline..."):
- outline_output = agent.generate_outline(notes_content, research_content)
+ # Run outline agent (on the daemon when one is running)
+ with console.status("[bold blue]Generating outline...") as progress:
+ outline_output = run_job(
+ "outline",
+ {"notes_content": notes_content, "research_content": research_content},
+ _on_progress(progress),
+ )
 
  # Save outline
  outline_file = post_dir / f"outline_v{version}.md"
@@ -173,9 +242,12 @@ def outline(slug: str, version: int):
 
 @cli.command
 @click.argument("slug")
-def draft(slug: str):
+@click.option("--incremental", "-i", is_flag=True,
+              help="Re-draft only sections whose outline changed")
+@click.option("--rewrite", is_flag=True, help="Apply learned rewrite rules to the new draft")
+def draft(slug: str, incremental: bool, rewrite: bool):
  """Generate draft from final outline"""
- from agents.draft import DraftAgent
+ from daemon import run_job
 
  post_dir = Path("posts") / slug
  outline_file = post_dir / "outline_final.md"
@@ -193,21 +265,26 @@ def draft(slug: str):
  # Load outline
  outline_content = outline_file.read_text
 
- # Load style references (if available)
- style_refs = []
+ # Run draft agent (style references are loaded and cached by the runtime)
  refs_dir = Path("posts") / "_references"
- if refs_dir.exists:
- for ref_file in refs_dir.glob("*.md"):
- style_refs.append(ref_file.read_text)
+ if incremental and _redraft(post_dir, outline_content, refs_dir):
+ if rewrite:
+ _apply_rewrites(post_dir / "draft.md")
+ return
 
- # Run draft agent
- agent = DraftAgent
- with console.status("[bold blue]Generating draft..."):
- draft_output = agent.generate_draft(outline_content, style_refs)
+ with console.status("[bold blue]Generating draft...") as progress:
+ draft_output = run_job(
+ "draft",
+ {"outline_content": outline_content, "references_dir": str(refs_dir.resolve())},
+ _on_progress(progress),
+ )
 
- # Save draft
+ # Save draft, plus the outline it was drafted from (baseline for --incremental)
  draft_file = post_dir / "draft.md"
  draft_file.write_text(draft_output)
+ (post_dir / DRAFTED_OUTLINE).write_text(outline_content)
+ if rewrite:
+ _apply_rewrites(draft_file)
 
  console.print(Panel(
  f"[green]✓[/green] Draft complete!\n\n"
@@ -225,7 +302,7 @@ def draft(slug: str):
 @click.argument("slug")
 def format(slug: str):
  """Format final draft for publishing platforms"""
- from agents.formatter import FormatterAgent
+ from daemon import run_job
 
  post_dir = Path("posts") / slug
  final_file = post_dir / "final.md"
@@ -243,12 +320,12 @@ def format(slug: str):
  # Load final draft
  final_content = final_file.read_text
 
- # Run formatter agent
- agent = FormatterAgent
- with console.status("[bold blue]Formatting for platforms..."):
- linkedin, frontmatter = agent.format_for_platforms(
- final_content, slug
+ # Run formatter agent (on the daemon when one is running)
+ with console.status("[bold blue]Formatting for platforms...") as progress:
+ formatted = run_job(
+ "format", {"final_content": final_content, "slug": slug}, _on_progress(progress)
  )
+ linkedin, frontmatter = formatted["linkedin"], formatted["frontmatter"]
 
  # Save formatted outputs
  (post_dir / "linkedin.md").write_text(linkedin)
@@ -347,5 +424,144 @@ def list:
  console.print
 
 
+@cli.group()
+def daemon():
+    """Manage the optional warm publisher daemon"""
+    pass
+
+
+@daemon.command("start")
+@click.option("--detach", is_flag=True, help="Run in the background")
+def daemon_start(detach: bool):
+    """Start the daemon on the local Unix socket"""
+    import subprocess
+    import sys
+
+    from daemon import DEFAULT_SOCKET, is_running, serve
+
+    if is_running():
+        console.print(f"[yellow]Daemon already running on {DEFAULT_SOCKET}[/yellow]")
+        return
+
+    if not detach:
+        serve()
+        return
+
+    subprocess.Popen(
+        [sys.executable, str(Path(__file__).parent / "daemon.py"), str(DEFAULT_SOCKET)],
+        start_new_session=True,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    console.print(f"[green]✓[/green] Daemon starting on [cyan]{DEFAULT_SOCKET}[/cyan]")
+
+
+@daemon.command("status")
+def daemon_status():
+    """Show whether the daemon is running and what it holds warm"""
+    from daemon import DEFAULT_SOCKET, is_running, submit
+
+    if not is_running():
+        console.print("[dim]Daemon not running[/dim] - commands run in-process")
+        return
+
+    info = next(e["output"] for e in submit("ping") if e["event"] == "result")
+    console.print(Panel(
+        f"Socket: [cyan]{DEFAULT_SOCKET}[/cyan]\n"
+        f"PID: {info['pid']}  Uptime: {info['uptime']}s  Jobs: {info['jobs_served']}\n"
+        f"Warm agents: {', '.join(info['agents']) or 'none'}\n"
+        f"Cached references: {info['references']}"
+        + "".join(
+            f"\n  {task}: {t['calls']} calls, {t['fallbacks']} fallbacks, "
+            f"{t['hedges']} hedges, {t['latency_s']}s avg"
+            for task, t in info["telemetry"].items()
+        ),
+        title="Publisher Daemon",
+        border_style="cyan"
+    ))
+
+
+@daemon.command("stop")
+def daemon_stop():
+    """Stop the running daemon"""
+    from daemon import is_running, submit
+
+    if not is_running():
+        console.print("[dim]Daemon not running[/dim]")
+        return
+
+    for _ in submit("shutdown"):
+        pass
+    console.print("[green]✓[/green] Daemon stopped")
+
+
+
+@cli.group()
+def edits():
+    """Query the consolidated edit corpus"""
+    pass
+
+
+@edits.command("ingest")
+@click.option("--full", is_flag=True, help="Re-ingest every corpus file")
+def edits_ingest(full: bool):
+    """Load new or changed edits/ corpus files into the store"""
+    from scripts.edit_store import DEFAULT_DB, connect, ingest
+
+    stats = ingest(connect(DEFAULT_DB), full=full)
+    console.print(
+        f"[green]✓[/green] Ingested {stats['ingested']} file(s) ({stats['edits']} edits), "
+        f"skipped {stats['skipped']} unchanged, removed {stats['removed']}"
+    )
+
+
+@edits.command("query")
+@click.option("--style", help="Content style (blog, whitepaper, ...)")
+@click.option("--rule", help="rule_applied, e.g. blog.md#voice-active")
+@click.option("--editor", type=click.Choice(["human", "agent"]), help="Editor type")
+@click.option("--flagged", is_flag=True, default=None, help="Only flagged edits")
+@click.option("--source", help="Glob on source_file")
+@click.option("--since", help="YYYY-MM-DD")
+@click.option("--until", help="YYYY-MM-DD")
+@click.option("--text", help="Full-text search (FTS5 syntax)")
+@click.option("--limit", default=50, help="Maximum rows to show")
+@click.option("--format", "fmt", type=click.Choice(["table", "json", "count"]), default="table",
+              help="table, json, or only the number of matches")
+def edits_query(style, rule, editor, flagged, source, since, until, text, limit, fmt):
+    """Filter captured edits by style, rule, editor, flag, source, date or text"""
+    import sqlite3
+
+    from scripts.edit_store import DEFAULT_DB, connect, report
+
+    try:
+        click.echo(report(
+            connect(DEFAULT_DB), fmt, limit, style=style, rule=rule, editor_type=editor,
+            flagged=flagged, source=source, since=since, until=until, text=text,
+        ))
+    except sqlite3.OperationalError as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise SystemExit(1)
+
+
+@edits.command("watch")
+@click.argument("patterns", nargs=-1)
+@click.option("--style", help="Content style recorded on each edit")
+@click.option("--interval", default=1.0, help="Seconds between polls")
+def edits_watch(patterns, style, interval):
+    """Record edits to posts as they are saved (appends to the sidecar log)"""
+    from scripts.capture_watch import DEFAULT_PATTERNS, CaptureWatcher
+
+    watcher = CaptureWatcher(list(patterns or DEFAULT_PATTERNS), style)
+    watcher.scan()
+    console.print(f"Watching {len(watcher.snapshots)} file(s) for edits - Ctrl-C to stop")
+    try:
+        watcher.run(
+            interval, on_edits=lambda n: console.print(f"[green]✓[/green] Logged {n} edit(s)")
+        )
+    except KeyboardInterrupt:
+        console.print("[dim]Stopped watching[/dim]")
+
+
 if __name__ == "__main__":
  cli
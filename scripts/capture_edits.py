@@ -4,12 +4,14 @@ Extract edits from AI-generated content and output as YAML corpus.
 
 Usage:
  python scripts/capture_edits.py <file-path> <ai-draft-commit>
+ python scripts/capture_edits.py --all-since <commit> [--workers N]
+ python scripts/capture_edits.py --from-ai-draft-tags
 
 This script:
 1. Diffs the specified file between the ai-draft commit and current state
 2. Extracts edit pairs with sentence-level context
 3. Merges sidecar data from edits/.pending/ if available (agent intent metadata)
-4. Outputs structured YAML to edits/<date>-<filename>.yaml
+4. Outputs structured YAML to edits/<date>-<key>.yaml (key: sidecar_log.file_key)
 
 The output format captures:
 - Original and edited text
@@ -19,15 +21,24 @@ The output format captures:
 """
 
 import argparse
-import re
-import shutil
 import subprocess
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 
 import yaml
 
+if __package__ in (None, ""):
+    # Run as `python scripts/capture_edits.py`: make the scripts package importable
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from scripts.edit_io import write_document  # noqa: E402
+from scripts.edit_matching import collapse_watch, dedupe_sidecar, match_sidecar  # noqa: E402
+from scripts.sentence_index import SentenceIndex  # noqa: E402
+from scripts.sidecar_log import SidecarLog, file_key  # noqa: E402
+from scripts.text_diff import diff_texts  # noqa: E402
+
 
 def get_file_at_commit(file_path: str, commit: str) -> str | None:
  """Get file contents at a specific commit."""
@@ -62,397 +73,411 @@ def get_current_file_content(file_path: str) -> str | None:
  return None
 
 
-def get_unified_diff(file_path: str, commit: str) -> str:
- """Get unified diff between commit and current state."""
- # Check if there are uncommitted changes
- result = subprocess.run(
- ["git", "diff", "--name-only", "--", file_path],
- capture_output=True,
- text=True,
- )
- has_uncommitted = bool(result.stdout.strip)
-
- if has_uncommitted:
- # Diff against working directory
- result = subprocess.run(
- ["git", "diff", commit, "--", file_path],
- capture_output=True,
- text=True,
- )
- else:
- # Diff against HEAD
- result = subprocess.run(
- ["git", "diff", commit, "HEAD", "--", file_path],
- capture_output=True,
- text=True,
- )
-
- return result.stdout
-
-
-def split_into_sentences(text: str) -> list[str]:
- """Split text into sentences, treating markdown headings as sentence boundaries."""
- # First, handle markdown headings as sentence boundaries
- # Replace headings with a special marker
- text = re.sub(r"(^#{1,6}\s+.+$)", r"\1| ||SENT_BREAK| ||", text, flags=re.MULTILINE)
-
- # Split on sentence endings (. ! ?) followed by space or newline
- # But not on abbreviations like "e.g." or "i.e."
- sentences = re.split(r"(?<=[.!?])\s+(?=[A-Z])|(?<=\|\|\|SENT_BREAK\|\|\|)", text)
-
- # Clean up and filter
- cleaned = []
- for s in sentences:
- s = s.replace("| ||SENT_BREAK| ||", "").strip
- if s:
- cleaned.append(s)
-
- return cleaned
-
-
-def find_sentence_context(lines: list[str], line_number: int) -> dict:
- """Find the sentence containing the line and the sentence before it."""
- # Join all lines into text
- full_text = "\n".join(lines)
-
- # Find the character position of our target line
- char_pos = sum(len(lines[i]) + 1 for i in range(line_number - 1))
-
- # Split into sentences
- sentences = split_into_sentences(full_text)
-
- # Find which sentence contains our position
- current_pos = 0
- target_sentence_idx = 0
-
- for i, sentence in enumerate(sentences):
- sentence_start = full_text.find(sentence, current_pos)
- sentence_end = sentence_start + len(sentence)
-
- if sentence_start <= char_pos <= sentence_end:
- target_sentence_idx = i
- break
-
- current_pos = sentence_end
-
- # Get the sentence before (if exists)
- sentence_before = ""
- if target_sentence_idx > 0:
- sentence_before = sentences[target_sentence_idx - 1]
-
- # Get full sentence
- full_sentence = sentences[target_sentence_idx] if target_sentence_idx < len(sentences) else ""
-
- return {
- "sentence_before": sentence_before,
- "full_sentence": full_sentence,
- }
-
-
-def parse_unified_diff(diff_text: str, original_content: str, edited_content: str) -> list[dict]:
- """Parse unified diff and extract edit pairs with context."""
- edits = []
- edit_counter = 0
-
- original_lines = original_content.split("\n")
- edited_lines = edited_content.split("\n")
-
- # Parse diff hunks
- hunk_pattern = r"@@ -(\d+)(?:,\d+)? \+(\d+)(?:,\d+)? @@"
- lines = diff_text.split("\n")
-
- current_orig_line = 0
- current_edit_line = 0
- in_hunk = False
-
- i = 0
- while i < len(lines):
- line = lines[i]
-
- # Check for hunk header
- hunk_match = re.match(hunk_pattern, line)
- if hunk_match:
- current_orig_line = int(hunk_match.group(1))
- current_edit_line = int(hunk_match.group(2))
- in_hunk = True
- i += 1
- continue
-
- if not in_hunk:
- i += 1
- continue
-
- # Look for paired changes (- followed by +)
- if line.startswith("-") and not line.startswith("---"):
- original_text = line[1:]
-
- # Look ahead for corresponding + line
- if i + 1 < len(lines) and lines[i + 1].startswith("+") and not lines[i + 1].startswith("+++"):
- edited_text = lines[i + 1][1:]
-
- # Skip if both are empty or whitespace-only
- if original_text.strip or edited_text.strip:
- # Get context from original file
- orig_context = find_sentence_context(original_lines, current_orig_line)
- edit_context = find_sentence_context(edited_lines, current_edit_line)
-
- edit_counter += 1
- edits.append({
- "id": f"edit-{edit_counter:03d}",
- "original": original_text.strip,
- "edited": edited_text.strip,
- "sentence_before": orig_context["sentence_before"],
- "full_sentence_original": orig_context["full_sentence"],
- "full_sentence_edited": edit_context["full_sentence"],
- "line_number": current_orig_line,
- "reason": None,
- "rule_applied": None,
- "editor_type": "human",
- "style": None,
- "flagged": False,
- "timestamp": None,
- })
-
- i += 2 # Skip both - and + lines
- current_orig_line += 1
- current_edit_line += 1
- continue
-
- # Standalone deletion
- current_orig_line += 1
- i += 1
- continue
-
- elif line.startswith("+") and not line.startswith("+++"):
- # Standalone addition
- current_edit_line += 1
- i += 1
- continue
-
- elif line.startswith(" "):
- # Context line
- current_orig_line += 1
- current_edit_line += 1
- i += 1
- continue
-
- else:
- i += 1
-
- return edits
-
-
-def merge_sidecar(edits: list[dict], sidecar_path: Path) -> list[dict]:
- """Merge .pending sidecar entries into diff-extracted edits.
-
- Matches sidecar entries to diff entries by original/edited text.
- Sidecar entries that don't match any diff entry are appended as
- agent-only edits (edits not captured by the diff).
- """
- if not sidecar_path.exists:
- return edits
-
- sidecar_data = yaml.safe_load(sidecar_path.read_text) or {}
- sidecar_edits = sidecar_data.get("edits", [])
- if not sidecar_edits:
- return edits
-
- # Index sidecar by (original, edited) for matching
- sidecar_by_text = {}
- for entry in sidecar_edits:
- key = (entry.get("original", "").strip, entry.get("edited", "").strip)
- sidecar_by_text[key] = entry
-
- matched_keys = set
- intent_fields = ("reason", "rule_applied", "editor_type", "style", "flagged", "timestamp")
-
- for edit in edits:
- key = (edit["original"], edit["edited"])
- if key in sidecar_by_text:
- sidecar_entry = sidecar_by_text[key]
- for field in intent_fields:
- if field in sidecar_entry and sidecar_entry[field] is not None:
- edit[field] = sidecar_entry[field]
- matched_keys.add(key)
-
- # Append unmatched sidecar entries (agent edits not in diff)
- edit_counter = len(edits)
- for entry in sidecar_edits:
- key = (entry.get("original", "").strip, entry.get("edited", "").strip)
- if key not in matched_keys:
- edit_counter += 1
- edits.append({
- "id": f"edit-{edit_counter:03d}",
- "original": entry.get("original", "").strip,
- "edited": entry.get("edited", "").strip,
- "sentence_before": "",
- "full_sentence_original": "",
- "full_sentence_edited": "",
- "line_number": entry.get("line_number", 0),
- "reason": entry.get("reason"),
- "rule_applied": entry.get("rule_applied"),
- "editor_type": entry.get("editor_type", "agent"),
- "style": entry.get("style"),
- "flagged": entry.get("flagged", False),
- "timestamp": entry.get("timestamp"),
- })
-
- return edits
+def extract_edits(original_content: str, edited_content: str) -> list[dict]:
+    """Extract edit pairs with context by diffing the two texts in-process.
+
+    Sentences and then words are aligned (see text_diff), so multi-line hunks,
+    reflowed paragraphs, insertions, deletions and moved sentences are all
+    captured, each with character spans.
+    """
+    original_index = SentenceIndex.from_text(original_content)
+    edited_index = SentenceIndex.from_text(edited_content)
+
+    edits = []
+    for n, change in enumerate(
+        diff_texts(original_content, edited_content, original_index, edited_index), 1
+    ):
+        orig_context = original_index.context_at(change.orig_start)
+        edit_context = edited_index.context_at(change.edit_start)
+        edits.append({
+            "id": f"edit-{n:03d}",
+            "original": change.original.strip(),
+            "edited": change.edited.strip(),
+            "sentence_before": orig_context["sentence_before"],
+            "full_sentence_original": orig_context["full_sentence"],
+            "full_sentence_edited": edit_context["full_sentence"],
+            "line_number": original_index.line_at(change.orig_start),
+            "change_type": change.kind,
+            "original_span": [change.orig_start, change.orig_end],
+            "edited_span": [change.edit_start, change.edit_end],
+            "reason": None,
+            "rule_applied": None,
+            "editor_type": "human",
+            "style": None,
+            "flagged": False,
+            "timestamp": None,
+        })
+    return edits
+
+
+def merge_sidecar(edits: list[dict], sidecar_edits: list[dict]) -> list[dict]:
+    """Merge .pending sidecar entries into diff-extracted edits.
+
+    Matches sidecar entries to diff entries by normalized original/edited text,
+    then by sentence context, then fuzzily (see edit_matching). Matched diff
+    entries take the sidecar's intent fields. Sidecar entries that don't match
+    any diff entry are appended as-is: agent edits not captured by the diff, and
+    capture_watch edits the final text no longer shows. Watch entries that a
+    later save rewrote are first folded into that save's entry (collapse_watch).
+    """
+    if not sidecar_edits:
+        return edits
+
+    sidecar_edits = collapse_watch(dedupe_sidecar(sidecar_edits))
+    matches, unmatched = match_sidecar(edits, sidecar_edits)
+    intent_fields = ("reason", "rule_applied", "editor_type", "style", "flagged", "timestamp")
+    for n, s in matches.items():
+        sidecar_entry = sidecar_edits[s]
+        for field in intent_fields:
+            if sidecar_entry.get(field) is not None:
+                edits[n][field] = sidecar_entry[field]
+        edits[n]["sidecar_id"] = sidecar_entry.get("id")
+
+    # Append unmatched sidecar entries (edits not in the final diff)
+    edit_counter = len(edits)
+    for s in unmatched:
+        entry = sidecar_edits[s]
+        edit_counter += 1
+        edits.append({
+            "id": f"edit-{edit_counter:03d}",
+            "original": (entry.get("original") or "").strip(),
+            "edited": (entry.get("edited") or "").strip(),
+            "sentence_before": entry.get("sentence_before", ""),
+            "full_sentence_original": entry.get("full_sentence_original", ""),
+            "full_sentence_edited": entry.get("full_sentence_edited", ""),
+            "line_number": entry.get("line_number", 0),
+            "reason": entry.get("reason"),
+            "rule_applied": entry.get("rule_applied"),
+            "editor_type": entry.get("editor_type", "agent"),
+            "style": entry.get("style"),
+            "flagged": entry.get("flagged", False),
+            "timestamp": entry.get("timestamp"),
+            "sidecar_id": entry.get("id"),
+        })
+
+    return edits
+
+
+def build_corpus(
+    file_path: str,
+    ai_draft_commit: str,
+    original_content: str,
+    current_content: str,
+    style: str | None = None,
+    session_reason: str | None = None,
+    source_repo: str | None = None,
+) -> tuple[dict, int, int]:
+    """Build the corpus for one file from its draft and current content.
+
+    Returns (corpus_dict, sidecar_count, flagged_count).
+    """
+    corpus = {
+        "source_file": file_path,
+        "ai_draft_commit": ai_draft_commit,
+        "captured_at": datetime.now(timezone.utc).isoformat(),
+        "editor_type": "human",
+        "style": style,
+        "session_reason": session_reason,
+        "edits": [],
+    }
+    if source_repo:
+        corpus["source_repo"] = source_repo
+    edits = extract_edits(original_content, current_content)
+
+    # Merge sidecar data if available (agent intent metadata, YAML and/or JSONL)
+    sidecar_edits = SidecarLog.for_file(file_path).read()
+    sidecar_count = len(sidecar_edits)
+    flagged_count = sum(1 for e in sidecar_edits if e.get("flagged"))
+    if sidecar_edits:
+        edits = merge_sidecar(edits, sidecar_edits)
+
+    corpus["edits"] = edits
+    if not edits:
+        corpus["message"] = "No edits found since the AI draft."
+    return corpus, sidecar_count, flagged_count
 
 
 def capture_edits(
- file_path: str,
- ai_draft_commit: str,
- style: str | None = None,
- session_reason: str | None = None,
- source_repo: str | None = None,
+    file_path: str,
+    ai_draft_commit: str,
+    style: str | None = None,
+    session_reason: str | None = None,
+    source_repo: str | None = None,
 ) -> tuple[dict, int, int]:
- """Main function to capture edits between ai-draft and current state.
-
- Returns (corpus_dict, sidecar_count, flagged_count).
- """
- # Get original content at ai-draft commit
- original_content = get_file_at_commit(file_path, ai_draft_commit)
- if original_content is None:
- raise ValueError(f"Could not get file at commit {ai_draft_commit}")
-
- # Get current content
- current_content = get_current_file_content(file_path)
- if current_content is None:
- raise ValueError(f"Could not get current file content for {file_path}")
-
- # Get the diff
- diff_text = get_unified_diff(file_path, ai_draft_commit)
- if not diff_text.strip:
- corpus = {
- "source_file": file_path,
- "ai_draft_commit": ai_draft_commit,
- "captured_at": datetime.now(timezone.utc).isoformat,
- "editor_type": "human",
- "style": style,
- "session_reason": session_reason,
- "edits": [],
- "message": "No edits found since the AI draft.",
- }
- if source_repo:
- corpus["source_repo"] = source_repo
- return corpus, 0, 0
-
- # Parse the diff and extract edits
- edits = parse_unified_diff(diff_text, original_content, current_content)
-
- # Merge sidecar data if available (agent intent metadata)
- sidecar_path = Path("edits/.pending") / f"{Path(file_path).stem}.yaml"
- sidecar_count = 0
- flagged_count = 0
- if sidecar_path.exists:
- sidecar_data = yaml.safe_load(sidecar_path.read_text) or {}
- sidecar_edits = sidecar_data.get("edits", [])
- sidecar_count = len(sidecar_edits)
- flagged_count = sum(1 for e in sidecar_edits if e.get("flagged"))
- edits = merge_sidecar(edits, sidecar_path)
-
- corpus = {
- "source_file": file_path,
- "ai_draft_commit": ai_draft_commit,
- "captured_at": datetime.now(timezone.utc).isoformat,
- "editor_type": "human",
- "style": style,
- "session_reason": session_reason,
- "edits": edits,
- }
- if source_repo:
- corpus["source_repo"] = source_repo
- return corpus, sidecar_count, flagged_count
+    """Main function to capture edits between ai-draft and current state.
+
+    Returns (corpus_dict, sidecar_count, flagged_count).
+    """
+    # Get original content at ai-draft commit
+    original_content = get_file_at_commit(file_path, ai_draft_commit)
+    if original_content is None:
+        raise ValueError(f"Could not get file at commit {ai_draft_commit}")
+
+    # Get current content
+    current_content = get_current_file_content(file_path)
+    if current_content is None:
+        raise ValueError(f"Could not get current file content for {file_path}")
+
+    return build_corpus(
+        file_path, ai_draft_commit, original_content, current_content,
+        style=style, session_reason=session_reason, source_repo=source_repo,
+    )
+
+
+def write_corpus(corpus: dict, file_path: str) -> Path:
+    """Write a corpus to edits/<date>-<key>.yaml and return the output path.
+
+    The key is per file path (see sidecar_log.file_key), so posts/a/draft.md
+    and posts/b/draft.md captured in one batch get separate corpora.
+    """
+    date_str = datetime.now().strftime("%Y-%m-%d")
+    output_dir = Path("edits")
+    output_dir.mkdir(exist_ok=True)
+    output_path = output_dir / f"{date_str}-{file_key(file_path)}.yaml"
+    return write_document(output_path, corpus)
+
+
+# --- Batch capture -----------------------------------------------------------
+#
+# Batch mode spawns a fixed number of git processes regardless of how many
+# files are captured: one `git log` to find [ai-draft] commits and their files,
+# and one `git cat-file --batch` to read every draft version. Files are then
+# diffed in-process (text_diff) in parallel worker processes, each writing
+# its own corpus.
+
+AI_DRAFT_TAG = "[ai-draft]"
+CAPTURE_PATHSPECS = ("*.md", "*.mdx")
+
+
+def find_ai_draft_files(since: str | None = None) -> dict[str, str]:
+    """Map each file touched by an [ai-draft] commit to its most recent such commit.
+
+    With `since`, only commits after it are considered; otherwise the whole history.
+    """
+    cmd = [
+        "git", "log", "--fixed-strings", f"--grep={AI_DRAFT_TAG}",
+        "--name-only", "--format=%x1e%H", "--diff-filter=AM",
+    ]
+    if since:
+        cmd.append(f"{since}..HEAD")
+    cmd += ["--", *CAPTURE_PATHSPECS]
+    result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+
+    # Log is newest first, so the first commit seen for a file is its latest draft
+    drafts: dict[str, str] = {}
+    for record in result.stdout.split("\x1e"):
+        lines = [line for line in record.split("\n") if line.strip()]
+        if not lines:
+            continue
+        commit, files = lines[0], lines[1:]
+        for file_path in files:
+            drafts.setdefault(file_path, commit)
+    return drafts
+
+
+def read_blobs(refs: list[str]) -> dict[str, str | None]:
+    """Read `<commit>:<path>` objects through a single `git cat-file --batch` process."""
+    if not refs:
+        return {}
+    result = subprocess.run(
+        ["git", "cat-file", "--batch"],
+        input="\n".join(refs).encode() + b"\n",
+        capture_output=True,
+        check=True,
+    )
+    out = result.stdout
+    blobs: dict[str, str | None] = {}
+    pos = 0
+    for ref in refs:
+        header_end = out.index(b"\n", pos)
+        header = out[pos:header_end].split()
+        pos = header_end + 1
+        if len(header) != 3 or header[1] != b"blob":
+            blobs[ref] = None  # "<ref> missing" or not a file
+            continue
+        size = int(header[2])
+        blobs[ref] = out[pos:pos + size].decode("utf-8", errors="replace")
+        pos += size + 1  # content is followed by a newline
+    return blobs
+
+
+def _capture_task(task: dict) -> dict:
+    """Worker: build and write the corpus for one file (runs in a child process)."""
+    file_path = task["file_path"]
+    try:
+        current_content = Path(file_path).read_text()
+        if current_content == task["original"] and not SidecarLog.for_file(file_path).exists():
+            return {"file_path": file_path, "skipped": True}
+        corpus, sidecar_count, flagged_count = build_corpus(
+            file_path, task["commit"], task["original"], current_content,
+            style=task["style"], session_reason=task["session_reason"],
+            source_repo=task["source_repo"],
+        )
+        output_path = write_corpus(corpus, file_path)
+        if task["archive"]:
+            archive_sidecar(file_path)
+    except (OSError, ValueError, yaml.YAMLError) as e:
+        return {"file_path": file_path, "error": str(e)}
+    return {
+        "file_path": file_path,
+        "output": str(output_path),
+        "edits": len(corpus["edits"]),
+        "sidecar": sidecar_count,
+        "flagged": flagged_count,
+    }
+
+
+def capture_batch(
+    since: str | None = None,
+    style: str | None = None,
+    session_reason: str | None = None,
+    source_repo: str | None = None,
+    archive: bool = False,
+    workers: int | None = None,
+) -> list[dict]:
+    """Capture every file edited since its latest [ai-draft] commit, one corpus per file.
+
+    Files that are unchanged and have no pending sidecar are skipped. Returns
+    one summary dict per captured file (or an "error" entry if it failed).
+    """
+    drafts = {f: c for f, c in find_ai_draft_files(since).items() if Path(f).is_file()}
+    originals = read_blobs([f"{commit}:{f}" for f, commit in drafts.items()])
+    tasks = [
+        {
+            "file_path": file_path,
+            "commit": commit,
+            "original": originals.get(f"{commit}:{file_path}") or "",
+            "style": style,
+            "session_reason": session_reason,
+            "source_repo": source_repo,
+            "archive": archive,
+        }
+        for file_path, commit in drafts.items()
+    ]
+    if not tasks:
+        return []
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        results = [r for r in pool.map(_capture_task, tasks, chunksize=4) if not r.get("skipped")]
+    return sorted(results, key=lambda r: r["file_path"])
 
 
 def archive_sidecar(file_path: str) -> Path | None:
- """Move sidecar to archive directory. Returns archive path or None."""
- stem = Path(file_path).stem
- sidecar_path = Path("edits/.pending") / f"{stem}.yaml"
- if not sidecar_path.exists:
- return None
-
- archive_dir = Path("edits/.pending/archive")
- archive_dir.mkdir(parents=True, exist_ok=True)
- date_str = datetime.now.strftime("%Y-%m-%d")
- archive_path = archive_dir / f"{date_str}-{stem}.yaml"
- shutil.move(str(sidecar_path), str(archive_path))
- return archive_path
-
-
-def main:
- parser = argparse.ArgumentParser(
- description="Extract edits from AI-generated content and output as YAML corpus."
- )
- parser.add_argument("file_path", help="Path to the edited file")
- parser.add_argument("ai_draft_commit", help="Commit hash of the [ai-draft] commit")
- parser.add_argument("--style", choices=["blog", "technical", "whitepaper", "marketing-narrative"], default=None,
- help="Style type for this content")
- parser.add_argument("--session-reason", default=None,
- help="Why this editing session was performed")
- parser.add_argument("--archive", action="store_true",
- help="Archive sidecar after merge")
- parser.add_argument("--source-repo", default=None,
- help="Source repo path for cross-repo edit capture")
- args = parser.parse_args
-
- file_path = args.file_path
- path = Path(file_path)
-
- # Validate file exists in git
- if not path.exists:
- result = subprocess.run(
- ["git", "ls-files", file_path],
- capture_output=True,
- text=True,
- )
- if not result.stdout.strip:
- print(f"Error: File not found: {file_path}")
- sys.exit(1)
-
- # Capture edits
- try:
- result, sidecar_count, flagged_count = capture_edits(
- file_path, args.ai_draft_commit,
- style=args.style, session_reason=args.session_reason,
- source_repo=args.source_repo,
- )
- except ValueError as e:
- print(f"Error: {e}", file=sys.stderr)
- sys.exit(1)
-
- # Print sidecar merge summary to stderr
- if sidecar_count > 0:
- print(f"Merged {sidecar_count} sidecar entries ({flagged_count} flagged)", file=sys.stderr)
-
- # Generate output filename
- date_str = datetime.now.strftime("%Y-%m-%d")
- filename = path.stem
- output_dir = Path("edits")
- output_dir.mkdir(exist_ok=True)
- output_path = output_dir / f"{date_str}-{filename}.yaml"
-
- # Write YAML output
- with open(output_path, "w") as f:
- yaml.dump(result, f, default_flow_style=False, sort_keys=False, allow_unicode=True)
-
- # Archive sidecar if requested
- if args.archive:
- archive_path = archive_sidecar(file_path)
- if archive_path:
- print(f"Sidecar archived: {archive_path}", file=sys.stderr)
-
- # Report results
- edit_count = len(result.get("edits", []))
- print(f"Captured {edit_count} edit(s)")
- print(f"Output: {output_path}")
-
- if edit_count > 0:
- print("\nSample edits:")
- for edit in result["edits"][:3]:
- print(f" - {edit['id']}: \"{edit['original'][:50]}...\" -> \"{edit['edited'][:50]}...\"")
+    """Compact the sidecar and move it to the archive directory. Returns archive path or None."""
+    log = SidecarLog.for_file(file_path)
+    date_str = datetime.now().strftime("%Y-%m-%d")
+    return log.archive(log.pending_dir / "archive" / f"{date_str}-{log.key}.yaml")
+
+
+def run_batch(args) -> int:
+    """Batch mode: capture all [ai-draft] files (optionally since a commit)."""
+    results = capture_batch(
+        since=args.all_since,
+        style=args.style,
+        session_reason=args.session_reason,
+        source_repo=args.source_repo,
+        archive=args.archive,
+        workers=args.workers,
+    )
+    if not results:
+        print("No edited [ai-draft] files found")
+        return 0
+
+    failed = 0
+    for r in results:
+        if "error" in r:
+            failed += 1
+            print(f"Error: {r['file_path']}: {r['error']}", file=sys.stderr)
+            continue
+        merged = f", {r['sidecar']} sidecar ({r['flagged']} flagged)" if r["sidecar"] else ""
+        print(f"{r['file_path']}: {r['edits']} edit(s){merged} -> {r['output']}")
+
+    total = sum(r.get("edits", 0) for r in results)
+    print(f"\nCaptured {total} edit(s) across {len(results) - failed} file(s)")
+    return 1 if failed else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Extract edits from AI-generated content and output as YAML corpus."
+    )
+    parser.add_argument("file_path", nargs="?", help="Path to the edited file")
+    parser.add_argument("ai_draft_commit", nargs="?", help="Commit hash of the [ai-draft] commit")
+    batch = parser.add_mutually_exclusive_group()
+    batch.add_argument("--all-since", metavar="COMMIT", default=None,
+                       help="Batch: capture every file from [ai-draft] commits after COMMIT")
+    batch.add_argument("--from-ai-draft-tags", action="store_true",
+                       help="Batch: capture every file from any [ai-draft] commit")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Worker processes for batch capture (default: CPU count)")
+    parser.add_argument("--style", default=None,
+                        choices=["blog", "technical", "whitepaper", "marketing-narrative"],
+                        help="Style type for this content")
+    parser.add_argument("--session-reason", default=None,
+                        help="Why this editing session was performed")
+    parser.add_argument("--archive", action="store_true",
+                        help="Archive sidecar after merge")
+    parser.add_argument("--source-repo", default=None,
+                        help="Source repo path for cross-repo edit capture")
+    args = parser.parse_args()
+
+    if args.all_since or args.from_ai_draft_tags:
+        if args.file_path:
+            parser.error("batch mode does not take a file path")
+        sys.exit(run_batch(args))
+    if not args.file_path or not args.ai_draft_commit:
+        parser.error(
+            "file_path and ai_draft_commit are required (or use --all-since / --from-ai-draft-tags)"
+        )
+
+    file_path = args.file_path
+    path = Path(file_path)
+
+    # Validate file exists in git
+    if not path.exists():
+        result = subprocess.run(
+            ["git", "ls-files", file_path],
+            capture_output=True,
+            text=True,
+        )
+        if not result.stdout.strip():
+            print(f"Error: File not found: {file_path}")
+            sys.exit(1)
+
+    # Capture edits
+    try:
+        result, sidecar_count, flagged_count = capture_edits(
+            file_path, args.ai_draft_commit,
+            style=args.style, session_reason=args.session_reason,
+            source_repo=args.source_repo,
+        )
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    # Print sidecar merge summary to stderr
+    if sidecar_count > 0:
+        print(f"Merged {sidecar_count} sidecar entries ({flagged_count} flagged)", file=sys.stderr)
+
+    output_path = write_corpus(result, file_path)
+
+    # Archive sidecar if requested
+    if args.archive:
+        archive_path = archive_sidecar(file_path)
+        if archive_path:
+            print(f"Sidecar archived: {archive_path}", file=sys.stderr)
+
+    # Report results
+    edit_count = len(result.get("edits", []))
+    print(f"Captured {edit_count} edit(s)")
+    print(f"Output: {output_path}")
+
+    if edit_count > 0:
+        print("\nSample edits:")
+        for edit in result["edits"][:3]:
+            original, edited = edit["original"][:50], edit["edited"][:50]
+            print(f"  - {edit['id']}: \"{original}...\" -> \"{edited}...\"")
 
 
 if __name__ == "__main__":
- main
+    main()
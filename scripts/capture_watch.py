@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""
+Record edits to tracked files as they are saved.
+
+Opt-in companion to capture_edits.py. The watcher keeps an in-memory
+snapshot (text plus sentence index) of every tracked file and polls their
+mtime/size. When a file has changed and its stat has been stable for one
+poll (so half-written saves are not diffed), the new text is diffed against
+the snapshot with text_diff, each change is appended to the file's sidecar
+log (edits/.pending/<key>.jsonl) with sentence context, and the snapshot is
+replaced. Only the sentence index of the new text is built per save; the
+previous one is reused from the snapshot.
+
+At capture time the sidecar already holds the session's edits, so building
+the corpus is mostly a merge; an edit that a later save rewrote is folded
+into that later entry first (edit_matching.collapse_watch). Saves made by an
+agent are recorded too; entries are tagged captured_by: watch, and the merge
+drops any that duplicate an edit the agent logged with its intent through
+log_edit.py.
+
+Usage:
+ python scripts/capture_watch.py [PATH_OR_GLOB ...] [--style S] [--interval SECONDS]
+"""
+
+import argparse
+import glob
+import os
+import sys
+import time
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+
+if __package__ in (None, ""):
+    # Run as `python scripts/capture_watch.py`: make the scripts package importable
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from scripts.sentence_index import SentenceIndex  # noqa: E402
+from scripts.sidecar_log import PENDING_DIR, SidecarLog  # noqa: E402
+from scripts.text_diff import diff_texts  # noqa: E402
+
+DEFAULT_PATTERNS = ("posts/*/draft.md", "posts/*/final.md")
+
+# Seconds between polls
+POLL_INTERVAL = 1.0
+
+
+@dataclass
+class Snapshot:
+    """Last recorded version of one tracked file."""
+
+    text: str
+    index: SentenceIndex
+    stat: tuple[int, int]  # (mtime_ns, size)
+    pending: tuple[int, int] | None = None  # changed stat waiting to settle
+
+
+def _stat(path: Path) -> tuple[int, int] | None:
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None  # mid atomic save, or deleted
+    return st.st_mtime_ns, st.st_size
+
+
+def _read(path: Path) -> str | None:
+    """File text, or None if it vanished since the stat or is not UTF-8 text."""
+    try:
+        return path.read_text()
+    except (OSError, UnicodeDecodeError):
+        return None
+
+
+def diff_entries(old: Snapshot, new_text: str, new_index: SentenceIndex,
+                 file_path: str, style: str | None = None) -> list[dict]:
+    """Sidecar entries for the changes between a snapshot and the saved text."""
+    timestamp = datetime.now(UTC).isoformat()
+    entries = []
+    for change in diff_texts(old.text, new_text, old.index, new_index):
+        orig_context = old.index.context_at(change.orig_start)
+        edit_context = new_index.context_at(change.edit_start)
+        entry = {
+            "original": change.original.strip(),
+            "edited": change.edited.strip(),
+            "sentence_before": orig_context["sentence_before"],
+            "full_sentence_original": orig_context["full_sentence"],
+            "full_sentence_edited": edit_context["full_sentence"],
+            "line_number": new_index.line_at(change.edit_start),
+            "change_type": change.kind,
+            "editor_type": "human",
+            "captured_by": "watch",
+            "timestamp": timestamp,
+            "file": file_path,
+        }
+        if style:
+            entry["style"] = style
+        entries.append(entry)
+    return entries
+
+
+class CaptureWatcher:
+    """Polls tracked files and appends each saved change to its sidecar log."""
+
+    def __init__(self, patterns: list[str], style: str | None = None,
+                 pending_dir: Path = PENDING_DIR):
+        self.patterns = list(patterns)
+        self.style = style
+        self.pending_dir = Path(pending_dir)
+        self.snapshots: dict[Path, Snapshot] = {}
+
+    def _expand(self) -> list[Path]:
+        paths = []
+        for pattern in self.patterns:
+            matches = glob.glob(pattern) if glob.has_magic(pattern) else [pattern]
+            paths.extend(Path(p) for p in matches)
+        return paths
+
+    def _snapshot(self, path: Path) -> Snapshot | None:
+        stat = _stat(path)
+        if stat is None:
+            return None
+        text = _read(path)
+        if text is None:
+            return None
+        return Snapshot(text, SentenceIndex.from_text(text), stat)
+
+    def scan(self) -> list[Path]:
+        """Snapshot files that match the patterns but aren't tracked yet (no edits logged)."""
+        added = []
+        for path in self._expand():
+            if path not in self.snapshots and path.is_file():
+                snapshot = self._snapshot(path)
+                if snapshot:
+                    self.snapshots[path] = snapshot
+                    added.append(path)
+        return added
+
+    def poll(self) -> int:
+        """Diff every settled change since the last poll; returns the number of edits logged."""
+        logged = 0
+        for path, snapshot in self.snapshots.items():
+            stat = _stat(path)
+            if stat is None or stat == snapshot.stat:
+                snapshot.pending = None
+                continue
+            if stat != snapshot.pending:
+                snapshot.pending = stat  # wait one poll for the write to finish
+                continue
+            text = _read(path)
+            if text is None:
+                # Gone mid-save (retried next poll) or not text (skipped until it changes)
+                snapshot.pending = None
+                if path.exists():
+                    snapshot.stat = stat
+                continue
+            logged += self.record(path, text, stat)
+        return logged
+
+    def record(self, path: Path, text: str, stat: tuple[int, int] | None = None) -> int:
+        """Log the changes from the snapshot to `text` and advance the snapshot."""
+        snapshot = self.snapshots[path]
+        if text == snapshot.text:
+            snapshot.stat, snapshot.pending = stat or snapshot.stat, None
+            return 0
+        index = SentenceIndex.from_text(text)
+        entries = diff_entries(snapshot, text, index, str(path), self.style)
+        log = SidecarLog.for_file(str(path), self.pending_dir)
+        for entry in entries:
+            log.append(entry)
+        self.snapshots[path] = Snapshot(text, index, stat or snapshot.stat)
+        return len(entries)
+
+    def run(self, interval: float = POLL_INTERVAL, rescan_every: int = 10, on_edits=None):
+        """Poll until interrupted; new files matching the patterns are picked up periodically."""
+        self.scan()
+        polls = 0
+        while True:
+            time.sleep(interval)
+            polls += 1
+            if polls % rescan_every == 0:
+                self.scan()
+            logged = self.poll()
+            if logged and on_edits:
+                on_edits(logged)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Record edits to tracked files on every save.")
+    parser.add_argument("patterns", nargs="*", default=list(DEFAULT_PATTERNS),
+                        help="Files or globs to watch (default: posts/*/draft.md, final.md)")
+    parser.add_argument("--style", default=None, help="Content style recorded on each edit")
+    parser.add_argument("--interval", type=float, default=POLL_INTERVAL,
+                        help="Seconds between polls")
+    args = parser.parse_args()
+
+    watcher = CaptureWatcher(args.patterns, args.style)
+    watcher.scan()
+    print(f"Watching {len(watcher.snapshots)} file(s); Ctrl-C to stop")
+    try:
+        watcher.run(args.interval, on_edits=lambda n: print(f"Logged {n} edit(s)"))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+"""
+Parse cache for the resume corpus files, keyed by content hash.
+
+corpus_to_sql.py parses four Markdown files on every run. Each parse result
+(a list of one dataclass) is stored as JSON in struct-of-arrays form, one
+array per field, under .cache/corpus/<file>.json together with the SHA-256
+of the file it came from. A run whose file hashes match loads the arrays and
+skips parsing. When more than one file is stale they are parsed in worker
+processes.
+
+No pickle on disk: the cache is plain JSON and a version or field-list
+mismatch is treated as a miss.
+"""
+
+import dataclasses
+import hashlib
+import json
+import os
+import sys
+from collections.abc import Callable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+
+CACHE_DIR = Path(__file__).resolve().parent.parent / ".cache" / "corpus"
+CACHE_VERSION = 1
+
+
+@dataclass
+class CorpusFile:
+    """One corpus file and how to parse it."""
+
+    path: Path
+    parse: Callable  # parse(lines, name) -> list[record]
+    record: type  # the dataclass parse() returns
+    label: str  # for messages, e.g. "jobs"
+
+
+def _hashing_lines(f, digest) -> Iterator[str]:
+    for raw in f:
+        digest.update(raw)
+        yield raw.decode("utf-8")
+
+
+def parse_file(path: Path, parse: Callable) -> tuple[str, list]:
+    """Stream-parse a file, hashing exactly the bytes the parser saw."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        items = parse(_hashing_lines(f, digest), path.name)
+    return digest.hexdigest(), items
+
+
+def file_hash(path: Path) -> str:
+    with open(path, "rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
+class ParseCache:
+    """Struct-of-arrays JSON cache of parsed records, one file per corpus file."""
+
+    def __init__(self, cache_dir: Path = CACHE_DIR):
+        self.cache_dir = Path(cache_dir)
+
+    def _path(self, source: Path) -> Path:
+        return self.cache_dir / f"{source.name}.json"
+
+    def get(self, source: Path, digest: str, record: type) -> list | None:
+        try:
+            data = json.loads(self._path(source).read_text())
+        except (OSError, ValueError):
+            return None
+        names = [f.name for f in dataclasses.fields(record)]
+        if (data.get("version"), data.get("sha256"), data.get("fields")) != (
+            CACHE_VERSION, digest, names
+        ):
+            return None
+        columns = [data["columns"][name] for name in names]
+        return [record(*values) for values in zip(*columns)]
+
+    def put(self, source: Path, digest: str, record: type, items: list):
+        names = [f.name for f in dataclasses.fields(record)]
+        data = {
+            "version": CACHE_VERSION,
+            "sha256": digest,
+            "fields": names,
+            "count": len(items),
+            "columns": {name: [getattr(item, name) for item in items] for name in names},
+        }
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        path = self._path(source)
+        tmp = path.with_name(f".{path.name}.tmp")
+        tmp.write_text(json.dumps(data, ensure_ascii=False, separators=(",", ":")))
+        os.replace(tmp, path)
+
+
+def parse_corpora(
+    files: list[CorpusFile], cache: ParseCache | None = None, workers: int | None = None
+) -> list[list]:
+    """Parse each corpus file (missing files give []), reusing cached results.
+
+    Returns the record lists in the order of `files`.
+    """
+    results: list[list | None] = [None] * len(files)
+    stale = []
+    for i, corpus in enumerate(files):
+        if not corpus.path.exists():
+            print(f"Warning: {corpus.path} not found", file=sys.stderr)
+            results[i] = []
+            continue
+        if cache is not None:
+            results[i] = cache.get(corpus.path, file_hash(corpus.path), corpus.record)
+        if results[i] is not None:
+            print(f"Parsed {len(results[i])} {corpus.label} from {corpus.path.name} (cached)",
+                  file=sys.stderr)
+        else:
+            stale.append(i)
+
+    if len(stale) > 1:
+        workers = workers or min(len(stale), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            parsed = list(pool.map(parse_file, [files[i].path for i in stale],
+                                   [files[i].parse for i in stale]))
+    else:
+        parsed = [parse_file(files[i].path, files[i].parse) for i in stale]
+
+    for i, (digest, items) in zip(stale, parsed):
+        corpus = files[i]
+        if cache is not None:
+            cache.put(corpus.path, digest, corpus.record, items)
+        results[i] = items
+        print(f"Parsed {len(items)} {corpus.label} from {corpus.path.name}", file=sys.stderr)
+    return results
@@ -0,0 +1,109 @@
+"""
+Single-pass tokenizer for the Markdown tables in the resume corpus.
+
+Reads a corpus file line by line and yields every table body row together
+with the `## ` section and the header row it sits under, so corpus_to_sql.py
+parses each file in one linear pass instead of running a regex over the whole
+document per table. Nothing is buffered beyond the current table header:
+a file object can be passed straight in.
+
+Fenced code blocks are skipped (tables shown as examples are not data), and
+`\\|` inside a cell is an escaped pipe, not a column break.
+"""
+
+import re
+import sys
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+
+_DELIMITER = re.compile(r"^\|?\s*:?-+:?\s*(?:\|\s*:?-+:?\s*)*\|?$")
+_CELL_BREAK = re.compile(r"(?<!\\)\|")
+_FENCE = re.compile(r"^\s*(```|~~~)")
+
+
+@dataclass(slots=True)
+class TableRow:
+    """One body row of a Markdown table, located by section, table and line."""
+
+    section: str | None  # text of the nearest "## " heading above the table
+    table: int  # index of the table within its section, from 0
+    header: tuple[str, ...]
+    cells: tuple[str, ...]
+    line: int  # 1-based line number in the source
+    source: str = "<corpus>"
+
+    @property
+    def where(self) -> str:
+        return f"{self.source}:{self.line}"
+
+    def get(self, column: str, default: str = "") -> str:
+        """Cell under the named header column (default when absent or short)."""
+        try:
+            return self.cells[self.header.index(column)]
+        except (ValueError, IndexError):
+            return default
+
+
+def split_cells(line: str) -> list[str]:
+    """Split a table line into stripped cells, dropping the outer pipes."""
+    body = line.strip()
+    if body.startswith("|"):
+        body = body[1:]
+    if body.endswith("|") and not body.endswith("\\|"):
+        body = body[:-1]
+    if "\\" not in body:
+        return [cell.strip() for cell in body.split("|")]
+    return [cell.strip().replace("\\|", "|") for cell in _CELL_BREAK.split(body)]
+
+
+def warn(where: str, message: str):
+    """Report a corpus problem on stderr, prefixed with its file:line."""
+    print(f"Warning: {where}: {message}", file=sys.stderr)
+
+
+def iter_rows(source: str | Iterable[str], name: str = "<corpus>") -> Iterator[TableRow]:
+    """Yield the body rows of every table in a corpus, in document order.
+
+    `source` is either the whole text or any iterable of lines (an open file
+    streams). A table is a pipe row followed by a delimiter row; it ends at
+    the first line that does not start with a pipe.
+    """
+    lines = source.splitlines() if isinstance(source, str) else source
+
+    section = None
+    table = -1
+    header = None  # header of the table being read
+    candidate = None  # previous line, if it could be a header
+    in_fence = False
+
+    for number, raw in enumerate(lines, 1):
+        line = raw.rstrip("\r\n")
+        stripped = line.strip()
+
+        if stripped[:1] in ("`", "~") and _FENCE.match(line):
+            in_fence = not in_fence
+            header = candidate = None
+            continue
+        if in_fence:
+            continue
+
+        if header is not None:
+            if stripped.startswith("|"):
+                yield TableRow(section, table, header, tuple(split_cells(line)), number, name)
+                continue
+            header = None
+
+        if candidate is not None and "|" in stripped and _DELIMITER.match(stripped):
+            header = tuple(split_cells(candidate))
+            width = len(split_cells(stripped))
+            if width != len(header):
+                warn(f"{name}:{number}",
+                     f"delimiter row has {width} columns, header has {len(header)}")
+            table += 1
+            candidate = None
+            continue
+
+        candidate = line if stripped.startswith("|") else None
+        if line.startswith("## "):
+            section = line[3:].strip()
+            table = -1
@@ -0,0 +1,147 @@
+"""
+Referential-integrity check for the parsed resume corpus.
+
+Before any SQL is generated, corpus_to_sql.py indexes every primary key the
+seed will contain (job ids, the companies in COMPANY_UUIDS, the dimension
+table ids) in hash sets, then walks each record once and looks up every
+reference it makes:
+
+- RESUME_CORPUS.md: company → COMPANY_UUIDS; platform, industry, domain and
+  business-model labels → their label map → the dimension table
+- BULLET_CORPUS.md: job_id → jobs
+- SKILL_MAPPING.md: job_id → jobs, skill_id → resume_skill
+- ROLE_ALLOCATIONS: job id → jobs, role id → resume_role
+
+Duplicate primary keys are reported as well. Each problem carries the file
+and line of the table row it came from. Errors are what the database would
+reject; warnings are data the seed silently drops (a label with no mapping).
+"""
+
+from dataclasses import dataclass, field
+
+from scripts.resume_model import Bullet, Job, SkillMapping, SkillTag
+
+SOURCES = {
+    "jobs": "RESUME_CORPUS.md",
+    "bullets": "BULLET_CORPUS.md",
+    "skill_mappings": "SKILL_MAPPING.md",
+    "skill_tags": "SKILLS_TAXONOMY.md",
+    "role_allocations": "corpus_to_sql.py",
+}
+
+
+@dataclass(order=True)
+class Problem:
+    """One finding, ordered by file and line."""
+
+    source: str
+    line: int
+    message: str
+    severity: str = "error"  # or "warning"
+
+    def __str__(self) -> str:
+        where = f"{self.source}:{self.line}" if self.line else self.source
+        return f"{where}: {self.severity}: {self.message}"
+
+
+@dataclass
+class Vocabulary:
+    """The keys outside the corpus files that corpus records refer to."""
+
+    companies: set[str]
+    # Dimension table → its ids
+    dimensions: dict[str, set[str]]
+    # Job field → (dimension table, corpus label → dimension id)
+    labels: dict[str, tuple[str, dict[str, str]]] = field(default_factory=dict)
+    # Job id → [(role id, percentage)]
+    role_allocations: dict[str, list[tuple[str, float]]] = field(default_factory=dict)
+
+
+def _first_seen(items, key, source: str, what: str, problems: list[Problem]) -> dict:
+    """Index items by key → line, reporting every repeat of a key."""
+    index: dict = {}
+    for item in items:
+        value = key(item)
+        if value in index:
+            problems.append(Problem(
+                source, item.line, f"duplicate {what} {value!r} (first at line {index[value]})"
+            ))
+        else:
+            index[value] = item.line
+    return index
+
+
+def validate(
+    jobs: list[Job],
+    bullets: list[Bullet],
+    skill_mappings: list[SkillMapping],
+    skill_tags: list[SkillTag],
+    vocabulary: Vocabulary,
+    sources: dict[str, str] = SOURCES,
+) -> list[Problem]:
+    """Check every reference in the corpus; returns the problems sorted by file and line."""
+    problems: list[Problem] = []
+    dimensions = vocabulary.dimensions
+
+    job_ids = _first_seen(jobs, lambda j: j.id, sources["jobs"], "job id", problems)
+    for job in jobs:
+        where = sources["jobs"]
+        if job.company not in vocabulary.companies:
+            problems.append(Problem(
+                where, job.line, f"{job.id}: company {job.company!r} has no UUID in COMPANY_UUIDS"
+            ))
+        for attr, (table, ids) in vocabulary.labels.items():
+            labels = getattr(job, attr)
+            for label in [labels] if isinstance(labels, str) else labels:
+                if label not in ids:
+                    problems.append(Problem(
+                        where, job.line,
+                        f"{job.id}: {attr} {label!r} has no {table} mapping and is dropped",
+                        "warning",
+                    ))
+                elif ids[label] not in dimensions[table]:
+                    problems.append(Problem(
+                        where, job.line,
+                        f"{job.id}: {attr} {label!r} maps to {ids[label]!r}, "
+                        f"which is not in {table}",
+                    ))
+
+    _first_seen(bullets, lambda b: b.id, sources["bullets"], "bullet id", problems)
+    for bullet in bullets:
+        if bullet.job_id not in job_ids:
+            problems.append(Problem(
+                sources["bullets"], bullet.line,
+                f"{bullet.id}: job {bullet.job_id!r} is not in {sources['jobs']}",
+            ))
+
+    where = sources["skill_mappings"]
+    _first_seen(skill_mappings, lambda m: (m.job_id, m.skill_id), where, "mapping", problems)
+    skills = dimensions.get("resume_skill", set())
+    for mapping in skill_mappings:
+        if mapping.job_id not in job_ids:
+            problems.append(Problem(
+                where, mapping.line, f"job {mapping.job_id!r} is not in {sources['jobs']}"
+            ))
+        if mapping.skill_id not in skills:
+            problems.append(Problem(
+                where, mapping.line, f"skill {mapping.skill_id!r} is not in resume_skill"
+            ))
+
+    _first_seen(skill_tags, lambda t: t.skill_id, sources["skill_tags"], "skill id", problems)
+
+    # Role allocations live in code: no line, and only checkable against parsed jobs
+    where = sources["role_allocations"]
+    roles = dimensions.get("resume_role", set())
+    for job_id, allocations in vocabulary.role_allocations.items():
+        if jobs and job_id not in job_ids:
+            problems.append(Problem(
+                where, 0, f"ROLE_ALLOCATIONS: job {job_id!r} is not in {sources['jobs']}"
+            ))
+        for role_id, _ in allocations:
+            if role_id not in roles:
+                problems.append(Problem(
+                    where, 0,
+                    f"ROLE_ALLOCATIONS[{job_id!r}]: role {role_id!r} is not in resume_role",
+                ))
+
+    return sorted(problems)
@@ -0,0 +1,142 @@
+"""
+Serialization for the edit corpus and sidecar files.
+
+YAML goes through libyaml (CSafeLoader / CSafeDumper) when PyYAML was built
+with it, falling back to the pure-Python SafeLoader / SafeDumper otherwise.
+Corpus documents are written edit by edit, so only one edit's node graph is
+held at a time, and the output is identical to dumping the whole mapping at
+once. Summary counts (edits, flagged edits) are read from the parser's event
+stream without constructing the edit dicts.
+"""
+
+import json
+import os
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+
+import yaml
+
+Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+Dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+DUMP_OPTIONS = {"default_flow_style": False, "sort_keys": False, "allow_unicode": True}
+
+
+def load_yaml(source: str | Path):
+    """Parse a YAML file (Path) or YAML text (str)."""
+    text = source.read_text() if isinstance(source, Path) else source
+    return yaml.load(text, Loader=Loader)
+
+
+def dump_yaml(data, stream=None) -> str | None:
+    """Block-style, insertion-ordered, unicode YAML; returns a string when stream is None."""
+    return yaml.dump(data, stream, Dumper=Dumper, **DUMP_OPTIONS)
+
+
+def write_document(path: Path, data: dict, items_key: str = "edits",
+                   items: Iterable[dict] | None = None) -> Path:
+    """
+    Write a mapping whose `items_key` list is streamed item by item.
+
+    `items` (an iterable, e.g. a generator) replaces data[items_key] if given.
+    Keys keep their order in `data`; the file is replaced atomically.
+    """
+    path = Path(path)
+    if items is None:
+        items = data.get(items_key) or []
+    # Per-process temp name: concurrent writers never share a half-written file
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    with open(tmp_path, "w") as f:
+        written = False
+        for key, value in data.items():
+            if key != items_key:
+                dump_yaml({key: value}, f)
+                continue
+            written = True
+            _write_items(f, items_key, items)
+        if not written:
+            _write_items(f, items_key, items)
+    os.replace(tmp_path, path)
+    return path
+
+
+def _write_items(f, key: str, items: Iterable[dict]):
+    empty = True
+    for item in items:
+        if empty:
+            f.write(f"{dump_yaml(key).splitlines()[0]}:\n")
+            empty = False
+        # A block sequence under a mapping key is not indented, so per-item chunks concatenate
+        dump_yaml([item], f)
+    if empty:
+        dump_yaml({key: []}, f)
+
+
+def iter_jsonl(path: Path) -> Iterator[dict]:
+    """Entries of a JSONL file, skipping blank and torn (partially written) lines."""
+    with open(path) as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # torn trailing line from an interrupted writer
+
+
+def count_yaml_edits(path: Path, items_key: str = "edits") -> tuple[int, int]:
+    """
+    (edits, flagged edits) in a corpus or sidecar YAML file, without loading it.
+
+    Walks the parser's events: items of the top-level `items_key` sequence are
+    counted, and an item is flagged when its own `flagged` key is true.
+    """
+    edits = flagged = 0
+    # One frame per open collection: [is_mapping, expecting_key, current_key]
+    frames: list[list] = []
+    with open(path, "rb") as f:
+        for event in yaml.parse(f, Loader=Loader):
+            if isinstance(event, (yaml.MappingStartEvent, yaml.SequenceStartEvent)):
+                if len(frames) == 2 and _is_items(frames, items_key):
+                    edits += 1
+                if frames and frames[-1][0]:
+                    frames[-1][1] = True  # this collection is the value; a key comes next
+                frames.append([isinstance(event, yaml.MappingStartEvent), True, None])
+            elif isinstance(event, (yaml.MappingEndEvent, yaml.SequenceEndEvent)):
+                frames.pop()
+            elif isinstance(event, (yaml.ScalarEvent, yaml.AliasEvent)):
+                if not frames:
+                    continue
+                top = frames[-1]
+                if top[0] and top[1]:
+                    top[1], top[2] = False, getattr(event, "value", None)
+                    continue
+                if len(frames) == 2 and _is_items(frames, items_key):
+                    edits += 1  # scalar list item (malformed, still counted)
+                elif (len(frames) == 3 and top[0] and top[2] == "flagged"
+                      and _is_items(frames, items_key)):
+                    flagged += getattr(event, "value", "").lower() in ("true", "yes", "on")
+                if top[0]:
+                    top[1] = True
+    return edits, flagged
+
+
+def _is_items(frames: list[list], items_key: str) -> bool:
+    """Whether frames[1] is the items sequence of the top-level mapping."""
+    return frames[0][0] and frames[0][2] == items_key and not frames[1][0]
+
+
+def count_jsonl_edits(path: Path) -> tuple[int, int]:
+    """(entries, flagged entries) in a JSONL log; only lines mentioning flagged are parsed."""
+    edits = flagged = 0
+    with open(path) as f:
+        for line in f:
+            if not line.strip():
+                continue
+            edits += 1
+            if '"flagged"' in line:
+                try:
+                    flagged += bool(json.loads(line).get("flagged"))
+                except json.JSONDecodeError:
+                    edits -= 1
+    return edits, flagged
@@ -0,0 +1,246 @@
+"""
+Match sidecar entries (agent intent) to diff-extracted edits.
+
+Exact stage: a hash index on normalized (original, edited) pairs. Each diff
+edit is indexed both by its own span and by the full sentences around it,
+because agents log the old/new strings they passed to the editor, which are
+usually wider than the minimal span the diff reports. A sentence-level hit
+annotates every diff edit in that sentence.
+
+Fuzzy stage: remaining entries are compared only against blocking candidates
+that share rare character trigrams with them, then scored by trigram Dice
+similarity. Assignment is greedy by score and one-to-one, so the cost grows
+with the number of candidates per entry, not with the product of both sides.
+"""
+
+import unicodedata
+from collections import Counter
+from dataclasses import dataclass
+
+# Minimum similarity for a fuzzy match
+MIN_SIMILARITY = 0.6
+
+# Candidates scored per sidecar entry
+MAX_CANDIDATES = 20
+
+# Trigrams in more than this fraction of keys are too common to block on
+MAX_POSTING_FRACTION = 0.05
+
+_QUOTES = str.maketrans({"\u2018": "'", "\u2019": "'", "\u201c": '"', "\u201d": '"',
+                         "\u2013": "-", "\u2014": "-", "\u00a0": " "})
+
+
+def normalize(text: str | None) -> str:
+    """Whitespace-collapsed, NFC, straight-quoted text used for matching."""
+    text = unicodedata.normalize("NFC", text or "").translate(_QUOTES)
+    return " ".join(text.split())
+
+
+def trigrams(text: str) -> set[str]:
+    padded = f"  {text.lower()} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def dice(a: set[str], b: set[str]) -> float:
+    if not a and not b:
+        return 1.0
+    return 2 * len(a & b) / (len(a) + len(b))
+
+
+@dataclass
+class _Key:
+    """One matchable view of a diff edit: its own span or its sentence context."""
+
+    edit: int
+    original: set[str]
+    edited: set[str]
+
+
+def dedupe_sidecar(sidecar: list[dict]) -> list[dict]:
+    """
+    Drop capture_watch entries that duplicate an edit an agent also logged.
+
+    The watcher records every save, including saves made by an agent that
+    logs the same edit with its intent through log_edit.py. Each agent entry
+    absorbs one watcher entry with the same normalized original/edited text.
+    """
+    agent_pairs = Counter(
+        (normalize(e.get("original")), normalize(e.get("edited")))
+        for e in sidecar if e.get("captured_by") != "watch"
+    )
+    kept = []
+    for entry in sidecar:
+        if entry.get("captured_by") == "watch":
+            pair = (normalize(entry.get("original")), normalize(entry.get("edited")))
+            if agent_pairs[pair]:
+                agent_pairs[pair] -= 1
+                continue
+        kept.append(entry)
+    return kept
+
+
+def _fold(first: tuple[str, str], second: tuple[str, str]) -> tuple[str, str] | None:
+    """Net (original, edited) of two successive edits, or None if they don't overlap."""
+    (a, b), (c, d) = first, second
+    if not b or not c:
+        return None  # a deletion or an insertion leaves no shared text to chain on
+    if c == b:
+        return a, d
+    if b in c:
+        # The later edit widened the span around the earlier result
+        before, _, after = c.partition(b)
+        return " ".join(f"{before}{a}{after}".split()), d
+    if c in b:
+        # The later edit rewrote a piece of the earlier result
+        before, _, after = b.partition(c)
+        return a, " ".join(f"{before}{d}{after}".split())
+    return None
+
+
+def collapse_watch(sidecar: list[dict]) -> list[dict]:
+    """
+    Fold capture_watch entries that a later save rewrote into that later entry.
+
+    Editing "utilize" → "employ" in one save and "employ" → "use" in the next
+    is one edit, "utilize" → "use"; left as two entries, the superseded one
+    would reach the corpus as an extra unmatched edit. A watch entry folds
+    into an earlier one for the same file when its sentence before the edit
+    is the earlier entry's sentence after it and their spans overlap. An
+    edit undone by a later save drops out entirely.
+    """
+    kept: list[dict | None] = []
+    # (file, current text of the sentence) → positions in kept of entries that edited it
+    live: dict[tuple, list[int]] = {}
+    save, rekey = None, []
+    for entry in sidecar:
+        if entry.get("captured_by") != "watch":
+            kept.append(entry)
+            continue
+        file = entry.get("file")
+        if (file, entry.get("timestamp")) != save:
+            # A save's entries share a timestamp; once it is done, earlier
+            # entries in the sentences it changed follow the new sentence text
+            for old, new in rekey:
+                live.setdefault(new, []).extend(live.pop(old, []))
+            save, rekey = (file, entry.get("timestamp")), []
+
+        before = (file, normalize(entry.get("full_sentence_original")))
+        after = (file, normalize(entry.get("full_sentence_edited")))
+        second = (normalize(entry.get("original")), normalize(entry.get("edited")))
+        positions = live.get(before, []) if before[1] else []
+        for position in reversed(positions):
+            earlier = kept[position]
+            net = _fold((normalize(earlier.get("original")), normalize(earlier.get("edited"))),
+                        second)
+            if net is None:
+                continue
+            positions.remove(position)
+            kept[position] = None
+            if net[0] == net[1]:
+                entry = None  # undone by the later save
+                break
+            entry = {
+                **entry,
+                "original": net[0],
+                "edited": net[1],
+                "sentence_before": earlier.get("sentence_before", ""),
+                "full_sentence_original": earlier.get("full_sentence_original", ""),
+                "change_type": "replace" if net[0] and net[1] else (
+                    "insert" if net[1] else "delete"
+                ),
+            }
+            break
+        if before[1] and before != after:
+            rekey.append((before, after))
+        if entry is not None:
+            live.setdefault(after, []).append(len(kept))
+            kept.append(entry)
+    return [entry for entry in kept if entry is not None]
+
+
+def match_sidecar(edits: list[dict], sidecar: list[dict],
+                  min_similarity: float = MIN_SIMILARITY) -> tuple[dict[int, int], list[int]]:
+    """
+    Match sidecar entries to diff edits.
+
+    Returns ({edit index: sidecar index}, [unmatched sidecar indexes]).
+    """
+    by_pair: dict[tuple[str, str], list[int]] = {}
+    by_sentence: dict[tuple[str, str], list[int]] = {}
+    for n, edit in enumerate(edits):
+        pair = (normalize(edit.get("original")), normalize(edit.get("edited")))
+        by_pair.setdefault(pair, []).append(n)
+        sentence = (normalize(edit.get("full_sentence_original")),
+                    normalize(edit.get("full_sentence_edited")))
+        if any(sentence):
+            by_sentence.setdefault(sentence, []).append(n)
+
+    def distance(n: int, entry: dict) -> int:
+        line = entry.get("line_number") or 0
+        return abs((edits[n].get("line_number") or 0) - line) if line else 0
+
+    matches: dict[int, int] = {}
+    pending: list[int] = []
+    for s, entry in enumerate(sidecar):
+        pair = (normalize(entry.get("original")), normalize(entry.get("edited")))
+        free = [n for n in by_pair.get(pair, []) if n not in matches]
+        if free:
+            # Short spans like a single word repeat; prefer the nearest line
+            matches[min(free, key=lambda n: distance(n, entry))] = s
+            continue
+        in_sentence = [n for n in by_sentence.get(pair, []) if n not in matches]
+        if in_sentence:
+            for n in in_sentence:
+                matches[n] = s
+            continue
+        pending.append(s)
+
+    if pending:
+        pending = _fuzzy(edits, sidecar, pending, matches, min_similarity)
+    return matches, pending
+
+
+def _fuzzy(edits: list[dict], sidecar: list[dict], pending: list[int],
+           matches: dict[int, int], min_similarity: float) -> list[int]:
+    """Trigram-blocked fuzzy matching; fills matches and returns still-unmatched entries."""
+    keys: list[_Key] = []
+    for n, edit in enumerate(edits):
+        if n in matches:
+            continue
+        for o, e in ((edit.get("original"), edit.get("edited")),
+                     (edit.get("full_sentence_original"), edit.get("full_sentence_edited"))):
+            if o or e:
+                keys.append(_Key(n, trigrams(normalize(o)), trigrams(normalize(e))))
+    if not keys:
+        return pending
+
+    postings: dict[str, list[int]] = {}
+    for k, key in enumerate(keys):
+        for gram in key.original | key.edited:
+            postings.setdefault(gram, []).append(k)
+    max_posting = max(MAX_CANDIDATES, int(len(keys) * MAX_POSTING_FRACTION))
+
+    scored: list[tuple[float, int, int, int]] = []
+    for s in pending:
+        entry = sidecar[s]
+        original = trigrams(normalize(entry.get("original")))
+        edited = trigrams(normalize(entry.get("edited")))
+        shared: Counter = Counter()
+        for gram in original | edited:
+            posting = postings.get(gram)
+            if posting and len(posting) <= max_posting:
+                shared.update(posting)
+        for k, _ in shared.most_common(MAX_CANDIDATES):
+            key = keys[k]
+            score = (dice(original, key.original) + dice(edited, key.edited)) / 2
+            if score >= min_similarity:
+                line_gap = abs((edits[key.edit].get("line_number") or 0)
+                               - (entry.get("line_number") or 0))
+                scored.append((score, line_gap, s, key.edit))
+
+    matched_entries: set[int] = set()
+    for _, _, s, n in sorted(scored, key=lambda t: (-t[0], t[1])):
+        if s not in matched_entries and n not in matches:
+            matches[n] = s
+            matched_entries.add(s)
+    return [s for s in pending if s not in matched_entries]
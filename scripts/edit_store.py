@@ -0,0 +1,374 @@
+#!/usr/bin/env python3
+"""
+Consolidated, queryable store for the edit corpus.
+
+Ingests capture outputs (edits/YYYY-MM-DD-<key>.yaml), history-mined
+corpora (edits/history/*.yaml, see mine_history.py) and archived sidecars
+(edits/.pending/archive/*.yaml) into one SQLite database. Edits are indexed by
+style, rule_applied, editor_type, flagged, source_file and date, and their
+text fields are searchable through an FTS5 index. Ingest is incremental:
+files whose size and mtime are unchanged since the last run are skipped.
+
+Usage:
+ python scripts/edit_store.py ingest [--db PATH] [--full]
+ python scripts/edit_store.py query [--style S] [--rule R] [--editor human|agent]
+     [--flagged] [--source GLOB] [--since DATE] [--until DATE] [--text FTS]
+     [--limit N] [--format table|json|count]
+"""
+
+import argparse
+import json
+import os
+import re
+import sqlite3
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import yaml
+
+if __package__ in (None, ""):
+    # Run as `python scripts/edit_store.py`: make the scripts package importable
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from scripts.edit_io import load_yaml  # noqa: E402
+
+DEFAULT_DB = Path(".cache/edits.db")
+REPORT_FORMATS = ("table", "json", "count")
+CORPUS_GLOBS = ("edits/*.yaml", "edits/history/*.yaml", "edits/.pending/archive/*.yaml")
+
+# Parse in worker processes only when there are enough stale files to pay for them
+PARALLEL_THRESHOLD = 16
+
+_DATE_PREFIX = re.compile(r"^(\d{4}-\d{2}-\d{2})-")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS corpora (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL UNIQUE,
+    kind TEXT NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    source_file TEXT,
+    ai_draft_commit TEXT,
+    captured_at TEXT,
+    session_reason TEXT,
+    source_repo TEXT
+);
+
+CREATE TABLE IF NOT EXISTS edits (
+    id INTEGER PRIMARY KEY,
+    corpus_id INTEGER NOT NULL REFERENCES corpora(id) ON DELETE CASCADE,
+    edit_id TEXT,
+    source_file TEXT,
+    date TEXT,
+    original TEXT,
+    edited TEXT,
+    sentence_before TEXT,
+    full_sentence_original TEXT,
+    full_sentence_edited TEXT,
+    line_number INTEGER,
+    change_type TEXT,
+    reason TEXT,
+    rule_applied TEXT,
+    editor_type TEXT,
+    style TEXT,
+    flagged INTEGER NOT NULL DEFAULT 0,
+    timestamp TEXT
+);
+
+CREATE INDEX IF NOT EXISTS idx_edits_corpus ON edits(corpus_id);
+CREATE INDEX IF NOT EXISTS idx_edits_style ON edits(style);
+CREATE INDEX IF NOT EXISTS idx_edits_rule ON edits(rule_applied, flagged);
+CREATE INDEX IF NOT EXISTS idx_edits_editor ON edits(editor_type);
+CREATE INDEX IF NOT EXISTS idx_edits_flagged ON edits(flagged);
+CREATE INDEX IF NOT EXISTS idx_edits_source ON edits(source_file);
+CREATE INDEX IF NOT EXISTS idx_edits_date ON edits(date);
+
+CREATE VIRTUAL TABLE IF NOT EXISTS edits_fts USING fts5(
+    original, edited, reason, full_sentence_original, full_sentence_edited,
+    content='edits', content_rowid='id'
+);
+
+CREATE TRIGGER IF NOT EXISTS edits_ai AFTER INSERT ON edits BEGIN
+    INSERT INTO edits_fts(rowid, original, edited, reason, full_sentence_original,
+                          full_sentence_edited)
+    VALUES (new.id, new.original, new.edited, new.reason, new.full_sentence_original,
+            new.full_sentence_edited);
+END;
+
+CREATE TRIGGER IF NOT EXISTS edits_ad AFTER DELETE ON edits BEGIN
+    INSERT INTO edits_fts(edits_fts, rowid, original, edited, reason, full_sentence_original,
+                          full_sentence_edited)
+    VALUES ('delete', old.id, old.original, old.edited, old.reason, old.full_sentence_original,
+            old.full_sentence_edited);
+END;
+"""
+
+EDIT_COLUMNS = (
+    "corpus_id", "edit_id", "source_file", "date", "original", "edited", "sentence_before",
+    "full_sentence_original", "full_sentence_edited", "line_number", "change_type", "reason",
+    "rule_applied", "editor_type", "style", "flagged", "timestamp",
+)
+
+RESULT_COLUMNS = (
+    "date", "source_file", "edit_id", "style", "editor_type", "rule_applied", "flagged",
+    "original", "edited", "reason",
+)
+
+
+def connect(db_path: Path = DEFAULT_DB) -> sqlite3.Connection:
+    """Open (and if needed create) the store."""
+    db_path = Path(db_path)
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(db_path)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA foreign_keys = ON")
+    conn.execute("PRAGMA journal_mode = WAL")
+    conn.executescript(SCHEMA)
+    return conn
+
+
+def _corpus_date(path: Path, data: dict) -> str | None:
+    match = _DATE_PREFIX.match(path.name)
+    if match:
+        return match.group(1)
+    captured = data.get("captured_at")
+    return str(captured)[:10] if captured else None
+
+
+def _edit_rows(corpus_id: int, path: Path, data: dict) -> list[tuple]:
+    date = _corpus_date(path, data)
+    source_file = data.get("source_file")
+    default_style = data.get("style")
+    default_editor = data.get("editor_type")
+    rows = []
+    for edit in data.get("edits") or []:
+        if not isinstance(edit, dict):
+            continue
+        timestamp = edit.get("timestamp")
+        rows.append((
+            corpus_id,
+            edit.get("id"),
+            edit.get("file") or source_file,
+            str(timestamp)[:10] if timestamp and not date else date,
+            edit.get("original"),
+            edit.get("edited"),
+            edit.get("sentence_before"),
+            edit.get("full_sentence_original"),
+            edit.get("full_sentence_edited"),
+            edit.get("line_number"),
+            edit.get("change_type"),
+            edit.get("reason"),
+            edit.get("rule_applied"),
+            edit.get("editor_type") or default_editor,
+            edit.get("style") or default_style,
+            1 if edit.get("flagged") else 0,
+            str(timestamp) if timestamp else None,
+        ))
+    return rows
+
+
+def _kind(path: Path) -> str:
+    if "archive" in path.parts:
+        return "sidecar"
+    return "history" if "history" in path.parts else "corpus"
+
+
+def _load(path: Path) -> dict | str:
+    """Parse one corpus file (runs in a worker process); returns the data or an error."""
+    try:
+        data = load_yaml(path) or {}
+    except (OSError, yaml.YAMLError) as e:
+        return str(e)
+    return data if isinstance(data, dict) else {}
+
+
+def ingest(conn: sqlite3.Connection, root: Path = Path("."), full: bool = False,
+           workers: int | None = None) -> dict:
+    """
+    Load new or changed corpus files into the store.
+
+    Stale files are parsed in parallel worker processes and written in one
+    transaction. Returns counts of files ingested, skipped (unchanged) and
+    removed (deleted from disk), plus the number of edits written.
+    """
+    known = {
+        row["path"]: (row["id"], row["mtime_ns"], row["size"])
+        for row in conn.execute("SELECT id, path, mtime_ns, size FROM corpora")
+    }
+    stats = {"ingested": 0, "skipped": 0, "removed": 0, "edits": 0, "errors": 0}
+    seen = set()
+    stale: list[tuple[Path, str, os.stat_result]] = []
+    for pattern in CORPUS_GLOBS:
+        for path in sorted(root.glob(pattern)):
+            rel = str(path.relative_to(root))
+            seen.add(rel)
+            stat = path.stat()
+            previous = known.get(rel)
+            if previous and not full and previous[1:] == (stat.st_mtime_ns, stat.st_size):
+                stats["skipped"] += 1
+            else:
+                stale.append((path, rel, stat))
+
+    paths = [path for path, _, _ in stale]
+    if len(paths) > PARALLEL_THRESHOLD:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            parsed = list(pool.map(_load, paths, chunksize=8))
+    else:
+        parsed = [_load(path) for path in paths]
+
+    with conn:
+        for (path, rel, stat), data in zip(stale, parsed):
+            if isinstance(data, str):
+                print(f"Warning: skipping {rel}: {data}", file=sys.stderr)
+                stats["errors"] += 1
+                continue
+            previous = known.get(rel)
+            if previous:
+                conn.execute("DELETE FROM corpora WHERE id = ?", (previous[0],))
+            cursor = conn.execute(
+                "INSERT INTO corpora (path, kind, mtime_ns, size, source_file, "
+                "ai_draft_commit, captured_at, session_reason, source_repo) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    rel, _kind(path),
+                    stat.st_mtime_ns, stat.st_size, data.get("source_file"),
+                    data.get("ai_draft_commit"),
+                    str(data["captured_at"]) if data.get("captured_at") else None,
+                    data.get("session_reason"), data.get("source_repo"),
+                ),
+            )
+            rows = _edit_rows(cursor.lastrowid, path, data)
+            conn.executemany(
+                f"INSERT INTO edits ({', '.join(EDIT_COLUMNS)}) "
+                f"VALUES ({', '.join('?' * len(EDIT_COLUMNS))})",
+                rows,
+            )
+            stats["ingested"] += 1
+            stats["edits"] += len(rows)
+
+        for rel, (corpus_id, _, _) in known.items():
+            if rel not in seen:
+                conn.execute("DELETE FROM corpora WHERE id = ?", (corpus_id,))
+                stats["removed"] += 1
+    return stats
+
+
+def query(
+    conn: sqlite3.Connection,
+    style: str | None = None,
+    rule: str | None = None,
+    editor_type: str | None = None,
+    flagged: bool | None = None,
+    source: str | None = None,
+    since: str | None = None,
+    until: str | None = None,
+    text: str | None = None,
+    limit: int | None = 50,
+    count: bool = False,
+) -> list[sqlite3.Row] | int:
+    """Filter edits; `source` is a glob, `text` an FTS5 query over the text fields."""
+    where, params = [], []
+    for column, value in (("style", style), ("rule_applied", rule), ("editor_type", editor_type)):
+        if value is not None:
+            where.append(f"e.{column} = ?")
+            params.append(value)
+    if flagged is not None:
+        where.append("e.flagged = ?")
+        params.append(1 if flagged else 0)
+    if source:
+        where.append("e.source_file GLOB ?")
+        params.append(source)
+    if since:
+        where.append("e.date >= ?")
+        params.append(since)
+    if until:
+        where.append("e.date <= ?")
+        params.append(until)
+    if text:
+        where.append("e.id IN (SELECT rowid FROM edits_fts WHERE edits_fts MATCH ?)")
+        params.append(text)
+
+    clause = f" WHERE {' AND '.join(where)}" if where else ""
+    if count:
+        return conn.execute(f"SELECT COUNT(*) FROM edits e{clause}", params).fetchone()[0]
+
+    sql = (
+        f"SELECT {', '.join(f'e.{c}' for c in RESULT_COLUMNS)} FROM edits e{clause} "
+        "ORDER BY e.date DESC, e.source_file, e.line_number"
+    )
+    if limit:
+        sql += " LIMIT ?"
+        params.append(limit)
+    return conn.execute(sql, params).fetchall()
+
+
+def _format_table(rows: list[sqlite3.Row]) -> str:
+    lines = []
+    for row in rows:
+        flag = "*" if row["flagged"] else " "
+        rule = f" [{row['rule_applied']}]" if row["rule_applied"] else ""
+        lines.append(f"{flag} {row['date'] or '----------'} {row['source_file']} {row['edit_id']}"
+                     f" ({row['editor_type']}, {row['style']}){rule}")
+        lines.append(f"    - {(row['original'] or '')[:100]}")
+        lines.append(f"    + {(row['edited'] or '')[:100]}")
+        if row["reason"]:
+            lines.append(f"    why: {row['reason'][:100]}")
+    lines.append(f"\n{len(rows)} edit(s)")
+    return "\n".join(lines)
+
+
+def report(conn: sqlite3.Connection, fmt: str = "table", limit: int | None = 50, **filters) -> str:
+    """Run query() and render the result as table, json or count text.
+
+    Raises sqlite3.OperationalError for a malformed `text` query.
+    """
+    if fmt == "count":
+        return str(query(conn, count=True, **filters))
+    rows = query(conn, limit=limit, **filters)
+    if fmt == "json":
+        return json.dumps([dict(row) for row in rows], indent=2, ensure_ascii=False)
+    return _format_table(rows)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Ingest and query the edit corpus store.")
+    parser.add_argument("--db", type=Path, default=DEFAULT_DB, help="SQLite store path")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p_ingest = sub.add_parser("ingest", help="Load new or changed corpus files")
+    p_ingest.add_argument("--full", action="store_true", help="Re-ingest every file")
+
+    p_query = sub.add_parser("query", help="Filter edits")
+    p_query.add_argument("--style")
+    p_query.add_argument("--rule", help="rule_applied, e.g. blog.md#voice-active")
+    p_query.add_argument("--editor", choices=["human", "agent"])
+    p_query.add_argument("--flagged", action="store_true", default=None)
+    p_query.add_argument("--source", help="Glob on source_file, e.g. 'posts/*whitepaper*'")
+    p_query.add_argument("--since", help="YYYY-MM-DD")
+    p_query.add_argument("--until", help="YYYY-MM-DD")
+    p_query.add_argument("--text", help="Full-text query (FTS5 syntax)")
+    p_query.add_argument("--limit", type=int, default=50)
+    p_query.add_argument("--format", choices=REPORT_FORMATS, default="table")
+    args = parser.parse_args()
+
+    conn = connect(args.db)
+    if args.command == "ingest":
+        stats = ingest(conn, full=args.full)
+        print(f"Ingested {stats['ingested']} file(s) ({stats['edits']} edits), "
+              f"skipped {stats['skipped']} unchanged, removed {stats['removed']}")
+        return
+
+    filters = dict(
+        style=args.style, rule=args.rule, editor_type=args.editor, flagged=args.flagged,
+        source=args.source, since=args.since, until=args.until, text=args.text,
+    )
+    try:
+        print(report(conn, args.format, args.limit, **filters))
+    except sqlite3.OperationalError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,386 @@
+#!/usr/bin/env python3
+"""
+Extract candidate style rules from flagged edits with batched model calls.
+
+Flagged edits are read from the edit store, grouped by (style, rule_applied)
+and clustered locally within each group: near-duplicate edits (trigram Dice
+similarity of their original and edited text) join the same cluster, so the
+model sees one cluster of forty "utilize → use" edits instead of forty edits.
+
+Each cluster is identified by a hash of its members. Clusters with a cached
+result (edits/.cache/rules/<hash>.json) are not sent again; the rest are
+rendered compactly (a few representative examples each), packed into batches
+of about --batch-tokens, and sent concurrently until the --token-budget for
+the run is spent. Clusters over budget are deferred to the next run. A
+cluster whose edits change gets a new hash and is re-extracted.
+
+Results are written in the distilled-rules shape (ADR-0013) for review.
+
+Usage:
+ python scripts/extract_rules.py [--db PATH] [--no-ingest] [--style S]
+     [--token-budget N] [--batch-tokens N] [--workers N] [--dry-run]
+     [--output edits/extracted-rules.yaml]
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import sys
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from functools import cached_property
+from pathlib import Path
+
+if __package__ in (None, ""):
+    # Run as `python scripts/extract_rules.py`: make the scripts package importable
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from scripts.edit_io import dump_yaml  # noqa: E402
+from scripts.edit_matching import dice, normalize, trigrams  # noqa: E402
+from scripts.edit_store import DEFAULT_DB, connect, ingest, query  # noqa: E402
+
+CACHE_DIR = Path("edits/.cache/rules")
+
+# Bump when the prompt or response shape changes; it is part of every cluster hash
+PROMPT_VERSION = 1
+
+# Minimum similarity for an edit to join a cluster
+CLUSTER_SIMILARITY = 0.6
+
+# Examples rendered per cluster and characters kept per example field
+MAX_EXAMPLES = 3
+MAX_EXAMPLE_CHARS = 200
+
+# Rough chars-per-token ratio for budgeting (no tokenizer dependency)
+CHARS_PER_TOKEN = 4
+
+# Estimated prompt overhead per call (system prompt and framing)
+CALL_OVERHEAD_TOKENS = 300
+
+
+@dataclass
+class Cluster:
+    """Near-duplicate flagged edits within one (style, rule_applied) group."""
+
+    style: str | None
+    rule: str | None
+    edits: list[dict] = field(default_factory=list)
+    # Leader's trigrams, used while clustering
+    original_grams: set[str] = field(default_factory=set, repr=False)
+    edited_grams: set[str] = field(default_factory=set, repr=False)
+
+    @cached_property
+    def key(self) -> str:
+        """Stable hash of the group and its members; changes when any member changes."""
+        digest = hashlib.sha256(f"v{PROMPT_VERSION}\0{self.style}\0{self.rule}".encode())
+        for member in sorted(_member_key(e) for e in self.edits):
+            digest.update(b"\0" + member.encode())
+        return digest.hexdigest()[:16]
+
+    def examples(self) -> list[dict]:
+        """Up to MAX_EXAMPLES distinct edits, most common first."""
+        counts = Counter((normalize(e["original"]), normalize(e["edited"])) for e in self.edits)
+        seen, examples = set(), []
+        for edit in sorted(self.edits, key=lambda e: -counts[
+            (normalize(e["original"]), normalize(e["edited"]))
+        ]):
+            pair = (normalize(edit["original"]), normalize(edit["edited"]))
+            if pair not in seen:
+                seen.add(pair)
+                examples.append(edit)
+            if len(examples) == MAX_EXAMPLES:
+                break
+        return examples
+
+
+def _member_key(edit: dict) -> str:
+    return "\0".join(str(edit.get(k) or "") for k in (
+        "source_file", "edit_id", "original", "edited", "reason",
+    ))
+
+
+def _age_key(edit: dict) -> tuple[str, str, str]:
+    return tuple(str(edit.get(k) or "") for k in ("date", "source_file", "edit_id"))
+
+
+def _changed_core(original: str | None, edited: str | None) -> tuple[str, str]:
+    """Both sides with their shared leading and trailing words removed."""
+    a, b = normalize(original).split(), normalize(edited).split()
+    start = 0
+    while start < len(a) and start < len(b) and a[start] == b[start]:
+        start += 1
+    end = 0
+    while end < len(a) - start and end < len(b) - start and a[-1 - end] == b[-1 - end]:
+        end += 1
+    return " ".join(a[start:len(a) - end]), " ".join(b[start:len(b) - end])
+
+
+def cluster_edits(edits: list[dict], similarity: float = CLUSTER_SIMILARITY) -> list[Cluster]:
+    """
+    Group edits by (style, rule_applied), then cluster near-duplicates in each group.
+
+    Edits are compared on what changed (shared leading/trailing words trimmed),
+    so "We utilize X" → "We use X" and "Teams utilize Y" → "Teams use Y" meet.
+    Leader clustering: an edit joins the most similar cluster leader that
+    shares a trigram with it (found through a posting list, not a scan of all
+    leaders) if the similarity reaches `similarity`, else it starts a cluster.
+
+    Edits are visited oldest first, so an existing cluster keeps its leader
+    and its members (and so its cached key) when newer edits arrive.
+    """
+    groups: dict[tuple, list[dict]] = {}
+    for edit in sorted(edits, key=_age_key):
+        groups.setdefault((edit.get("style"), edit.get("rule_applied")), []).append(edit)
+
+    clusters: list[Cluster] = []
+    for (style, rule), members in groups.items():
+        leaders: list[Cluster] = []
+        postings: dict[str, list[int]] = {}
+        for edit in members:
+            core_original, core_edited = _changed_core(edit.get("original"), edit.get("edited"))
+            original, edited = trigrams(core_original), trigrams(core_edited)
+            shared = Counter()
+            for gram in original | edited:
+                shared.update(postings.get(gram, ()))
+            best, best_score = None, similarity
+            for c, _ in shared.most_common(20):
+                leader = leaders[c]
+                # Both sides must be alike: "very" → "" and "really" → "" are different rules
+                score = min(dice(original, leader.original_grams),
+                            dice(edited, leader.edited_grams))
+                if score >= best_score:
+                    best, best_score = leader, score
+            if best is None:
+                best = Cluster(style, rule, original_grams=original, edited_grams=edited)
+                for gram in original | edited:
+                    postings.setdefault(gram, []).append(len(leaders))
+                leaders.append(best)
+            best.edits.append(edit)
+        clusters.extend(leaders)
+    return sorted(clusters, key=lambda c: -len(c.edits))
+
+
+def _clip(text: str | None) -> str:
+    text = normalize(text)
+    return text if len(text) <= MAX_EXAMPLE_CHARS else text[:MAX_EXAMPLE_CHARS - 1] + "…"
+
+
+def render_cluster(cluster: Cluster) -> str:
+    lines = [
+        f"## Cluster {cluster.key}",
+        f"style: {cluster.style or 'any'} | rule: {cluster.rule or 'none'} | "
+        f"edits: {len(cluster.edits)}",
+    ]
+    for edit in cluster.examples():
+        reason = f" (reason: {_clip(edit.get('reason'))})" if edit.get("reason") else ""
+        lines.append(f'- "{_clip(edit["original"])}" → "{_clip(edit["edited"])}"{reason}')
+    return "\n".join(lines)
+
+
+def estimate_tokens(text: str) -> int:
+    return len(text) // CHARS_PER_TOKEN + 1
+
+
+def plan_batches(clusters: list[Cluster], batch_tokens: int,
+                 token_budget: int) -> tuple[list[list[tuple[Cluster, str]]], list[Cluster]]:
+    """Pack rendered clusters into batches under the per-batch and whole-run token limits.
+
+    Returns (batches of (cluster, rendered text), deferred clusters).
+    """
+    batches: list[list[tuple[Cluster, str]]] = []
+    deferred: list[Cluster] = []
+    spent = 0
+    current: list[tuple[Cluster, str]] = []
+    current_tokens = 0
+    for cluster in clusters:
+        text = render_cluster(cluster)
+        tokens = estimate_tokens(text)
+        if current and current_tokens + tokens > batch_tokens:
+            batches.append(current)
+            current, current_tokens = [], 0
+        cost = tokens + (CALL_OVERHEAD_TOKENS if not current else 0)
+        if spent + cost > token_budget:
+            deferred.append(cluster)
+            continue
+        spent += cost
+        current.append((cluster, text))
+        current_tokens += tokens
+    if current:
+        batches.append(current)
+    return batches, deferred
+
+
+def parse_response(text: str) -> dict[str, dict]:
+    """Rules keyed by cluster id from a JSON array response (tolerates surrounding prose)."""
+    match = re.search(r"\[.*\]", text, re.DOTALL)
+    if not match:
+        return {}
+    try:
+        items = json.loads(match.group())
+    except json.JSONDecodeError:
+        return {}
+    rules = {}
+    for item in items if isinstance(items, list) else []:
+        if isinstance(item, dict) and item.get("cluster") and item.get("statement"):
+            rules[str(item["cluster"])] = item
+    return rules
+
+
+class RuleCache:
+    """One JSON file per cluster hash."""
+
+    def __init__(self, cache_dir: Path = CACHE_DIR):
+        self.cache_dir = Path(cache_dir)
+
+    def get(self, key: str) -> dict | None:
+        path = self.cache_dir / f"{key}.json"
+        try:
+            return json.loads(path.read_text())
+        except (OSError, json.JSONDecodeError):
+            return None
+
+    def put(self, key: str, rule: dict):
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        path = self.cache_dir / f"{key}.json"
+        tmp_path = path.with_name(f".{path.name}.tmp")
+        tmp_path.write_text(json.dumps(rule, ensure_ascii=False, indent=2))
+        os.replace(tmp_path, path)
+
+
+def extract_rules(clusters: list[Cluster], complete, cache: RuleCache,
+                  batch_tokens: int = 3000, token_budget: int = 50_000,
+                  workers: int = 4) -> dict:
+    """
+    Extract a rule for every cluster not already cached.
+
+    `complete(batch_text) -> response_text` performs one model call. Returns
+    {"rules": {cluster key: rule}, "cached", "extracted", "deferred", "failed",
+    "batches"}, with failed and deferred counted in clusters.
+    """
+    rules: dict[str, dict] = {}
+    pending = []
+    for cluster in clusters:
+        cached = cache.get(cluster.key)
+        if cached:
+            rules[cluster.key] = cached
+        else:
+            pending.append(cluster)
+    n_cached = len(rules)
+
+    batches, deferred = plan_batches(pending, batch_tokens, token_budget)
+
+    def run(batch: list[tuple[Cluster, str]]) -> dict[str, dict] | None:
+        try:
+            return parse_response(complete("\n\n".join(text for _, text in batch)))
+        except Exception as e:  # one failed batch must not lose the others
+            print(f"Warning: batch of {len(batch)} cluster(s) failed: {e}", file=sys.stderr)
+            return None
+
+    failed = 0
+    extracted_at = datetime.now(UTC).isoformat()
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for batch, response in zip(batches, pool.map(run, batches)):
+            for cluster, _ in batch:
+                item = (response or {}).get(cluster.key)
+                if not item:
+                    failed += 1  # not cached, so retried next run
+                    continue
+                rule = {
+                    "statement": str(item["statement"]).strip(),
+                    "confidence": item.get("confidence") if item.get("confidence") in (
+                        "high", "medium", "low") else "low",
+                    "scope": "global" if item.get("scope") == "global" else "style-specific",
+                    "extracted_at": extracted_at,
+                }
+                cache.put(cluster.key, rule)
+                rules[cluster.key] = rule
+
+    return {
+        "rules": rules,
+        "cached": n_cached,
+        "extracted": len(rules) - n_cached,
+        "deferred": len(deferred),
+        "failed": failed,
+        "batches": len(batches),
+    }
+
+
+def to_distilled(clusters: list[Cluster], rules: dict[str, dict]) -> list[dict]:
+    """Rules for the extracted clusters in the distilled-rules shape, largest cluster first."""
+    distilled = []
+    for cluster in clusters:
+        rule = rules.get(cluster.key)
+        if not rule:
+            continue
+        global_scope = rule["scope"] == "global" or not cluster.style
+        distilled.append({
+            "id": f"rule-{len(distilled) + 1:03d}",
+            "statement": rule["statement"],
+            "style": None if global_scope else cluster.style,
+            "scope": "global" if global_scope else "style-specific",
+            "frequency": len(cluster.edits),
+            "confidence": rule["confidence"],
+            "status": "candidate",
+            "source_edits": [f"{e['source_file']}#{e['edit_id']}" for e in cluster.edits[:10]],
+            "flagged": True,
+            "rule_applied": cluster.rule,
+            "cluster": cluster.key,
+        })
+    return distilled
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Extract style rules from flagged edits.")
+    parser.add_argument("--db", type=Path, default=DEFAULT_DB,
+                        help="Edit store (see edit_store.py)")
+    parser.add_argument("--no-ingest", action="store_true",
+                        help="Use the store as-is without ingesting new corpus files first")
+    parser.add_argument("--style", default=None, help="Only flagged edits of this style")
+    parser.add_argument("--token-budget", type=int, default=50_000,
+                        help="Estimated input tokens to spend this run")
+    parser.add_argument("--batch-tokens", type=int, default=3000,
+                        help="Estimated input tokens per model call")
+    parser.add_argument("--workers", type=int, default=4, help="Concurrent model calls")
+    parser.add_argument("--dry-run", action="store_true",
+                        help="Plan batches and report the token estimate without calling the model")
+    parser.add_argument("--output", type=Path, default=Path("edits/extracted-rules.yaml"))
+    args = parser.parse_args()
+
+    conn = connect(args.db)
+    if not args.no_ingest:
+        ingest(conn)
+    edits = [dict(row) for row in query(conn, style=args.style, flagged=True, limit=None)]
+    clusters = cluster_edits(edits)
+    cache = RuleCache()
+    print(f"{len(edits)} flagged edit(s) in {len(clusters)} cluster(s)")
+
+    if args.dry_run:
+        pending = [c for c in clusters if cache.get(c.key) is None]
+        batches, deferred = plan_batches(pending, args.batch_tokens, args.token_budget)
+        tokens = sum(estimate_tokens(t) for b in batches for _, t in b)
+        tokens += CALL_OVERHEAD_TOKENS * len(batches)
+        print(f"{len(clusters) - len(pending)} cached; {len(pending) - len(deferred)} cluster(s) "
+              f"in {len(batches)} batch(es), ~{tokens} input tokens; {len(deferred)} deferred")
+        return
+
+    from agents.rules import RuleExtractionAgent
+
+    agent = RuleExtractionAgent()
+    result = extract_rules(clusters, agent.extract, cache, args.batch_tokens,
+                           args.token_budget, args.workers)
+    print(f"{result['cached']} cached, {result['extracted']} extracted in "
+          f"{result['batches']} batch(es), {result['deferred']} deferred, "
+          f"{result['failed']} failed")
+
+    distilled = to_distilled(clusters, result["rules"])
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(dump_yaml({"rules": distilled}))
+    print(f"{len(distilled)} rule(s) written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,375 @@
+#!/usr/bin/env python3
+"""
+Mine edits from the whole git history of the content files.
+
+Streams `git log -p --reverse --first-parent` over the content pathspecs and
+follows every file from its [ai-draft] commit onwards: a commit tagged
+[ai-draft] sets (or resets) the file's baseline, and each later commit that
+touches the file is diffed against the file's previous version and written
+as one small corpus file, edits/history/<date>-<key>-<sha>.yaml (the key
+is sidecar_log.file_key, as for capture_edits.py), as soon as the commit has
+been parsed.
+
+Memory stays bounded by the text of the baselined files plus one file diff:
+file versions are rebuilt by applying each patch to the previous version, not
+by holding history. Files that were never AI-drafted are not tracked at all;
+when a commit drafts one, its text at that commit is read from git.
+
+Progress is checkpointed (edits/history/.checkpoint.json): the last processed
+commit and each tracked file's baseline. A rerun resumes with
+`git log <last>..HEAD`, so the first run backfills and later runs only add
+new commits.
+
+Usage:
+ python scripts/mine_history.py [--restart] [--max-commits N] [--output-dir edits/history]
+"""
+
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from pathlib import Path
+
+if __package__ in (None, ""):
+    # Run as `python scripts/mine_history.py`: make the scripts package importable
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from scripts.edit_io import write_document  # noqa: E402
+from scripts.sentence_index import SentenceIndex  # noqa: E402
+from scripts.sidecar_log import file_key  # noqa: E402
+from scripts.text_diff import diff_texts  # noqa: E402
+
+OUTPUT_DIR = Path("edits/history")
+CHECKPOINT_NAME = ".checkpoint.json"
+
+# Same tag and content pathspecs as capture_edits.py
+AI_DRAFT_TAG = "[ai-draft]"
+PATHSPECS = ("*.md", "*.mdx")
+
+# Save the checkpoint after this many commits (and always at the end)
+CHECKPOINT_EVERY = 50
+
+_COMMIT_START = "\x1e"
+_FIELD_SEP = "\x1f"
+_HUNK = re.compile(r"^@@ -(\d+)(?:,(\d+))? \+(\d+)(?:,(\d+))? @@")
+
+
+@dataclass
+class FileDiff:
+    """One file's change within a commit, as parsed from the patch."""
+
+    old_path: str | None
+    new_path: str | None
+    hunks: list[tuple[int, int, list[str]]] = field(default_factory=list)  # (start, count, lines)
+    binary: bool = False
+    deleted: bool = False
+
+
+@dataclass
+class Commit:
+    sha: str
+    date: str
+    subject: str
+    files: list[FileDiff] = field(default_factory=list)
+
+    @property
+    def ai_draft(self) -> bool:
+        return AI_DRAFT_TAG in self.subject
+
+
+def _unquote(path: str) -> str | None:
+    """Path from a ---/+++ line (None for /dev/null), without the a/ or b/ prefix."""
+    path = path.rstrip("\t")
+    if path == "/dev/null":
+        return None
+    if path.startswith('"') and path.endswith('"'):
+        path = path[1:-1].encode("latin-1", "backslashreplace").decode("unicode_escape")
+        path = path.encode("latin-1").decode("utf-8", errors="replace")
+    return path[2:] if path[:2] in ("a/", "b/") else path
+
+
+def parse_log(lines: Iterator[str]) -> Iterator[Commit]:
+    """
+    Commits from `git log -p` output formatted as \\x1e<sha>\\x1f<date>\\x1f<subject>.
+
+    Yields each commit once its patch has been read; only one commit is held.
+    """
+    commit: Commit | None = None
+    current: FileDiff | None = None
+    hunk_lines: list[str] | None = None
+    for raw in lines:
+        line = raw.rstrip("\n")
+        if line.startswith(_COMMIT_START):
+            if commit:
+                yield commit
+            sha, date, subject = (line[1:].split(_FIELD_SEP) + ["", ""])[:3]
+            commit, current, hunk_lines = Commit(sha, date, subject), None, None
+            continue
+        if commit is None:
+            continue
+        if line.startswith("diff --git "):
+            current, hunk_lines = FileDiff(None, None), None
+            commit.files.append(current)
+            continue
+        if current is None:
+            continue
+        if hunk_lines is not None and line[:1] in (" ", "-", "+", "\\"):
+            if not line.startswith("\\"):  # "\ No newline at end of file"
+                hunk_lines.append(line)
+            continue
+        if line.startswith("@@"):
+            match = _HUNK.match(line)
+            if match:
+                start, count = int(match.group(1)), int(match.group(2) or 1)
+                hunk_lines = []
+                current.hunks.append((start, count, hunk_lines))
+            continue
+        hunk_lines = None
+        if line.startswith("--- "):
+            current.old_path = _unquote(line[4:])
+        elif line.startswith("+++ "):
+            current.new_path = _unquote(line[4:])
+        elif line.startswith("rename from "):
+            current.old_path = line[len("rename from "):]
+        elif line.startswith("rename to "):
+            current.new_path = line[len("rename to "):]
+        elif line.startswith("deleted file mode"):
+            current.deleted = True
+        elif line.startswith("Binary files "):
+            current.binary = True
+    if commit:
+        yield commit
+
+
+def apply_hunks(old_text: str, hunks: list[tuple[int, int, list[str]]]) -> str | None:
+    """New text from the old text and a file's hunks, or None if the context doesn't match."""
+    old = old_text.split("\n") if old_text else []
+    if old and old[-1] == "":
+        old.pop()  # trailing newline; line endings aren't edits
+    out: list[str] = []
+    pos = 0
+    for start, count, lines in hunks:
+        index = start - 1 if count else start  # a pure insertion starts after line `start`
+        if index < pos or index + count > len(old):
+            return None
+        out.extend(old[pos:index])
+        expected = [ln[1:] for ln in lines if ln[0] in (" ", "-")]
+        if old[index:index + count] != expected:
+            return None
+        out.extend(ln[1:] for ln in lines if ln[0] in (" ", "+"))
+        pos = index + count
+    out.extend(old[pos:])
+    return "\n".join(out) + "\n" if out else ""
+
+
+def edit_records(original: str, edited: str) -> list[dict]:
+    """Edit entries (corpus shape) between two versions of a file."""
+    original_index = SentenceIndex.from_text(original)
+    edited_index = SentenceIndex.from_text(edited)
+    edits = []
+    for n, change in enumerate(diff_texts(original, edited, original_index, edited_index), 1):
+        orig_context = original_index.context_at(change.orig_start)
+        edit_context = edited_index.context_at(change.edit_start)
+        edits.append({
+            "id": f"edit-{n:03d}",
+            "original": change.original.strip(),
+            "edited": change.edited.strip(),
+            "sentence_before": orig_context["sentence_before"],
+            "full_sentence_original": orig_context["full_sentence"],
+            "full_sentence_edited": edit_context["full_sentence"],
+            "line_number": original_index.line_at(change.orig_start),
+            "change_type": change.kind,
+            "original_span": [change.orig_start, change.orig_end],
+            "edited_span": [change.edit_start, change.edit_end],
+            "reason": None,
+            "rule_applied": None,
+            "editor_type": "human",
+            "style": None,
+            "flagged": False,
+            "timestamp": None,
+        })
+    return edits
+
+
+class BlobReader:
+    """File contents at a commit through one long-lived `git cat-file --batch`."""
+
+    def __init__(self, repo: Path):
+        self._proc = subprocess.Popen(
+            ["git", "cat-file", "--batch"], cwd=repo,
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+        )
+
+    def read(self, commit: str, path: str) -> str | None:
+        self._proc.stdin.write(f"{commit}:{path}\n".encode())
+        self._proc.stdin.flush()
+        header = self._proc.stdout.readline().split()
+        if len(header) != 3 or header[1] != b"blob":
+            return None
+        data = self._proc.stdout.read(int(header[2]))
+        self._proc.stdout.read(1)  # trailing newline after the content
+        return data.decode("utf-8", errors="replace")
+
+    def close(self):
+        self._proc.stdin.close()
+        self._proc.wait()
+
+
+class HistoryMiner:
+    """Follows baselined content files through history and writes per-commit corpora."""
+
+    def __init__(self, repo: Path = Path("."), output_dir: Path = OUTPUT_DIR):
+        self.repo = Path(repo)
+        self.output_dir = Path(output_dir)
+        self.checkpoint_path = self.output_dir / CHECKPOINT_NAME
+        self.last_commit: str | None = None
+        self.baselines: dict[str, str] = {}  # path -> ai-draft commit
+        self.texts: dict[str, str] = {}  # path -> current text of baselined files
+        self.stats = {"commits": 0, "corpora": 0, "edits": 0, "resynced": 0}
+
+    def load_checkpoint(self, blobs: BlobReader) -> bool:
+        """Restore state from the checkpoint; False when starting from the first commit."""
+        try:
+            state = json.loads(self.checkpoint_path.read_text())
+        except (OSError, json.JSONDecodeError):
+            return False
+        last = state.get("commit")
+        ancestor = last and subprocess.run(
+            ["git", "merge-base", "--is-ancestor", last, "HEAD"], cwd=self.repo,
+            capture_output=True,
+        ).returncode == 0
+        if not ancestor:
+            print(f"Checkpoint commit {last} is not in HEAD's history; starting over",
+                  file=sys.stderr)
+            return False
+        self.last_commit = last
+        for path, baseline in state.get("baselines", {}).items():
+            text = blobs.read(last, path)
+            if text is not None:
+                self.baselines[path], self.texts[path] = baseline, text
+        return True
+
+    def save_checkpoint(self):
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.checkpoint_path.with_name(f".{CHECKPOINT_NAME}.tmp")
+        tmp_path.write_text(json.dumps(
+            {"commit": self.last_commit, "baselines": self.baselines}, indent=2
+        ))
+        os.replace(tmp_path, self.checkpoint_path)
+
+    def _log(self) -> subprocess.Popen:
+        cmd = [
+            "git", "-c", "core.quotePath=false", "log", "-p", "--reverse", "--first-parent",
+            "--diff-merges=first-parent", "-M", "--no-color", "--no-ext-diff",
+            f"--format={_COMMIT_START}%H{_FIELD_SEP}%aI{_FIELD_SEP}%s",
+        ]
+        if self.last_commit:
+            cmd.append(f"{self.last_commit}..HEAD")
+        cmd += ["--", *PATHSPECS]
+        return subprocess.Popen(
+            cmd, cwd=self.repo, stdout=subprocess.PIPE, text=True, errors="replace",
+        )
+
+    def run(self, restart: bool = False, max_commits: int | None = None) -> dict:
+        blobs = BlobReader(self.repo)
+        try:
+            if not restart:
+                self.load_checkpoint(blobs)
+            log = self._log()
+            try:
+                for commit in parse_log(log.stdout):
+                    self.process(commit, blobs)
+                    self.last_commit = commit.sha
+                    self.stats["commits"] += 1
+                    if self.stats["commits"] % CHECKPOINT_EVERY == 0:
+                        self.save_checkpoint()
+                    if max_commits and self.stats["commits"] >= max_commits:
+                        break
+            finally:
+                log.stdout.close()
+                log.terminate()
+                log.wait()
+            if self.last_commit:
+                self.save_checkpoint()
+        finally:
+            blobs.close()
+        return self.stats
+
+    def process(self, commit: Commit, blobs: BlobReader):
+        """Advance tracked files through one commit, emitting edits for human commits."""
+        for diff in commit.files:
+            if diff.binary:
+                continue
+            old_path, new_path = diff.old_path, diff.new_path
+            if diff.deleted:
+                self.baselines.pop(old_path, None)
+                self.texts.pop(old_path, None)
+                continue
+            if new_path is None:
+                continue  # mode-only change
+            if old_path and old_path != new_path and old_path in self.baselines:
+                self.baselines[new_path] = self.baselines.pop(old_path)
+                self.texts[new_path] = self.texts.pop(old_path)
+
+            if commit.ai_draft:
+                text = blobs.read(commit.sha, new_path)
+                if text is not None:
+                    self.baselines[new_path], self.texts[new_path] = commit.sha, text
+                continue
+            if new_path not in self.baselines:
+                continue
+
+            previous = self.texts[new_path]
+            text = apply_hunks(previous, diff.hunks)
+            if text is None:
+                # Patch didn't apply (e.g. line-ending conversion); read the real version
+                text = blobs.read(commit.sha, new_path) or ""
+                self.stats["resynced"] += 1
+            self.texts[new_path] = text
+            edits = edit_records(previous, text)
+            if edits:
+                self._write(commit, new_path, edits)
+
+    def _write(self, commit: Commit, path: str, edits: list[dict]):
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        corpus = {
+            "source_file": path,
+            "ai_draft_commit": self.baselines[path],
+            "commit": commit.sha,
+            "captured_at": commit.date,
+            "editor_type": "human",
+            "style": None,
+            "session_reason": commit.subject,
+            "edits": edits,
+        }
+        # Same per-file key as capture_edits.py: posts share stems (draft.md, final.md)
+        name = f"{commit.date[:10]}-{file_key(self.repo / path)}-{commit.sha[:7]}.yaml"
+        write_document(self.output_dir / name, corpus)
+        self.stats["corpora"] += 1
+        self.stats["edits"] += len(edits)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Mine edits from the content files' git history.")
+    parser.add_argument("--restart", action="store_true",
+                        help="Ignore the checkpoint and mine from the first commit")
+    parser.add_argument("--max-commits", type=int, default=None,
+                        help="Stop after this many commits (resume later from the checkpoint)")
+    parser.add_argument("--output-dir", type=Path, default=OUTPUT_DIR)
+    args = parser.parse_args()
+
+    miner = HistoryMiner(Path("."), args.output_dir)
+    stats = miner.run(restart=args.restart, max_commits=args.max_commits)
+    print(f"Processed {stats['commits']} commit(s): {stats['edits']} edit(s) in "
+          f"{stats['corpora']} corpus file(s) under {args.output_dir}; "
+          f"tracking {len(miner.baselines)} file(s)")
+    if stats["resynced"]:
+        print(f"{stats['resynced']} patch(es) re-read from git after a context mismatch")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,279 @@
+#!/usr/bin/env python3
+"""
+Mine candidate style rules from the edit corpus.
+
+Each (original, edited) pair is tokenized and aligned at word level; every
+changed region of up to MAX_NGRAM tokens becomes a pattern `lhs → rhs`:
+substitutions ("utilize" → "use"), deletions ("very" → ∅) and insertions,
+which are anchored on the preceding token so they have a left-hand side.
+
+Counting is vectorized: token n-grams are packed into int64 keys and
+aggregated with NumPy (np.unique / np.bincount) into per-pattern frequency,
+per-editor and per-style counts, flagged counts and consistency (of all
+changes of the same kind to the same lhs, the share that chose this rhs). Candidates are
+ranked and written in the distilled-rules shape from ADR-0013 so they can be
+reviewed and promoted into style guides.
+
+Usage:
+ python scripts/mine_rules.py [--db PATH] [--no-ingest] [--min-frequency N]
+     [--style S] [--top N] [--output edits/rule-candidates.yaml]
+"""
+
+import argparse
+import re
+import sqlite3
+import sys
+from pathlib import Path
+
+import numpy as np
+
+if __package__ in (None, ""):
+    # Run as `python scripts/mine_rules.py`: make the scripts package importable
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from scripts.edit_io import dump_yaml  # noqa: E402
+from scripts.edit_store import DEFAULT_DB, connect, ingest  # noqa: E402
+from scripts.text_diff import diff_sequences  # noqa: E402
+
+# Longest token run on either side of a pattern; longer rewrites aren't rule-like
+MAX_NGRAM = 3
+
+# Bits per token id when packing an n-gram into an int64 key
+_TOKEN_BITS = 21
+_MAX_VOCAB = (1 << _TOKEN_BITS) - 1
+
+_TOKEN = re.compile(r"\w+(?:['’]\w+)*|[^\w\s]")
+
+EDITORS = ("human", "agent")
+KINDS = ("substitution", "deletion", "insertion")
+
+
+def tokenize(text: str | None) -> list[str]:
+    return _TOKEN.findall((text or "").lower())
+
+
+class _Vocab:
+    """Token ↔ id mapping; id 0 is reserved for "no token"."""
+
+    def __init__(self):
+        self.ids: dict[str, int] = {}
+        self.tokens: list[str] = [""]
+
+    def key(self, tokens: list[str]) -> int:
+        """Pack up to MAX_NGRAM tokens into one int64 key."""
+        key = 0
+        for token in tokens:
+            tid = self.ids.get(token)
+            if tid is None:
+                if len(self.tokens) > _MAX_VOCAB:
+                    raise ValueError("vocabulary too large to pack into int64 keys")
+                tid = self.ids[token] = len(self.tokens)
+                self.tokens.append(token)
+            key = (key << _TOKEN_BITS) | tid
+        return key
+
+    def text(self, key: int) -> str:
+        tokens = []
+        while key:
+            tokens.append(self.tokens[key & _MAX_VOCAB])
+            key >>= _TOKEN_BITS
+        return _detokenize(tokens[::-1])
+
+
+def _detokenize(tokens: list[str]) -> str:
+    text = " ".join(tokens)
+    return re.sub(r" ([^\w\s])", r"\1", text)
+
+
+def extract_patterns(original: str | None, edited: str | None) -> list[tuple[int, list, list]]:
+    """(kind index, lhs tokens, rhs tokens) for each short changed region of one edit."""
+    a, b = tokenize(original), tokenize(edited)
+    if a == b:
+        return []
+
+    # Trim the shared prefix/suffix; most edits then reduce to one short region
+    start = 0
+    while start < len(a) and start < len(b) and a[start] == b[start]:
+        start += 1
+    end = 0
+    while end < len(a) - start and end < len(b) - start and a[-1 - end] == b[-1 - end]:
+        end += 1
+    if len(a) - start - end <= MAX_NGRAM and len(b) - start - end <= MAX_NGRAM:
+        regions = [(start, len(a) - end, start, len(b) - end)]
+    else:
+        regions = [
+            (i1, i2, j1, j2) for tag, i1, i2, j1, j2 in diff_sequences(a, b) if tag != "equal"
+        ]
+
+    patterns = []
+    for i1, i2, j1, j2 in regions:
+        if i2 - i1 > MAX_NGRAM or j2 - j1 > MAX_NGRAM:
+            continue
+        if i1 == i2:
+            # Insertion: anchor on the preceding token (skip if inserted at the very start)
+            if i1 == 0 or j2 - j1 + 1 > MAX_NGRAM:
+                continue
+            patterns.append((2, a[i1 - 1:i1], [a[i1 - 1], *b[j1:j2]]))
+        elif j1 == j2:
+            patterns.append((1, a[i1:i2], []))
+        else:
+            patterns.append((0, a[i1:i2], b[j1:j2]))
+    return patterns
+
+
+def load_edits(conn: sqlite3.Connection, style: str | None = None) -> list[sqlite3.Row]:
+    sql = (
+        "SELECT original, edited, editor_type, style, flagged, source_file, edit_id "
+        "FROM edits"
+    )
+    if style:
+        return conn.execute(sql + " WHERE style = ?", (style,)).fetchall()
+    return conn.execute(sql).fetchall()
+
+
+def mine(edits: list, min_frequency: int = 2) -> list[dict]:
+    """
+    Aggregate patterns across edits and return ranked rule candidates.
+
+    `edits` rows need original, edited, editor_type, style, flagged,
+    source_file and edit_id (sqlite3.Row or dict).
+    """
+    vocab = _Vocab()
+    styles: dict[str | None, int] = {}
+    lhs_keys, rhs_keys, kinds, editors, style_ids, flagged, rows = [], [], [], [], [], [], []
+    for n, edit in enumerate(edits):
+        found = extract_patterns(edit["original"], edit["edited"])
+        if not found:
+            continue
+        editor = 1 if edit["editor_type"] == "agent" else 0
+        style = styles.setdefault(edit["style"], len(styles))
+        for kind, lhs, rhs in found:
+            lhs_keys.append(vocab.key(lhs))
+            rhs_keys.append(vocab.key(rhs))
+            kinds.append(kind)
+            editors.append(editor)
+            style_ids.append(style)
+            flagged.append(1 if edit["flagged"] else 0)
+            rows.append(n)
+    if not lhs_keys:
+        return []
+
+    keys = np.stack([
+        np.array(lhs_keys, dtype=np.int64),
+        np.array(rhs_keys, dtype=np.int64),
+        np.array(kinds, dtype=np.int64),
+    ], axis=1)
+    patterns, inverse, counts = np.unique(keys, axis=0, return_inverse=True, return_counts=True)
+    inverse = inverse.ravel()
+    n_patterns, n_styles = len(patterns), len(styles)
+
+    by_editor = np.bincount(
+        inverse * len(EDITORS) + np.array(editors), minlength=n_patterns * len(EDITORS)
+    ).reshape(n_patterns, len(EDITORS))
+    by_style = np.bincount(
+        inverse * n_styles + np.array(style_ids), minlength=n_patterns * n_styles
+    ).reshape(n_patterns, n_styles)
+    flagged_counts = np.bincount(inverse, weights=np.array(flagged), minlength=n_patterns)
+
+    # Consistency: share of all changes of this kind to this lhs that produced this rhs.
+    # Kind is part of the group: an insertion's lhs is only its anchor token, so
+    # "the → the new" must not compete with substitutions of "the".
+    _, lhs_group = np.unique(patterns[:, [2, 0]], axis=0, return_inverse=True)
+    lhs_group = lhs_group.ravel()
+    lhs_totals = np.bincount(lhs_group, weights=counts)
+    consistency = counts / lhs_totals[lhs_group]
+
+    both_editors = (by_editor > 0).all(axis=1)
+    score = counts * consistency * (1 + 0.5 * both_editors) * (1 + flagged_counts / counts)
+
+    keep = np.nonzero(counts >= min_frequency)[0]
+    order = keep[np.argsort(-score[keep], kind="stable")]
+
+    # Source edit references for the kept patterns only
+    examples: dict[int, list[str]] = {int(p): [] for p in order}
+    for occurrence in np.nonzero(np.isin(inverse, order))[0]:
+        refs = examples[int(inverse[occurrence])]
+        if len(refs) < 10:
+            edit = edits[rows[occurrence]]
+            refs.append(f"{edit['source_file']}#{edit['edit_id']}")
+
+    style_names = list(styles)
+    candidates = []
+    for rank, p in enumerate(order, 1):
+        lhs, rhs, kind = (int(v) for v in patterns[p])
+        style_counts = {
+            style_names[s]: int(c) for s, c in enumerate(by_style[p]) if c and style_names[s]
+        }
+        top_style = max(style_counts, key=style_counts.get) if style_counts else None
+        specific = top_style is not None and style_counts[top_style] / counts[p] >= 0.8
+        candidates.append({
+            "id": f"cand-{rank:03d}",
+            "statement": _statement(KINDS[kind], vocab.text(lhs), vocab.text(rhs)),
+            "kind": KINDS[kind],
+            "original": vocab.text(lhs),
+            "edited": vocab.text(rhs),
+            "style": top_style if specific else None,
+            "scope": "style-specific" if specific else "global",
+            "frequency": int(counts[p]),
+            "consistency": round(float(consistency[p]), 3),
+            "editors": {e: int(c) for e, c in zip(EDITORS, by_editor[p]) if c},
+            "flagged": int(flagged_counts[p]),
+            "confidence": _confidence(int(counts[p]), float(consistency[p]), bool(both_editors[p])),
+            "status": "candidate",
+            "score": round(float(score[p]), 2),
+            "source_edits": examples[int(p)],
+        })
+    return candidates
+
+
+def _statement(kind: str, original: str, edited: str) -> str:
+    if kind == "substitution":
+        return f'Prefer "{edited}" over "{original}"'
+    if kind == "deletion":
+        return f'Remove "{original}"'
+    return f'Write "{edited}" instead of "{original}" alone'
+
+
+def _confidence(frequency: int, consistency: float, both_editors: bool) -> str:
+    if consistency >= 0.8 and (frequency >= 10 or frequency >= 5 and both_editors):
+        return "high"
+    if frequency >= 3 and consistency >= 0.5:
+        return "medium"
+    return "low"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Mine candidate style rules from captured edits.")
+    parser.add_argument("--db", type=Path, default=DEFAULT_DB,
+                        help="Edit store (see edit_store.py)")
+    parser.add_argument("--no-ingest", action="store_true",
+                        help="Mine the store as-is without ingesting new corpus files first")
+    parser.add_argument("--style", default=None, help="Only mine edits of this style")
+    parser.add_argument("--min-frequency", type=int, default=2)
+    parser.add_argument("--top", type=int, default=25, help="Candidates to print")
+    parser.add_argument("--output", type=Path, default=None,
+                        help="Write all candidates as YAML (distilled-rules shape)")
+    args = parser.parse_args()
+
+    conn = connect(args.db)
+    if not args.no_ingest:
+        ingest(conn)
+    edits = load_edits(conn, args.style)
+    candidates = mine(edits, args.min_frequency)
+
+    print(f"Mined {len(candidates)} candidate rule(s) from {len(edits)} edit(s)\n")
+    for c in candidates[:args.top]:
+        editors = ", ".join(f"{e} {n}" for e, n in c["editors"].items())
+        scope = c["style"] or "global"
+        print(f"{c['id']}  {c['statement']}")
+        print(f"          freq {c['frequency']}  consistency {c['consistency']:.0%}  "
+              f"[{editors}]  flagged {c['flagged']}  {scope}  {c['confidence']}")
+
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(dump_yaml({"rules": candidates}))
+        print(f"\nCandidates written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,286 @@
+#!/usr/bin/env python3
+"""
+Compose targeted resume variants from the bullet corpus (ADR-0012, Part 3).
+
+A BulletIndex is built once from the parsed Jobs, Bullets, SkillMappings and
+SkillTags. Every bullet gets one boolean column per dimension value:
+
+- metric_type, status: from the bullet itself
+- skill: the skills SKILL_MAPPING.md maps to the bullet's job
+- role: the target_roles of those skills (SKILLS_TAXONOMY.md)
+- domain, platform: from the bullet's job (RESUME_CORPUS.md)
+
+plus a highlight column and an inverted word index over the bullet text for
+keywords. A target (see Target) weights dimension values; all targets are
+scored in one matrix product (bullets × features @ features × targets), and
+each target's top bullets are picked under per-job quotas with array ops only.
+
+Usage:
+ python scripts/resume_composer.py targets.yaml [--output variants.yaml]
+
+targets.yaml is a list of targets:
+
+ - name: ai-ml-pm
+   weights:
+     metric_type: {Capability: 3, 0-to-1: 2, Output: 1}
+     domain: {ML/AI: 2, Data Platform: 1}
+     status: {validated: 1, enhanced: 0.5}
+   keywords: {model: 1, inference: 1}
+   highlight: 1.5
+   max_bullets: 16
+   max_per_job: 4
+   min_per_job: 1
+"""
+
+import argparse
+import re
+import sys
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+
+import numpy as np
+
+if __package__ in (None, ""):
+    # Run as `python scripts/resume_composer.py`: make the scripts package importable
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from scripts.edit_io import dump_yaml, load_yaml  # noqa: E402
+from scripts.resume_model import Bullet, Job, SkillMapping, SkillTag  # noqa: E402
+
+DIMENSIONS = ("metric_type", "status", "skill", "role", "domain", "platform")
+
+# Inner "." "-" "/" join a word ("node.js", "real-time", "ml/ai") but trailing
+# punctuation does not; "++" and "#" are kept for c++, c#, f#
+_WORD = re.compile(r"[a-z0-9]+(?:[./-][a-z0-9]+)*(?:\+\+|#)?")
+
+
+def _words(text: str) -> set[str]:
+    words = set()
+    for word in _WORD.findall(text.lower()):
+        words.add(word)
+        if "/" in word:
+            words.update(word.split("/"))  # "ml/ai" also matches "ml" and "ai"
+    return words
+
+
+@dataclass
+class Target:
+    """What a variant is tailored for: weights per dimension value, keywords and quotas."""
+
+    name: str
+    weights: dict[str, dict[str, float]] = field(default_factory=dict)
+    keywords: dict[str, float] = field(default_factory=dict)
+    highlight: float = 1.0
+    max_bullets: int = 12
+    # An int caps every job; a dict caps the listed jobs and leaves the rest out
+    max_per_job: int | dict[str, int] = 4
+    min_per_job: int = 0
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Target":
+        unknown = set(data.get("weights", {})) - set(DIMENSIONS)
+        if unknown:
+            raise ValueError(f"Target {data.get('name')!r}: unknown dimensions {sorted(unknown)}")
+        keywords = data.get("keywords", {})
+        if isinstance(keywords, list):
+            keywords = dict.fromkeys(keywords, 1.0)
+        return cls(**{**data, "keywords": {k.lower(): w for k, w in keywords.items()}})
+
+
+@dataclass
+class Variant:
+    """A composed resume: jobs in display order, each with its chosen bullets."""
+
+    target: str
+    job_order: list[str]
+    selected_bullets: dict[str, list[str]]
+    score: float
+
+    def to_dict(self) -> dict:
+        return {
+            "id": f"variant-{self.target}",
+            "target": self.target,
+            "job_order": self.job_order,
+            "selected_bullets": [
+                {"job_id": job_id, "bullet_ids": self.selected_bullets[job_id]}
+                for job_id in self.job_order
+            ],
+            "score": round(self.score, 3),
+            "created_at": datetime.now(UTC).isoformat(timespec="seconds"),
+        }
+
+
+class BulletIndex:
+    """Per-dimension bitmaps over the bullet corpus, and selection on top of them."""
+
+    def __init__(self, jobs: list[Job], bullets: list[Bullet],
+                 skill_mappings: list[SkillMapping], skill_tags: list[SkillTag]):
+        self.bullets = bullets
+        self.bullet_ids = [b.id for b in bullets]
+        self.job_ids = list(dict.fromkeys([j.id for j in jobs] + [b.job_id for b in bullets]))
+        job_pos = {job_id: i for i, job_id in enumerate(self.job_ids)}
+        self.bullet_job = np.array([job_pos[b.job_id] for b in bullets], dtype=np.int64)
+        self.highlight = np.array([b.is_highlight for b in bullets], dtype=bool)
+
+        # Job-level values, broadcast to bullets through bullet_job
+        roles_of_skill = {t.skill_id: t.target_roles for t in skill_tags}
+        job_values = {
+            dimension: [set() for _ in self.job_ids]
+            for dimension in ("skill", "role", "domain", "platform")
+        }
+        for job in jobs:
+            job_values["domain"][job_pos[job.id]].update(job.domains)
+            job_values["platform"][job_pos[job.id]].update(job.platforms)
+        for mapping in skill_mappings:
+            if mapping.job_id in job_pos:
+                job_values["skill"][job_pos[mapping.job_id]].add(mapping.skill_id)
+                job_values["role"][job_pos[mapping.job_id]].update(
+                    roles_of_skill.get(mapping.skill_id, ())
+                )
+
+        bullet_values = {
+            "metric_type": [set(b.metric_types) for b in bullets],
+            "status": [{b.status} for b in bullets],
+        }
+        self.columns: dict[str, dict[str, int]] = {}
+        blocks = []
+        offset = 0
+        for dimension in DIMENSIONS:
+            if dimension in bullet_values:
+                rows, owner = bullet_values[dimension], None
+            else:
+                rows, owner = job_values[dimension], self.bullet_job
+            local = {value: i for i, value in enumerate(sorted(set().union(*rows)))}
+            bitmap = np.zeros((len(rows), len(local)), dtype=bool)
+            for r, values in enumerate(rows):
+                bitmap[r, [local[v] for v in values]] = True
+            blocks.append(bitmap if owner is None else bitmap[owner])
+            self.columns[dimension] = {value: offset + i for value, i in local.items()}
+            offset += len(local)
+        self.features = np.hstack(blocks)
+        self._dense = self.features.astype(np.float32)
+
+        postings: dict[str, list[int]] = {}
+        for i, bullet in enumerate(bullets):
+            for word in _words(bullet.text):
+                postings.setdefault(word, []).append(i)
+        self.word_index = {w: np.array(p, dtype=np.int64) for w, p in postings.items()}
+
+    def mask(self, dimension: str, value: str) -> np.ndarray:
+        """Bitmap of the bullets that have `value` in `dimension`."""
+        if dimension == "highlight":
+            return self.highlight.copy()
+        column = self.columns[dimension].get(value)
+        if column is None:
+            return np.zeros(len(self.bullets), dtype=bool)
+        return self.features[:, column].copy()
+
+    def scores(self, targets: list[Target]) -> np.ndarray:
+        """Score matrix, bullets × targets."""
+        weights = np.zeros((self._dense.shape[1], len(targets)), dtype=np.float32)
+        for t, target in enumerate(targets):
+            for dimension, values in target.weights.items():
+                for value, weight in values.items():
+                    column = self.columns[dimension].get(value)
+                    if column is not None:
+                        weights[column, t] = weight
+        scores = self._dense @ weights
+        scores += np.outer(self.highlight, [t.highlight for t in targets])
+        for t, target in enumerate(targets):
+            for word, weight in target.keywords.items():
+                hits = self.word_index.get(word)
+                if hits is not None:
+                    scores[hits, t] += weight
+        return scores
+
+    def _quotas(self, target: Target) -> np.ndarray:
+        if isinstance(target.max_per_job, dict):
+            return np.array([target.max_per_job.get(j, 0) for j in self.job_ids], dtype=np.int64)
+        return np.full(len(self.job_ids), target.max_per_job, dtype=np.int64)
+
+    def select(self, scores: np.ndarray, target: Target) -> Variant:
+        """Top bullets for one target's score column, under per-job quotas.
+
+        Every job first gets its best min_per_job bullets (within its quota),
+        whatever they score; the rest of max_bullets goes to the highest
+        scores overall, and bullets scoring 0 or less are not chosen for it.
+        Jobs keep their corpus order.
+        """
+        n = len(self.bullets)
+        # Rank of each bullet within its job, best first
+        by_job = np.lexsort((-scores, self.bullet_job))
+        group_start = np.searchsorted(self.bullet_job[by_job], self.bullet_job[by_job])
+        rank = np.empty(n, dtype=np.int64)
+        rank[by_job] = np.arange(n) - group_start
+
+        quota = self._quotas(target)[self.bullet_job]
+        forced = (rank < quota) & (rank < target.min_per_job)
+        eligible = (rank < quota) & (scores > 0)
+
+        order = np.argsort(-scores, kind="stable")
+        chosen = order[forced[order]][: target.max_bullets]
+        room = target.max_bullets - len(chosen)
+        if room > 0:
+            rest = order[(eligible & ~forced)[order]][:room]
+            chosen = np.concatenate([chosen, rest])
+        chosen = chosen[np.argsort(-scores[chosen], kind="stable")]
+
+        selected: dict[str, list[str]] = {}
+        for i in chosen:
+            selected.setdefault(self.job_ids[self.bullet_job[i]], []).append(self.bullet_ids[i])
+        job_order = [job_id for job_id in self.job_ids if job_id in selected]
+        return Variant(target.name, job_order, selected, float(scores[chosen].sum()))
+
+    def compose(self, targets: list[Target]) -> list[Variant]:
+        """One variant per target."""
+        if not targets:
+            return []
+        scores = self.scores(targets)
+        return [self.select(scores[:, t], target) for t, target in enumerate(targets)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compose targeted resume variants")
+    parser.add_argument("targets", type=Path, help="YAML list of targets")
+    parser.add_argument("--output", type=Path, help="Write variants here instead of stdout")
+    parser.add_argument("--no-cache", action="store_true", help="Re-parse the corpus files")
+    args = parser.parse_args()
+
+    from scripts.corpus_cache import CorpusFile, ParseCache, parse_corpora
+    from scripts.corpus_to_sql import (
+        parse_bullets_table,
+        parse_jobs_table,
+        parse_skill_mapping,
+        parse_skills_taxonomy,
+    )
+
+    corpus_dir = Path(__file__).parent.parent / "docs" / "resumes" / "corpus"
+    jobs, bullets, skill_mappings, skill_tags = parse_corpora(
+        [
+            CorpusFile(corpus_dir / "RESUME_CORPUS.md", parse_jobs_table, Job, "jobs"),
+            CorpusFile(corpus_dir / "BULLET_CORPUS.md", parse_bullets_table, Bullet, "bullets"),
+            CorpusFile(corpus_dir / "SKILL_MAPPING.md", parse_skill_mapping, SkillMapping,
+                       "skill mappings"),
+            CorpusFile(corpus_dir / "SKILLS_TAXONOMY.md", parse_skills_taxonomy, SkillTag,
+                       "skill tags"),
+        ],
+        cache=None if args.no_cache else ParseCache(),
+    )
+    try:
+        targets = [Target.from_dict(t) for t in load_yaml(args.targets)]
+    except (TypeError, ValueError) as e:
+        print(f"Error: {args.targets}: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    index = BulletIndex(jobs, bullets, skill_mappings, skill_tags)
+    variants = [v.to_dict() for v in index.compose(targets)]
+    if args.output:
+        args.output.write_text(dump_yaml(variants))
+        print(f"Wrote {len(variants)} variants to {args.output}", file=sys.stderr)
+    else:
+        print(dump_yaml(variants), end="")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""
+Records parsed from the resume corpus (docs/resumes/corpus/*.md).
+
+Shared by corpus_to_sql.py, which turns them into seed data, the parse cache
+(corpus_cache.py) and the composition engine (resume_composer.py). See
+ADR-0012 for the object model. `line` is where the record's table row sits
+in its source file, for validation reports; it takes no part in equality.
+"""
+
+from dataclasses import dataclass, field
+
+
+@dataclass
+class Job:
+    id: str
+    company: str
+    title: str
+    start: str
+    end: str
+    seniority: str
+    is_manager: bool
+    direct_reports: int
+    indirect_reports: int
+    customer_type: str
+    business_model: list[str]
+    industry: str
+    domains: list[str]
+    platforms: list[str]
+    line: int = field(default=0, compare=False)
+
+
+@dataclass
+class Bullet:
+    id: str
+    job_id: str
+    text: str
+    metric_types: list[str]
+    is_highlight: bool
+    status: str
+    line: int = field(default=0, compare=False)
+
+
+@dataclass
+class SkillMapping:
+    job_id: str
+    skill_id: str
+    proficiency: str
+    line: int = field(default=0, compare=False)
+
+
+@dataclass
+class SkillTag:
+    skill_id: str
+    display_name: str
+    category: str
+    target_roles: list[str]
+    linkedin: bool
+    line: int = field(default=0, compare=False)
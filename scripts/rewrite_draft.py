@@ -0,0 +1,358 @@
+#!/usr/bin/env python3
+"""
+Apply learned rewrite rules to an AI draft before human editing.
+
+Approved rules from the distilled rule set (style-guides/distilled-rules.yaml,
+the shape written by mine_rules.py and /corpus review) that name a concrete
+phrase — substitutions ("utilize" → "use") and deletions (hedge words,
+banned phrases) — are compiled into one Aho-Corasick automaton. The draft is
+scanned once, case-insensitively; matches are kept leftmost-longest and
+non-overlapping, and rejected when they cut through a word or fall inside
+frontmatter, fenced or inline code, link targets, URLs, HTML tags or comments.
+
+Only reviewed rules of at least medium confidence are applied by default. A
+rule counts as reviewed unless its `status` says otherwise; mine_rules.py and
+extract_rules.py mark their output `status: candidate`. Lower-confidence or
+candidate rules need --min-confidence low / --include-candidates.
+
+Every application is logged to the sidecar (edits/.pending/<key>.jsonl) as
+an agent edit with the rule id, so it reaches the corpus at capture time
+like any other agent edit.
+
+Usage:
+ python scripts/rewrite_draft.py posts/<slug>/draft.md [--rules PATH]
+     [--style S] [--min-confidence low|medium|high] [--include-candidates]
+     [--dry-run] [--no-log]
+"""
+
+import argparse
+import re
+import sys
+from bisect import bisect_right
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+
+if __package__ in (None, ""):
+    # Run as `python scripts/rewrite_draft.py`: make the scripts package importable
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from scripts.edit_io import load_yaml  # noqa: E402
+from scripts.sentence_index import SentenceIndex  # noqa: E402
+from scripts.sidecar_log import SidecarLog  # noqa: E402
+
+DEFAULT_RULES = Path("style-guides/distilled-rules.yaml")
+
+CONFIDENCE = ("low", "medium", "high")
+DEFAULT_MIN_CONFIDENCE = "medium"
+
+# Rule kinds that name the exact phrase to rewrite; insertions need sentence context
+REWRITABLE_KINDS = ("substitution", "deletion")
+
+# Regions of markdown that are never rewritten
+_PROTECTED = re.compile(
+    r"\A---\n.*?^---[ \t]*$"  # YAML frontmatter
+    r"|^[ \t]*(`{3,}|~{3,})[^\n]*\n.*?(?:^[ \t]*\1[ \t]*$|\Z)"  # fenced code
+    r"|(`+)[^`\n].*?\2"  # inline code
+    r"|<!--.*?-->"  # HTML comments
+    r"|\]\([^)]*\)"  # link targets
+    r"|<[^>\s][^>]*>"  # HTML tags and autolinks
+    r"|\bhttps?://\S+",  # bare URLs
+    re.MULTILINE | re.DOTALL,
+)
+
+# Whitespace is folded to a single space so phrases match across line breaks
+_FOLD_WHITESPACE = str.maketrans({"\n": " ", "\t": " ", "\r": " "})
+
+
+@dataclass
+class Rule:
+    """One phrase-level rewrite: lowercase pattern and its replacement."""
+
+    id: str
+    pattern: str
+    replacement: str
+    statement: str = ""
+    style: str | None = None
+
+
+@dataclass
+class Application:
+    """One rule applied to the draft; start/end are offsets into the original text."""
+
+    rule: Rule
+    original: str
+    edited: str
+    start: int
+    end: int
+    output_start: int = 0  # where the replacement lands in the rewritten text
+
+
+def load_rules(path: Path = DEFAULT_RULES, style: str | None = None,
+               min_confidence: str = DEFAULT_MIN_CONFIDENCE,
+               include_candidates: bool = False) -> list[Rule]:
+    """Rewritable rules from a distilled-rules file, in file (rank) order.
+
+    Rules without a confidence count as low; rules whose status is not
+    "approved" (absent means approved) are skipped, except "candidate"
+    rules when `include_candidates` is set.
+    """
+    data = load_yaml(Path(path)) or {}
+    floor = CONFIDENCE.index(min_confidence)
+    allowed_status = ("approved", "candidate") if include_candidates else ("approved",)
+    rules = []
+    for n, raw in enumerate(data.get("rules") or [], 1):
+        original = " ".join(str(raw.get("original") or "").split())
+        if not original or raw.get("kind", "substitution") not in REWRITABLE_KINDS:
+            continue
+        if style and raw.get("style") not in (None, style):
+            continue
+        if CONFIDENCE.index(raw.get("confidence") or "low") < floor:
+            continue
+        if (raw.get("status") or "approved") not in allowed_status:
+            continue
+        rules.append(Rule(
+            id=raw.get("id") or f"rule-{n:03d}",
+            pattern=original.lower(),
+            replacement=" ".join(str(raw.get("edited") or "").split()),
+            statement=raw.get("statement") or "",
+            style=raw.get("style"),
+        ))
+    return rules
+
+
+class Rewriter:
+    """Aho-Corasick automaton over rule patterns."""
+
+    def __init__(self, rules: list[Rule]):
+        self.rules: list[Rule] = []
+        self._goto: list[dict[str, int]] = [{}]
+        self._output: list[int] = [-1]  # rule ending at this node
+        self._depth: list[int] = [0]
+        for rule in rules:
+            # Skip rules that would re-fire on their own output (not idempotent)
+            if _contains_phrase(rule.replacement.lower(), rule.pattern):
+                continue
+            self._add(rule)
+        self._fail, self._next_output = self._link()
+
+    def _add(self, rule: Rule):
+        node = 0
+        for ch in rule.pattern:
+            nxt = self._goto[node].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[node][ch] = nxt
+                self._goto.append({})
+                self._output.append(-1)
+                self._depth.append(self._depth[node] + 1)
+            node = nxt
+        if self._output[node] < 0:  # first (highest-ranked) rule for a phrase wins
+            self._output[node] = len(self.rules)
+            self.rules.append(rule)
+
+    def _link(self) -> tuple[list[int], list[int]]:
+        """Breadth-first failure links and output links (nearest suffix node with a rule)."""
+        fail = [0] * len(self._goto)
+        next_output = [-1] * len(self._goto)
+        queue = list(self._goto[0].values())
+        for node in queue:
+            for ch, child in self._goto[node].items():
+                f = fail[node]
+                while f and ch not in self._goto[f]:
+                    f = fail[f]
+                fail[child] = self._goto[f].get(ch, 0) if node else 0
+                target = fail[child]
+                next_output[child] = target if self._output[target] >= 0 else next_output[target]
+                queue.append(child)
+        return fail, next_output
+
+    def find(self, text: str) -> list[tuple[int, int, Rule]]:
+        """Leftmost-longest, non-overlapping, guarded (start, end, rule) matches."""
+        haystack = _fold(text)
+        protected = _protected_spans(text)
+        protected_starts = [s for s, _ in protected]
+
+        candidates: list[tuple[int, int, int]] = []
+        goto, fail, output, next_output = self._goto, self._fail, self._output, self._next_output
+        node = 0
+        for i, ch in enumerate(haystack):
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            hit = node if output[node] >= 0 else next_output[node]
+            while hit > 0:
+                start = i + 1 - self._depth[hit]
+                if _is_word_bounded(text, start, i + 1) and not _overlaps(
+                    protected, protected_starts, start, i + 1
+                ):
+                    candidates.append((start, -(i + 1), output[hit]))
+                hit = next_output[hit]
+
+        matches = []
+        cursor = 0
+        for start, neg_end, r in sorted(candidates):
+            if start >= cursor:
+                matches.append((start, -neg_end, self.rules[r]))
+                cursor = -neg_end
+        return matches
+
+    def rewrite(self, text: str) -> tuple[str, list[Application]]:
+        """Rewritten text and the applications, in one pass over the matches."""
+        out: list[str] = []
+        applications: list[Application] = []
+        cursor = written = 0
+        capitalize_next = False
+        for start, end, rule in self.find(text):
+            if start < cursor:
+                continue  # swallowed by the previous deletion's trailing space
+            source = text[start:end]
+            replacement = _match_case(source, rule.replacement)
+            span_start, span_end = start, end
+            if not replacement:
+                # Deleting a phrase also drops one adjacent space
+                if end < len(text) and text[end] == " ":
+                    span_end += 1
+                elif start > cursor and text[start - 1] == " ":
+                    span_start -= 1
+            segment = text[cursor:span_start]
+            if capitalize_next and segment.strip():
+                segment, capitalize_next = _capitalize(segment), False
+            if capitalize_next and replacement:
+                replacement, capitalize_next = _capitalize(replacement), False
+            out.append(segment)
+            written += len(segment)
+            if not replacement and source[:1].isupper() and span_start == start:
+                capitalize_next = True  # a deleted sentence opener hands its capital on
+            out.append(replacement)
+            applications.append(Application(rule, source, replacement, start, end, written))
+            written += len(replacement)
+            cursor = span_end
+        tail = text[cursor:]
+        out.append(_capitalize(tail) if capitalize_next else tail)
+        return "".join(out), applications
+
+
+def _fold(text: str) -> str:
+    """Lowercased text with the same length as the input (offsets stay valid)."""
+    lowered = text.lower()
+    if len(lowered) != len(text):
+        lowered = "".join(c if len(c.lower()) != 1 else c.lower() for c in text)
+    return lowered.translate(_FOLD_WHITESPACE)
+
+
+def _protected_spans(text: str) -> list[tuple[int, int]]:
+    return [m.span() for m in _PROTECTED.finditer(text)]
+
+
+def _overlaps(spans: list[tuple[int, int]], starts: list[int], start: int, end: int) -> bool:
+    i = bisect_right(starts, end - 1) - 1
+    return i >= 0 and spans[i][1] > start
+
+
+def _is_word_char(ch: str) -> bool:
+    return ch.isalnum() or ch == "_"
+
+
+def _is_word_bounded(text: str, start: int, end: int) -> bool:
+    if _is_word_char(text[start]) and start > 0 and _is_word_char(text[start - 1]):
+        return False
+    if _is_word_char(text[end - 1]) and end < len(text) and _is_word_char(text[end]):
+        return False
+    return True
+
+
+def _contains_phrase(text: str, phrase: str) -> bool:
+    return re.search(rf"(?<!\w){re.escape(phrase)}(?!\w)", text) is not None
+
+
+def _match_case(source: str, replacement: str) -> str:
+    """Carry the matched text's capitalization over to the replacement."""
+    if not replacement:
+        return replacement
+    if len(source) > 1 and source.isupper():
+        return replacement.upper()
+    if source[0].isupper():
+        return replacement[0].upper() + replacement[1:]
+    return replacement
+
+
+def _capitalize(text: str) -> str:
+    for i, ch in enumerate(text):
+        if ch.isalpha():
+            return text[:i] + ch.upper() + text[i + 1:]
+        if not ch.isspace():
+            break
+    return text
+
+
+def log_applications(file_path: Path, rewritten: str, applications: list[Application],
+                     style: str | None = None, rules_file: Path = DEFAULT_RULES) -> list[str]:
+    """Append each application to the file's sidecar as an agent edit; returns edit IDs."""
+    if not applications:
+        return []
+    index = SentenceIndex.from_text(rewritten)
+    log = SidecarLog.for_file(str(file_path))
+    timestamp = datetime.now(UTC).isoformat()
+    ids = []
+    for app in applications:
+        entry = {
+            "original": app.original,
+            "edited": app.edited,
+            "line_number": index.line_at(app.output_start),
+            "reason": app.rule.statement or f"Learned rewrite rule {app.rule.id}",
+            "rule_applied": f"{rules_file.name}#{app.rule.id}",
+            "editor_type": "agent",
+            "timestamp": timestamp,
+            "file": str(file_path),
+        }
+        if style or app.rule.style:
+            entry["style"] = style or app.rule.style
+        ids.append(log.append(entry))
+    return ids
+
+
+def rewrite_file(file_path: Path, rules_file: Path = DEFAULT_RULES, style: str | None = None,
+                 min_confidence: str = DEFAULT_MIN_CONFIDENCE, dry_run: bool = False,
+                 log: bool = True, include_candidates: bool = False) -> list[Application]:
+    """Rewrite a draft in place and log the applications. Returns them."""
+    file_path = Path(file_path)
+    rewriter = Rewriter(load_rules(rules_file, style, min_confidence, include_candidates))
+    rewritten, applications = rewriter.rewrite(file_path.read_text())
+    if applications and not dry_run:
+        file_path.write_text(rewritten)
+        if log:
+            log_applications(file_path, rewritten, applications, style, rules_file)
+    return applications
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Apply learned rewrite rules to a draft.")
+    parser.add_argument("file", type=Path, help="Draft to rewrite in place (e.g. draft.md)")
+    parser.add_argument("--rules", type=Path, default=DEFAULT_RULES,
+                        help="Distilled rule set (rules with original/edited phrases)")
+    parser.add_argument("--style", default=None,
+                        help="Content style; style-specific rules for other styles are skipped")
+    parser.add_argument("--min-confidence", choices=CONFIDENCE, default=DEFAULT_MIN_CONFIDENCE,
+                        help="Skip rules below this confidence (default: medium)")
+    parser.add_argument("--include-candidates", action="store_true",
+                        help="Also apply unreviewed rules (status: candidate)")
+    parser.add_argument("--dry-run", action="store_true", help="Report without writing")
+    parser.add_argument("--no-log", action="store_true", help="Don't append to the sidecar")
+    args = parser.parse_args()
+
+    if not args.rules.exists():
+        print(f"No rule set at {args.rules}", file=sys.stderr)
+        sys.exit(1)
+
+    applications = rewrite_file(args.file, args.rules, args.style, args.min_confidence,
+                                args.dry_run, log=not args.no_log,
+                                include_candidates=args.include_candidates)
+    for app in applications:
+        print(f"  {app.rule.id}: {app.original!r} → {app.edited!r}")
+    verb = "Would apply" if args.dry_run else "Applied"
+    print(f"{verb} {len(applications)} rewrite(s) to {args.file}")
+
+
+if __name__ == "__main__":
+    main()
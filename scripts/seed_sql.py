@@ -0,0 +1,212 @@
+"""
+SQL rendering for the resume seed: multi-row INSERT batches or COPY blocks.
+
+corpus_to_sql.py describes each table as a SeedTable (name, columns and an
+iterator of plain Python row tuples) and streams it through render_table(),
+which yields the statement text chunk by chunk so nothing is accumulated.
+
+Values map to SQL as: None → NULL, bool → TRUE/FALSE, int/float as-is,
+str → quoted literal, list → text[] array.
+
+For delta seeds a Manifest records a fingerprint of every row, keyed by the
+table's primary key. Comparing a run against a saved manifest yields only the
+rows to upsert and the keys to delete (render_delta).
+"""
+
+import hashlib
+import json
+import os
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field, replace
+from itertools import chain, islice
+from pathlib import Path
+
+FORMATS = ("values", "copy")
+DEFAULT_BATCH = 1000
+
+
+@dataclass
+class SeedTable:
+    """Rows for one target table."""
+
+    name: str
+    columns: tuple[str, ...]
+    rows: Iterable[tuple]
+    comment: str | None = None
+    key: tuple[str, ...] = ("id",)
+    # False when the key is not a unique constraint: changed rows are deleted
+    # and re-inserted instead of upserted with ON CONFLICT
+    unique_key: bool = True
+
+    def key_of(self, row: tuple) -> tuple:
+        return tuple(row[self.columns.index(column)] for column in self.key)
+
+
+def sql_literal(value) -> str:
+    """Render a Python value as a SQL literal."""
+    if value is None:
+        return "NULL"
+    if isinstance(value, bool):
+        return "TRUE" if value else "FALSE"
+    if isinstance(value, (int, float)):
+        return str(value)
+    if isinstance(value, (list, tuple)):
+        return "ARRAY[" + ", ".join(sql_literal(v) for v in value) + "]::text[]"
+    return "'" + str(value).replace("'", "''") + "'"
+
+
+def _array_element(value: str) -> str:
+    return '"' + value.replace("\\", "\\\\").replace('"', '\\"') + '"'
+
+
+def copy_field(value) -> str:
+    """Render a Python value as one field of COPY text format."""
+    if value is None:
+        return "\\N"
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    if isinstance(value, (int, float)):
+        return str(value)
+    if isinstance(value, (list, tuple)):
+        value = "{" + ",".join(_array_element(str(v)) for v in value) + "}"
+    return (
+        str(value)
+        .replace("\\", "\\\\")
+        .replace("\t", "\\t")
+        .replace("\n", "\\n")
+        .replace("\r", "\\r")
+    )
+
+
+def render_values(
+    table: SeedTable, batch: int = DEFAULT_BATCH, suffix: str = ""
+) -> Iterator[str]:
+    """Yield one multi-row INSERT per `batch` rows (0: a single statement).
+
+    `suffix` goes between the rows and the semicolon (an ON CONFLICT clause).
+    """
+    head = f"INSERT INTO {table.name} ({', '.join(table.columns)}) VALUES\n"
+    rows = iter(table.rows)
+    while chunk := list(islice(rows, batch) if batch > 0 else rows):
+        body = ",\n".join("  (" + ", ".join(map(sql_literal, row)) + ")" for row in chunk)
+        yield head + body + suffix + ";\n"
+
+
+def render_copy(table: SeedTable) -> Iterator[str]:
+    """Yield a `COPY ... FROM stdin` block, one line per row."""
+    yield f"COPY {table.name} ({', '.join(table.columns)}) FROM stdin;\n"
+    for row in table.rows:
+        yield "\t".join(map(copy_field, row)) + "\n"
+    yield "\\.\n"
+
+
+def render_table(
+    table: SeedTable, fmt: str = "values", batch: int = DEFAULT_BATCH
+) -> Iterator[str]:
+    """Yield the SQL for a table in the given format; tables without rows get a comment."""
+    rows = iter(table.rows)
+    first = next(rows, None)
+    if table.comment:
+        yield f"-- {table.comment}\n"
+    if first is None:
+        yield f"-- (no rows for {table.name})\n"
+        return
+    table = replace(table, rows=chain([first], rows))
+    if fmt == "copy":
+        yield from render_copy(table)
+    else:
+        yield from render_values(table, batch)
+
+
+def fingerprint(row: tuple) -> str:
+    """Content hash of one row."""
+    encoded = json.dumps(row, ensure_ascii=False, separators=(",", ":")).encode()
+    return hashlib.sha1(encoded).hexdigest()[:16]
+
+
+@dataclass
+class TableDelta:
+    """Rows of one table that changed since a snapshot."""
+
+    table: SeedTable
+    upserts: list[tuple] = field(default_factory=list)
+    deleted_keys: list[tuple] = field(default_factory=list)
+
+
+class Manifest:
+    """Per-table row fingerprints keyed by primary key (a JSON list of the key values)."""
+
+    def __init__(self, tables: dict[str, dict[str, str]] | None = None):
+        self.tables = tables or {}
+
+    @classmethod
+    def load(cls, path: Path) -> "Manifest":
+        return cls(json.loads(Path(path).read_text())["tables"])
+
+    def save(self, path: Path):
+        path = Path(path)
+        tmp = path.with_name(f".{path.name}.tmp")
+        tmp.write_text(json.dumps({"version": 1, "tables": self.tables}, indent=1, sort_keys=True))
+        os.replace(tmp, path)
+
+    def track(self, table: SeedTable) -> SeedTable:
+        """The same table, recording each row's fingerprint as the rows stream past."""
+        seen = self.tables[table.name] = {}
+
+        def rows():
+            for row in table.rows:
+                seen[json.dumps(table.key_of(row), ensure_ascii=False)] = fingerprint(row)
+                yield row
+
+        return replace(table, rows=rows())
+
+    def delta(self, table: SeedTable) -> TableDelta:
+        """Compare a table against this (older) manifest.
+
+        A table the manifest has never seen, or saw under a different key, is
+        all upserts; rows whose key is gone are deletes.
+        """
+        before = self.tables.get(table.name, {})
+        if any(len(json.loads(k)) != len(table.key) for k in islice(before, 1)):
+            before = {}
+        delta = TableDelta(table)
+        current = set()
+        for row in table.rows:
+            key = json.dumps(table.key_of(row), ensure_ascii=False)
+            current.add(key)
+            if before.get(key) != fingerprint(row):
+                delta.upserts.append(row)
+        delta.deleted_keys = [tuple(json.loads(k)) for k in sorted(before.keys() - current)]
+        return delta
+
+
+def _key_match(table: SeedTable, keys: list[tuple]) -> str:
+    values = ", ".join(
+        sql_literal(k[0]) if len(k) == 1 else "(" + ", ".join(map(sql_literal, k)) + ")"
+        for k in keys
+    )
+    columns = table.key[0] if len(table.key) == 1 else "(" + ", ".join(table.key) + ")"
+    return f"{columns} IN ({values})"
+
+
+def render_deletes(delta: TableDelta) -> Iterator[str]:
+    """DELETE for removed rows (and for changed rows of tables without a unique key)."""
+    table = delta.table
+    keys = list(delta.deleted_keys)
+    if not table.unique_key:
+        keys += [table.key_of(row) for row in delta.upserts]
+    if keys:
+        yield f"DELETE FROM {table.name} WHERE {_key_match(table, keys)};\n"
+
+
+def render_upserts(delta: TableDelta, batch: int = DEFAULT_BATCH) -> Iterator[str]:
+    """INSERT ... ON CONFLICT DO UPDATE for new and changed rows."""
+    table = delta.table
+    if not delta.upserts:
+        return
+    suffix = ""
+    if table.unique_key:
+        updates = [f"{c} = EXCLUDED.{c}" for c in table.columns if c not in table.key]
+        action = "DO UPDATE SET " + ", ".join(updates) if updates else "DO NOTHING"
+        suffix = f"\nON CONFLICT ({', '.join(table.key)}) {action}"
+    yield from render_values(replace(table, rows=delta.upserts), batch, suffix)
@@ -0,0 +1,90 @@
+"""
+Sentence offset index for edit capture.
+
+Splits a document into sentences once and records each sentence's character
+span and each line's starting offset, so sentence context for any line or
+character position is a bisect lookup instead of a rescan of the document.
+"""
+
+import re
+from bisect import bisect_right
+
+_SENT_BREAK = "|||SENT_BREAK|||"
+
+
+def split_into_sentences(text: str) -> list[str]:
+    """Split text into sentences, treating markdown headings as sentence boundaries."""
+    # First, handle markdown headings as sentence boundaries
+    # Replace headings with a special marker
+    text = re.sub(r"(^#{1,6}\s+.+$)", rf"\1{_SENT_BREAK}", text, flags=re.MULTILINE)
+
+    # Split on sentence endings (. ! ?) followed by space or newline
+    # But not on abbreviations like "e.g." or "i.e."
+    sentences = re.split(r"(?<=[.!?])\s+(?=[A-Z])|(?<=\|\|\|SENT_BREAK\|\|\|)", text)
+
+    # Clean up and filter
+    cleaned = []
+    for s in sentences:
+        s = s.replace(_SENT_BREAK, "").strip()
+        if s:
+            cleaned.append(s)
+
+    return cleaned
+
+
+class SentenceIndex:
+    """Sentence spans and line offsets for one version of a document."""
+
+    def __init__(self, lines: list[str]):
+        self.text = "\n".join(lines)
+
+        # Character offset where each line starts
+        self.line_starts = [0]
+        for line in lines[:-1]:
+            self.line_starts.append(self.line_starts[-1] + len(line) + 1)
+
+        # Sentences are substrings of the text in order, so one forward scan finds every span
+        self.sentences = split_into_sentences(self.text)
+        self.starts: list[int] = []
+        self.ends: list[int] = []
+        pos = 0
+        for sentence in self.sentences:
+            start = self.text.find(sentence, pos)
+            if start < 0:
+                start = pos
+            self.starts.append(start)
+            self.ends.append(start + len(sentence))
+            pos = start + len(sentence)
+
+    @classmethod
+    def from_text(cls, text: str) -> "SentenceIndex":
+        return cls(text.split("\n"))
+
+    def sentence_at(self, char_pos: int) -> int:
+        """Index of the sentence containing char_pos, or the next one if it falls between."""
+        if not self.sentences:
+            return 0
+        i = bisect_right(self.starts, char_pos) - 1
+        if i >= 0 and char_pos <= self.ends[i]:
+            return i
+        return min(i + 1, len(self.sentences) - 1)
+
+    def line_offset(self, line_number: int) -> int:
+        """Character offset of a 1-based line number (clamped to the document)."""
+        return self.line_starts[max(0, min(line_number - 1, len(self.line_starts) - 1))]
+
+    def line_at(self, char_pos: int) -> int:
+        """1-based line number containing a character offset."""
+        return max(1, bisect_right(self.line_starts, char_pos))
+
+    def context(self, line_number: int, column: int = 0) -> dict:
+        """Sentence containing the line (and column) plus the sentence before it."""
+        return self.context_at(self.line_offset(line_number) + column)
+
+    def context_at(self, char_pos: int) -> dict:
+        """Sentence containing a character offset plus the sentence before it."""
+        i = self.sentence_at(char_pos)
+        return {
+            "sentence_before": self.sentences[i - 1] if 0 < i <= len(self.sentences) else "",
+            "full_sentence": self.sentences[i] if i < len(self.sentences) else "",
+        }
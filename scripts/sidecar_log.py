@@ -0,0 +1,254 @@
+"""
+Append-only sidecar log for agent edits.
+
+Each edit is one JSON line appended to edits/.pending/<key>.jsonl, so a
+log call costs the same on the first edit of a session as on the thousandth.
+Writers take an exclusive flock on a small counter file (.<key>.seq) that
+holds the last assigned ID; the lock serializes concurrent agents, and IDs
+are assigned without reading the log itself.
+
+The human-readable YAML sidecar (<key>.yaml) is rendered on demand by
+compact(), which folds the JSONL entries into it. Readers see the YAML
+entries followed by any JSONL entries appended since the last compaction.
+
+A file's key (file_key) is its parent directory and stem plus a hash of its
+path within its git repo: posts/a/draft.md and posts/b/draft.md share a stem
+but not a sidecar, and a post keeps its key on every checkout. Corpus files
+written by capture_edits.py and mine_history.py use the same key. Sidecars
+from before keys (<stem>.jsonl) are renamed on first use when they record
+the same file, and reported otherwise.
+"""
+
+import argparse
+import fcntl
+import hashlib
+import json
+import os
+import re
+import shutil
+import subprocess
+import sys
+from contextlib import contextmanager
+from functools import cache
+from pathlib import Path
+
+if __package__ in (None, ""):
+    # Run as `python scripts/sidecar_log.py`: make the scripts package importable
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from scripts.edit_io import (  # noqa: E402
+    count_jsonl_edits,
+    count_yaml_edits,
+    iter_jsonl,
+    load_yaml,
+    write_document,
+)
+
+PENDING_DIR = Path("edits/.pending")
+
+# Legacy sidecars already reported, so a watcher warns once rather than per save
+_reported_legacy: set[Path] = set()
+
+
+@cache
+def _repo_root(directory: Path) -> Path | None:
+    """Top level of the git repo containing `directory` (which must exist)."""
+    result = subprocess.run(
+        ["git", "rev-parse", "--show-toplevel"], cwd=directory, capture_output=True, text=True,
+    )
+    return Path(result.stdout.strip()).resolve() if result.returncode == 0 else None
+
+
+def _repo_path(path: Path) -> str:
+    """`path` relative to its repo; files in another repo keep that repo's name."""
+    directory = path.parent
+    while not directory.is_dir():  # deleted files (history mining) still have a repo
+        directory = directory.parent
+    root = _repo_root(directory)
+    if root is None:
+        return path.as_posix()
+    relative = path.relative_to(root).as_posix()
+    here = _repo_root(Path.cwd().resolve())
+    return relative if root == here else f"{root.name}/{relative}"
+
+
+def file_key(file_path: str | Path) -> str:
+    """Name unique to one content file: posts/a/draft.md → a-draft-<8 hex of its path>.
+
+    The hash is of the path within the file's git repo, so the key is the same
+    on every checkout and from any working directory.
+    """
+    path = Path(file_path).expanduser().resolve()
+    readable = f"{path.parent.name}-{path.stem}" if path.parent.name else path.stem
+    digest = hashlib.sha1(_repo_path(path).encode()).hexdigest()[:8]
+    return f"{re.sub(r'[^A-Za-z0-9._-]+', '-', readable)}-{digest}"
+
+
+class SidecarLog:
+    """Pending agent edits for one content file, identified by its key."""
+
+    def __init__(self, key: str, pending_dir: Path = PENDING_DIR):
+        self.key = key
+        self.pending_dir = Path(pending_dir)
+        self.log_path = self.pending_dir / f"{key}.jsonl"
+        self.yaml_path = self.pending_dir / f"{key}.yaml"
+        self.seq_path = self.pending_dir / f".{key}.seq"
+
+    @classmethod
+    def for_file(cls, file_path: str, pending_dir: Path = PENDING_DIR) -> "SidecarLog":
+        log = cls(file_key(file_path), pending_dir)
+        legacy = cls(Path(file_path).stem, pending_dir)
+        if legacy.exists() and not log.exists():
+            log._adopt(legacy, file_path)
+        return log
+
+    def _adopt(self, legacy: "SidecarLog", file_path: str):
+        """Take over a pre-key <stem> sidecar if it records this file; warn otherwise."""
+        source = legacy._read_yaml().get("source_file") or next(
+            (e["file"] for e in legacy._read_log() if e.get("file")), None
+        )
+        if source is None or file_key(source) != self.key:
+            if legacy.log_path in _reported_legacy:
+                return
+            _reported_legacy.add(legacy.log_path)
+            print(f"Warning: {legacy.log_path.with_suffix('')}.* is a sidecar from before "
+                  f"per-file keys and does not record {file_path}; it is not used",
+                  file=sys.stderr)
+            return
+        with legacy._locked():
+            for old, new in ((legacy.log_path, self.log_path), (legacy.yaml_path, self.yaml_path),
+                             (legacy.seq_path, self.seq_path)):
+                if old.exists():
+                    old.rename(new)
+
+    def exists(self) -> bool:
+        return self.log_path.exists() or self.yaml_path.exists()
+
+    @contextmanager
+    def _locked(self):
+        """Exclusive lock on the counter file; yields its file descriptor."""
+        self.pending_dir.mkdir(parents=True, exist_ok=True)
+        while True:
+            fd = os.open(self.seq_path, os.O_RDWR | os.O_CREAT, 0o644)
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            # clear() may have removed the counter while we waited: lock the new one
+            try:
+                current = os.stat(self.seq_path).st_ino
+            except FileNotFoundError:
+                current = None
+            if current == os.fstat(fd).st_ino:
+                break
+            fcntl.flock(fd, fcntl.LOCK_UN)
+            os.close(fd)
+        try:
+            yield fd
+        finally:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+            os.close(fd)
+
+    def _next_id(self, fd: int) -> int:
+        raw = os.pread(fd, 32, 0).strip()
+        # No counter yet: seed once from entries written before it existed
+        last = int(raw) if raw else len(self.read())
+        os.pwrite(fd, f"{last + 1:<20d}\n".encode(), 0)
+        return last + 1
+
+    def append(self, entry: dict) -> str:
+        """Append one edit and return its assigned ID (edit-NNN)."""
+        with self._locked() as fd:
+            entry = {"id": f"edit-{self._next_id(fd):03d}", **entry}
+            line = json.dumps(entry, ensure_ascii=False) + "\n"
+            log_fd = os.open(self.log_path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+            try:
+                os.write(log_fd, line.encode())
+            finally:
+                os.close(log_fd)
+        return entry["id"]
+
+    def _read_yaml(self) -> dict:
+        if not self.yaml_path.exists():
+            return {}
+        return load_yaml(self.yaml_path) or {}
+
+    def _read_log(self) -> list[dict]:
+        if not self.log_path.exists():
+            return []
+        return list(iter_jsonl(self.log_path))
+
+    def read(self) -> list[dict]:
+        """All pending edits: compacted YAML entries, then newer JSONL entries."""
+        return self._read_yaml().get("edits", []) + self._read_log()
+
+    def summary(self) -> tuple[int, int]:
+        """(pending edits, flagged edits), counted without building the entries."""
+        edits = flagged = 0
+        for path, count in ((self.yaml_path, count_yaml_edits),
+                            (self.log_path, count_jsonl_edits)):
+            if path.exists():
+                n, f = count(path)
+                edits, flagged = edits + n, flagged + f
+        return edits, flagged
+
+    def _compact(self) -> Path | None:
+        data = self._read_yaml()
+        new_entries = self._read_log()
+        if not data and not new_entries:
+            return None
+        edits = data.get("edits", []) + new_entries
+        source_file = data.get("source_file") or next(
+            (e["file"] for e in edits if e.get("file")), None
+        )
+        write_document(self.yaml_path, {"source_file": source_file, "edits": edits})
+        self.log_path.unlink(missing_ok=True)
+        return self.yaml_path
+
+    def _remove(self):
+        # Counter last: it is the lock file, and appenders re-check it (see _locked)
+        for path in (self.log_path, self.yaml_path, self.seq_path):
+            path.unlink(missing_ok=True)
+
+    def compact(self) -> Path | None:
+        """Fold the JSONL entries into the YAML sidecar and truncate the log."""
+        with self._locked():
+            return self._compact()
+
+    def archive(self, dest: Path) -> Path | None:
+        """Compact, move the YAML sidecar to `dest` and clear, as one locked step.
+
+        An append that arrives meanwhile waits and starts a new sidecar rather
+        than landing in files that are about to be removed. Returns `dest`, or
+        None if there was nothing pending.
+        """
+        dest = Path(dest)
+        with self._locked():
+            sidecar_path = self._compact()
+            if sidecar_path is None:
+                return None
+            dest.parent.mkdir(parents=True, exist_ok=True)
+            shutil.move(str(sidecar_path), str(dest))
+            self._remove()
+        return dest
+
+    def clear(self):
+        """Remove the log, YAML sidecar and counter (after archiving or discarding)."""
+        with self._locked():
+            self._remove()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Inspect or compact pending sidecar logs")
+    parser.add_argument("command", choices=["compact", "count"])
+    parser.add_argument("file", help="Content file whose sidecar to use")
+    args = parser.parse_args()
+
+    log = SidecarLog.for_file(args.file)
+    if args.command == "compact":
+        path = log.compact()
+        print(f"Compacted to {path}" if path else f"No pending edits for {args.file}")
+    else:
+        edits, flagged = log.summary()
+        print(f"{edits} pending edit(s) ({flagged} flagged)")
+
+
+if __name__ == "__main__":
+    main()
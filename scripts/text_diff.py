@@ -0,0 +1,292 @@
+"""
+In-process text diff for edit capture.
+
+Aligns two versions of a document at sentence level, then at word level
+inside changed regions, and reports each change as an edit span with
+character offsets into both texts.
+
+Sequences are aligned with patience diff: items that occur exactly once on
+both sides become anchors, the longest run of anchors in the same order is
+kept, and the gaps between anchors are aligned recursively. Gaps without
+unique anchors fall back to Myers' O(ND) diff with a cap on D, so a
+wholesale rewrite degrades to a single replace block instead of quadratic
+work. Sentences are compared with whitespace collapsed, so reflowed
+paragraphs are not reported as edits.
+"""
+
+import re
+from bisect import bisect_left
+from dataclasses import dataclass
+
+from scripts.sentence_index import SentenceIndex
+
+# Upper bound on edit distance explored by Myers within one gap
+MAX_MYERS_D = 500
+
+# Word-level changes separated by at most this many unchanged words are one edit
+MERGE_GAP = 2
+
+_WORD = re.compile(r"\S+")
+
+Opcode = tuple[str, int, int, int, int]
+
+
+@dataclass
+class TextEdit:
+    """One change between the original and edited text, with character offsets."""
+
+    kind: str  # "replace" | "insert" | "delete" | "move"
+    original: str
+    edited: str
+    orig_start: int
+    orig_end: int
+    edit_start: int
+    edit_end: int
+
+
+def _unique_anchors(a: list, b: list, a0: int, a1: int, b0: int, b1: int) -> list[tuple[int, int]]:
+    """Longest in-order chain of items that occur exactly once in both ranges."""
+    counts: dict = {}
+    for i in range(a0, a1):
+        entry = counts.setdefault(a[i], [0, 0, i])
+        entry[0] += 1
+    for j in range(b0, b1):
+        entry = counts.get(b[j])
+        if entry is not None:
+            entry[1] += 1
+            entry.append(j)
+    pairs = sorted((e[2], e[3]) for e in counts.values() if e[0] == 1 and e[1] == 1)
+    if not pairs:
+        return []
+
+    # Patience sort on b-positions: longest increasing subsequence with back-pointers
+    tails: list[int] = []  # b-position at the top of each pile
+    tops: list[int] = []  # index into pairs for each pile top
+    back: list[int] = [-1] * len(pairs)
+    for n, (_, j) in enumerate(pairs):
+        pile = bisect_left(tails, j)
+        back[n] = tops[pile - 1] if pile else -1
+        if pile == len(tails):
+            tails.append(j)
+            tops.append(n)
+        else:
+            tails[pile] = j
+            tops[pile] = n
+
+    chain = []
+    n = tops[-1]
+    while n >= 0:
+        chain.append(pairs[n])
+        n = back[n]
+    return chain[::-1]
+
+
+def _myers(a: list, b: list, max_d: int) -> list[tuple[int, int]] | None:
+    """Matched (i, j) pairs of a shortest edit script, or None if it needs more than max_d edits."""
+    n, m = len(a), len(b)
+    v = {1: 0}
+    trace = []
+    for d in range(max_d + 1):
+        trace.append(v.copy())
+        for k in range(-d, d + 1, 2):
+            if k == -d or (k != d and v[k - 1] < v[k + 1]):
+                x = v[k + 1]
+            else:
+                x = v[k - 1] + 1
+            y = x - k
+            while x < n and y < m and a[x] == b[y]:
+                x += 1
+                y += 1
+            v[k] = x
+            if x >= n and y >= m:
+                return _backtrack(trace, n, m)
+    return None
+
+
+def _backtrack(trace: list[dict], x: int, y: int) -> list[tuple[int, int]]:
+    matches = []
+    for d in range(len(trace) - 1, -1, -1):
+        v = trace[d]
+        k = x - y
+        if k == -d or (k != d and v.get(k - 1, -1) < v.get(k + 1, -1)):
+            prev_k = k + 1
+        else:
+            prev_k = k - 1
+        prev_x = v.get(prev_k, 0)
+        prev_y = prev_x - prev_k
+        while x > prev_x and y > prev_y:
+            x -= 1
+            y -= 1
+            matches.append((x, y))
+        x, y = prev_x, prev_y
+    return matches[::-1]
+
+
+def _match(a: list, b: list, a0: int, a1: int, b0: int, b1: int,
+           out: list[tuple[int, int]], max_d: int):
+    """Append matched (i, j) pairs for a[a0:a1] vs b[b0:b1] to out, in order."""
+    while a0 < a1 and b0 < b1 and a[a0] == b[b0]:
+        out.append((a0, b0))
+        a0 += 1
+        b0 += 1
+    suffix = []
+    while a0 < a1 and b0 < b1 and a[a1 - 1] == b[b1 - 1]:
+        a1 -= 1
+        b1 -= 1
+        suffix.append((a1, b1))
+
+    if a0 < a1 and b0 < b1:
+        anchors = _unique_anchors(a, b, a0, a1, b0, b1)
+        if anchors:
+            i0, j0 = a0, b0
+            for i, j in anchors:
+                _match(a, b, i0, i, j0, j, out, max_d)
+                out.append((i, j))
+                i0, j0 = i + 1, j + 1
+            _match(a, b, i0, a1, j0, b1, out, max_d)
+        else:
+            found = _myers(a[a0:a1], b[b0:b1], max_d)
+            if found:
+                out.extend((a0 + i, b0 + j) for i, j in found)
+
+    out.extend(reversed(suffix))
+
+
+def diff_sequences(a: list, b: list, max_d: int = MAX_MYERS_D) -> list[Opcode]:
+    """Align two sequences of hashable items; returns difflib-style opcodes."""
+    matches: list[tuple[int, int]] = []
+    _match(a, b, 0, len(a), 0, len(b), matches, max_d)
+
+    opcodes: list[Opcode] = []
+    i = j = 0
+    for mi, mj in [*matches, (len(a), len(b))]:
+        if i < mi or j < mj:
+            tag = "replace" if i < mi and j < mj else ("delete" if i < mi else "insert")
+            opcodes.append((tag, i, mi, j, mj))
+        if mi < len(a) and mj < len(b):
+            if opcodes and opcodes[-1][0] == "equal":
+                _, ei, _, ej, _ = opcodes[-1]
+                opcodes[-1] = ("equal", ei, mi + 1, ej, mj + 1)
+            else:
+                opcodes.append(("equal", mi, mi + 1, mj, mj + 1))
+        i, j = mi + 1, mj + 1
+    return opcodes
+
+
+def _normalize(text: str) -> str:
+    return " ".join(text.split())
+
+
+def _word_edits(original: str, edited: str, orig_base: int, edit_base: int,
+                max_d: int, merge_gap: int) -> list[TextEdit]:
+    """Word-level edits for one changed region, with nearby changes merged."""
+    words_a = list(_WORD.finditer(original))
+    words_b = list(_WORD.finditer(edited))
+    tokens_a = [w.group() for w in words_a]
+    tokens_b = [w.group() for w in words_b]
+    opcodes = [op for op in diff_sequences(tokens_a, tokens_b, max_d) if op[0] != "equal"]
+
+    # Merge changes separated by a short run of unchanged words
+    groups: list[list[int]] = []
+    for _, i1, i2, j1, j2 in opcodes:
+        if groups and i1 - groups[-1][1] <= merge_gap and j1 - groups[-1][3] <= merge_gap:
+            groups[-1][1], groups[-1][3] = i2, j2
+        else:
+            groups.append([i1, i2, j1, j2])
+
+    def span(words: list[re.Match], start: int, end: int, length: int) -> tuple[int, int]:
+        if start < end:
+            return words[start].start(), words[end - 1].end()
+        # Empty side: position just after the preceding word (or before the next one)
+        pos = words[start - 1].end() if start > 0 else (words[0].start() if words else length)
+        return pos, pos
+
+    edits = []
+    for i1, i2, j1, j2 in groups:
+        os_, oe = span(words_a, i1, i2, len(original))
+        es, ee = span(words_b, j1, j2, len(edited))
+        kind = "replace" if i1 < i2 and j1 < j2 else ("delete" if i1 < i2 else "insert")
+        edits.append(TextEdit(
+            kind, original[os_:oe], edited[es:ee],
+            orig_base + os_, orig_base + oe, edit_base + es, edit_base + ee,
+        ))
+    return edits
+
+
+def diff_texts(
+    original: str,
+    edited: str,
+    original_index: SentenceIndex | None = None,
+    edited_index: SentenceIndex | None = None,
+    max_d: int = MAX_MYERS_D,
+    merge_gap: int = MERGE_GAP,
+) -> list[TextEdit]:
+    """
+    Edits between two texts, ordered by position in the original.
+
+    Unchanged sentences (ignoring whitespace) are aligned first; replaced
+    sentence runs are refined to word-level spans; whole sentences that were
+    deleted in one place and inserted verbatim in another are reported as moves.
+    """
+    oi = original_index or SentenceIndex.from_text(original)
+    ei = edited_index or SentenceIndex.from_text(edited)
+    keys_a = [_normalize(s) for s in oi.sentences]
+    keys_b = [_normalize(s) for s in ei.sentences]
+
+    def gap(index: SentenceIndex, k: int) -> int:
+        """Offset between sentence k-1 and sentence k (where an insertion lands)."""
+        return index.ends[k - 1] if k else 0
+
+    edits: list[TextEdit] = []
+    deletes: list[tuple[range, int]] = []  # deleted sentences, insertion point in edited
+    inserts: list[tuple[range, int]] = []  # inserted sentences, insertion point in original
+    for tag, i1, i2, j1, j2 in diff_sequences(keys_a, keys_b, max_d):
+        if tag == "replace":
+            os_, oe = oi.starts[i1], oi.ends[i2 - 1]
+            es, ee = ei.starts[j1], ei.ends[j2 - 1]
+            edits.extend(_word_edits(original[os_:oe], edited[es:ee], os_, es, max_d, merge_gap))
+        elif tag == "delete":
+            deletes.append((range(i1, i2), gap(ei, j1)))
+        elif tag == "insert":
+            inserts.append((range(j1, j2), gap(oi, i1)))
+
+    # Sentences deleted in one place and inserted verbatim in another are moves
+    deleted_at: dict[str, list[int]] = {}
+    for run, _ in deletes:
+        for i in run:
+            deleted_at.setdefault(keys_a[i], []).append(i)
+    moved_a, moved_b = set(), set()
+    for run, _ in inserts:
+        for j in run:
+            candidates = deleted_at.get(keys_b[j])
+            if candidates:
+                i = candidates.pop(0)
+                moved_a.add(i)
+                moved_b.add(j)
+                edits.append(TextEdit(
+                    "move", original[oi.starts[i]:oi.ends[i]], edited[ei.starts[j]:ei.ends[j]],
+                    oi.starts[i], oi.ends[i], ei.starts[j], ei.ends[j],
+                ))
+
+    # Remaining deleted / inserted sentences as contiguous blocks
+    for run, pos in deletes:
+        for block in _contiguous(i for i in run if i not in moved_a):
+            os_, oe = oi.starts[block[0]], oi.ends[block[-1]]
+            edits.append(TextEdit("delete", original[os_:oe], "", os_, oe, pos, pos))
+    for run, pos in inserts:
+        for block in _contiguous(j for j in run if j not in moved_b):
+            es, ee = ei.starts[block[0]], ei.ends[block[-1]]
+            edits.append(TextEdit("insert", "", edited[es:ee], pos, pos, es, ee))
+
+    return sorted(edits, key=lambda e: (e.orig_start, e.edit_start))
+
+
+def _contiguous(items) -> list[list[int]]:
+    """Split increasing integers into runs of consecutive values."""
+    runs: list[list[int]] = []
+    for item in items:
+        if runs and item == runs[-1][-1] + 1:
+            runs[-1].append(item)
+        else:
+            runs.append([item])
+    return runs
@@ -0,0 +1,97 @@
+"""Tests for batch edit capture: [ai-draft] discovery, blob reads and per-file corpora."""
+
+import subprocess
+
+import pytest
+
+from scripts.capture_edits import capture_batch, find_ai_draft_files, read_blobs
+from scripts.edit_io import load_yaml
+from scripts.sidecar_log import SidecarLog, file_key
+
+
+def _git(repo, *args):
+    return subprocess.run(
+        ["git", "-c", "user.name=Test", "-c", "user.email=test@example.com", *args],
+        cwd=repo, check=True, capture_output=True, text=True,
+    ).stdout.strip()
+
+
+def _commit(repo, message, files):
+    for name, text in files.items():
+        path = repo / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text)
+        _git(repo, "add", name)
+    _git(repo, "commit", "-q", "-m", message)
+    return _git(repo, "rev-parse", "HEAD")
+
+
+@pytest.fixture
+def repo(tmp_path, monkeypatch):
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    _git(repo, "init", "-q")
+    monkeypatch.chdir(repo)
+    return repo
+
+
+class TestFindAiDraftFiles:
+    def test_latest_draft_commit_per_file(self, repo):
+        first = _commit(repo, "[ai-draft] First", {"posts/a/draft.md": "A\n", "notes.txt": "x\n"})
+        _commit(repo, "Human edit", {"posts/a/draft.md": "A edited\n"})
+        second = _commit(repo, "[ai-draft] Second", {
+            "posts/a/draft.md": "A again\n", "posts/b/draft.mdx": "B\n",
+        })
+        assert find_ai_draft_files() == {"posts/a/draft.md": second, "posts/b/draft.mdx": second}
+        assert first != second
+
+    def test_since_limits_the_commits(self, repo):
+        first = _commit(repo, "[ai-draft] First", {"posts/a/draft.md": "A\n"})
+        assert find_ai_draft_files(first) == {}
+        second = _commit(repo, "[ai-draft] Second", {"posts/b/draft.md": "B\n"})
+        assert find_ai_draft_files(first) == {"posts/b/draft.md": second}
+
+
+class TestReadBlobs:
+    def test_contents_and_missing_objects(self, repo):
+        commit = _commit(repo, "[ai-draft] Draft", {"a.md": "one\ntwo\n", "b.md": ""})
+        blobs = read_blobs([f"{commit}:a.md", f"{commit}:missing.md", f"{commit}:b.md"])
+        assert blobs == {
+            f"{commit}:a.md": "one\ntwo\n",
+            f"{commit}:missing.md": None,
+            f"{commit}:b.md": "",
+        }
+        assert read_blobs([]) == {}
+
+
+class TestCaptureBatch:
+    def test_same_named_files_get_separate_corpora(self, repo):
+        _commit(repo, "[ai-draft] Drafts", {
+            "posts/a/draft.md": "We utilize tools.\n",
+            "posts/b/draft.md": "It is very good.\n",
+            "posts/c/draft.md": "Untouched.\n",
+        })
+        (repo / "posts/a/draft.md").write_text("We use tools.\n")
+        (repo / "posts/b/draft.md").write_text("It is good.\n")
+
+        results = capture_batch(workers=2)
+        assert [r["file_path"] for r in results] == ["posts/a/draft.md", "posts/b/draft.md"]
+        outputs = {r["file_path"]: r["output"] for r in results}
+        assert len(set(outputs.values())) == 2
+        assert file_key("posts/a/draft.md") in outputs["posts/a/draft.md"]
+
+        corpus = load_yaml(repo / outputs["posts/a/draft.md"])
+        assert corpus["source_file"] == "posts/a/draft.md"
+        assert [(e["original"], e["edited"]) for e in corpus["edits"]] == [("utilize", "use")]
+
+    def test_sidecars_are_keyed_by_path_and_archived(self, repo):
+        _commit(repo, "[ai-draft] Drafts", {"posts/a/draft.md": "A.\n", "posts/b/draft.md": "B.\n"})
+        log = SidecarLog.for_file("posts/a/draft.md")
+        log.append({"original": "A.", "edited": "A!", "reason": "tone"})
+        assert not SidecarLog.for_file("posts/b/draft.md").exists()
+
+        results = capture_batch(archive=True, workers=1)
+        assert [(r["file_path"], r["sidecar"]) for r in results] == [("posts/a/draft.md", 1)]
+        assert not SidecarLog.for_file("posts/a/draft.md").exists()
+        archived = list((repo / "edits/.pending/archive").glob("*.yaml"))
+        assert [p.name.endswith(f"{file_key('posts/a/draft.md')}.yaml") for p in archived] == [True]
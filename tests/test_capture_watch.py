@@ -0,0 +1,106 @@
+"""Tests for the save-time edit capture watcher."""
+
+import os
+
+from scripts import capture_watch
+from scripts.capture_watch import CaptureWatcher
+from scripts.edit_matching import collapse_watch
+from scripts.sidecar_log import SidecarLog
+
+
+def _save(path, text, bump):
+    path.write_text(text)
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + bump))
+
+
+class TestCaptureWatcher:
+    def test_records_each_save_with_sentence_context(self, tmp_path):
+        draft = tmp_path / "draft.md"
+        draft.write_text("# Title\n\nWe utilize tools. They help.\n")
+        watcher = CaptureWatcher([str(tmp_path / "*.md")], style="blog", pending_dir=tmp_path)
+        assert watcher.scan() == [draft]
+
+        _save(draft, "# Title\n\nWe use tools. They help.\n", 1_000_000)
+        assert watcher.poll() == 0  # waits one poll for the write to settle
+        assert watcher.poll() == 1
+
+        _save(draft, "# Title\n\nWe use tools. They help a lot.\n", 2_000_000)
+        watcher.poll()
+        assert watcher.poll() == 1
+
+        entries = SidecarLog.for_file(str(draft), tmp_path).read()
+        assert [(e["original"], e["edited"]) for e in entries] == [
+            ("utilize", "use"), ("help.", "help a lot."),
+        ]
+        first = entries[0]
+        assert first["full_sentence_original"] == "We utilize tools."
+        assert first["full_sentence_edited"] == "We use tools."
+        assert first["line_number"] == 3
+        assert (first["editor_type"], first["captured_by"], first["style"]) == (
+            "human", "watch", "blog",
+        )
+
+    def test_superseded_saves_collapse_per_file(self, tmp_path):
+        drafts = [tmp_path / name / "draft.md" for name in ("a", "b")]
+        for draft in drafts:
+            draft.parent.mkdir()
+            draft.write_text("We utilize tools.\n")
+        watcher = CaptureWatcher([str(tmp_path / "*" / "draft.md")], pending_dir=tmp_path)
+        watcher.scan()
+
+        for bump, text in enumerate(["We employ tools.\n", "We use tools.\n"], 1):
+            _save(drafts[0], text, bump * 1_000_000)
+            watcher.poll()
+            assert watcher.poll() == 1
+
+        a, b = (SidecarLog.for_file(str(d), tmp_path) for d in drafts)
+        assert len(a.read()) == 2 and not b.exists()
+        assert [(e["original"], e["edited"]) for e in collapse_watch(a.read())] == [
+            ("utilize", "use"),
+        ]
+
+    def test_unchanged_content_and_missing_files_log_nothing(self, tmp_path):
+        draft = tmp_path / "draft.md"
+        draft.write_text("Same text.\n")
+        watcher = CaptureWatcher([str(draft)], pending_dir=tmp_path)
+        watcher.scan()
+
+        _save(draft, "Same text.\n", 1_000_000)
+        watcher.poll()
+        assert watcher.poll() == 0
+
+        draft.unlink()
+        assert watcher.poll() == 0
+        assert not SidecarLog.for_file(str(draft), tmp_path).exists()
+
+    def test_unreadable_files_do_not_stop_the_watcher(self, tmp_path, monkeypatch):
+        draft, binary = tmp_path / "draft.md", tmp_path / "binary.md"
+        draft.write_text("We utilize tools.\n")
+        binary.write_bytes(b"\xff\xfe not utf-8")
+        watcher = CaptureWatcher([str(tmp_path / "*.md")], pending_dir=tmp_path)
+        assert watcher.scan() == [draft]
+
+        # Deleted between the stat and the read
+        stat = (1, 1)
+        monkeypatch.setattr(capture_watch, "_stat", lambda path: stat)
+        draft.unlink()
+        watcher.poll()
+        assert watcher.poll() == 0
+
+        # A later non-UTF-8 save is skipped; the next text save is diffed as usual
+        draft.write_bytes(b"\xff\xfe")
+        stat = (2, 2)
+        watcher.poll()
+        assert watcher.poll() == 0
+        draft.write_text("We use tools.\n")
+        stat = (3, 3)
+        watcher.poll()
+        assert watcher.poll() == 1
+
+    def test_new_files_are_baselined_without_edits(self, tmp_path):
+        watcher = CaptureWatcher([str(tmp_path / "*.md")], pending_dir=tmp_path)
+        assert watcher.scan() == []
+        (tmp_path / "final.md").write_text("Fresh file.\n")
+        assert watcher.scan() == [tmp_path / "final.md"]
+        assert watcher.poll() == 0
@@ -0,0 +1,45 @@
+"""Tests for settings: model route overrides and lazy loading."""
+
+import importlib
+
+import pytest
+from pydantic import ValidationError
+
+import config
+from config import DEFAULT_MODEL_ROUTES, ModelRoute, Settings
+
+
+@pytest.fixture(autouse=True)
+def clean_env(monkeypatch, tmp_path):
+    monkeypatch.chdir(tmp_path)  # no .env
+    for name in ("ANTHROPIC_API_KEY", "MODEL_ROUTES"):
+        monkeypatch.delenv(name, raising=False)
+    config.get_settings.cache_clear()
+    yield
+    config.get_settings.cache_clear()
+
+
+class TestModelRoutes:
+    def test_env_override_keeps_the_other_defaults(self, monkeypatch):
+        monkeypatch.setenv("MODEL_ROUTES", '{"draft": {"model": "big", "max_tokens": 9000}}')
+        routes = Settings(anthropic_api_key="k").model_routes
+        assert routes["draft"] == ModelRoute(model="big", max_tokens=9000)
+        assert routes["linkedin"] == DEFAULT_MODEL_ROUTES["linkedin"]
+        assert routes.keys() == DEFAULT_MODEL_ROUTES.keys()
+
+    def test_new_task_is_added(self):
+        settings = Settings(anthropic_api_key="k", model_routes={"summary": {"max_tokens": 500}})
+        assert settings.model_routes["summary"].max_tokens == 500
+        assert settings.model_routes["frontmatter"].model == "claude-3-5-haiku-20241022"
+
+
+class TestLazySettings:
+    def test_import_needs_no_api_key(self):
+        importlib.reload(config)
+        with pytest.raises(ValidationError):
+            config.get_settings()
+
+    def test_settings_are_read_once(self, monkeypatch):
+        monkeypatch.setenv("ANTHROPIC_API_KEY", "k")
+        assert config.settings is config.get_settings()
+        assert config.settings.anthropic_api_key == "k"
@@ -0,0 +1,66 @@
+"""Tests for the content-hash keyed corpus parse cache."""
+
+from dataclasses import dataclass
+
+from scripts.corpus_cache import CorpusFile, ParseCache, parse_corpora
+from scripts.corpus_tables import iter_rows
+
+
+@dataclass
+class Item:
+    id: str
+    tags: list[str]
+    highlight: bool
+
+
+def parse_items(lines, name):
+    return [Item(r.cells[0], r.cells[1].split(), r.cells[2] == "Y") for r in iter_rows(lines, name)]
+
+
+def _write(path, rows):
+    body = "".join(f"| {i} | {tags} | {flag} |\n" for i, tags, flag in rows)
+    path.write_text("## Items\n\n| id | tags | highlight |\n|---|---|---|\n" + body)
+    return path
+
+
+class TestParseCorpora:
+    def test_second_run_is_served_from_cache(self, tmp_path, capsys):
+        source = _write(tmp_path / "A.md", [("a", "x y", "Y"), ("b", "", "N")])
+        files = [CorpusFile(source, parse_items, Item, "items")]
+        cache = ParseCache(tmp_path / "cache")
+
+        first = parse_corpora(files, cache)
+        assert first == [[Item("a", ["x", "y"], True), Item("b", [], False)]]
+        assert parse_corpora(files, cache) == first
+        assert "Parsed 2 items from A.md (cached)" in capsys.readouterr().err
+
+    def test_content_change_misses(self, tmp_path, capsys):
+        source = _write(tmp_path / "A.md", [("a", "x", "Y")])
+        files = [CorpusFile(source, parse_items, Item, "items")]
+        cache = ParseCache(tmp_path / "cache")
+        parse_corpora(files, cache)
+        _write(source, [("a", "x", "N")])
+        assert parse_corpora(files, cache) == [[Item("a", ["x"], False)]]
+        assert "(cached)" not in capsys.readouterr().err
+
+    def test_changed_record_fields_miss(self, tmp_path):
+        source = _write(tmp_path / "A.md", [("a", "x", "Y")])
+        cache = ParseCache(tmp_path / "cache")
+        parse_corpora([CorpusFile(source, parse_items, Item, "items")], cache)
+
+        @dataclass
+        class Renamed:
+            key: str
+            tags: list[str]
+            highlight: bool
+
+        assert cache.get(source, "irrelevant", Renamed) is None
+
+    def test_stale_files_parse_concurrently_in_order(self, tmp_path):
+        files = [
+            CorpusFile(_write(tmp_path / f"{n}.md", [(n, "t", "Y")]), parse_items, Item, "items")
+            for n in ("a", "b", "c")
+        ]
+        files.insert(1, CorpusFile(tmp_path / "missing.md", parse_items, Item, "items"))
+        results = parse_corpora(files, ParseCache(tmp_path / "cache"), workers=2)
+        assert [[item.id for item in items] for items in results] == [["a"], [], ["b"], ["c"]]
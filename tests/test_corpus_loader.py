@@ -0,0 +1,96 @@
+"""Tests for the transactional corpus loader (SQLite target)."""
+
+import sqlite3
+
+import pytest
+
+from scripts.corpus_loader import POSTGRES, LoadError, load, merge_sql
+from scripts.seed_sql import SeedTable
+
+
+def _tables(jobs, bullets, roles):
+    return [
+        SeedTable("resume_job", ("id", "title", "is_manager"), jobs),
+        SeedTable("resume_job_role", ("job_id", "role_id", "percentage"), roles,
+                  key=("job_id", "role_id")),
+        SeedTable("resume_job_bullet",
+                  ("bullet_id", "job_id", "text", "composition_tags", "display_order"),
+                  bullets, key=("bullet_id",)),
+    ]
+
+
+def _rows(db, table):
+    with sqlite3.connect(db) as conn:
+        return sorted(conn.execute(f"SELECT * FROM {table}").fetchall())
+
+
+class TestSqliteLoad:
+    def test_refresh_upserts_and_deletes(self, tmp_path):
+        db = tmp_path / "resume.db"
+        dsn = f"sqlite:///{db}"
+        counts = load(dsn, _tables(
+            [("job-a", "PM", True), ("job-b", "PMM", False)],
+            [("a-01", "job-a", "Shipped", ["id:a-01"], 1),
+             ("b-01", "job-b", "Grew", ["id:b-01"], 1)],
+            [("job-a", "pm", 1.0), ("job-b", "pmm", 0.5)],
+        ))
+        assert counts == {"resume_job": 2, "resume_job_role": 2, "resume_job_bullet": 2}
+
+        load(dsn, _tables(
+            [("job-a", "Senior PM", True)],
+            [("a-02", "job-a", "Led", ["id:a-02"], 1),
+             ("a-01", "job-a", "Shipped", ["id:a-01"], 2)],
+            [("job-a", "pm", 0.8)],
+        ))
+        assert _rows(db, "resume_job") == [("job-a", "Senior PM", 1)]
+        assert _rows(db, "resume_job_role") == [("job-a", "pm", 0.8)]
+        assert _rows(db, "resume_job_bullet") == [
+            ("a-01", "job-a", "Shipped", '["id:a-01"]', 2),
+            ("a-02", "job-a", "Led", '["id:a-02"]', 1),
+        ]
+
+    def test_bullet_edit_only_touches_that_row(self, tmp_path):
+        db = tmp_path / "resume.db"
+        dsn = f"sqlite:///{db}"
+        bullets = [("a-01", "job-a", "Shipped", ["id:a-01"], 1),
+                   ("a-02", "job-a", "Led", ["id:a-02"], 2)]
+        load(dsn, _tables([("job-a", "PM", True)], bullets, []))
+        with sqlite3.connect(db) as conn:
+            # A column the seed does not know about survives only on rows left in place
+            conn.execute("ALTER TABLE resume_job_bullet ADD COLUMN note")
+            conn.execute("UPDATE resume_job_bullet SET note = 'kept'")
+
+        bullets[1] = ("a-02", "job-a", "Led the team", ["id:a-02"], 2)
+        load(dsn, _tables([("job-a", "PM", True)], bullets, []))
+        assert _rows(db, "resume_job_bullet") == [
+            ("a-01", "job-a", "Shipped", '["id:a-01"]', 1, "kept"),
+            ("a-02", "job-a", "Led the team", '["id:a-02"]', 2, "kept"),
+        ]
+
+    def test_failure_rolls_back_everything(self, tmp_path):
+        db = tmp_path / "resume.db"
+        with sqlite3.connect(db) as conn:
+            conn.executescript(
+                "CREATE TABLE resume_job (id PRIMARY KEY, title, is_manager);"
+                "CREATE TABLE resume_job_role (job_id REFERENCES resume_job(id), role_id,"
+                " percentage, PRIMARY KEY (job_id, role_id));"
+            )
+        dsn = f"sqlite:///{db}"
+        load(dsn, _tables([("job-a", "PM", True)], [], [("job-a", "pm", 1.0)]))
+        with pytest.raises(LoadError, match="rolled back"):
+            load(dsn, _tables([("job-b", "PMM", False)], [], [("job-missing", "pm", 1.0)]))
+        assert _rows(db, "resume_job") == [("job-a", "PM", 1)]
+        assert _rows(db, "resume_job_role") == [("job-a", "pm", 1.0)]
+
+    def test_unsupported_dsn(self):
+        with pytest.raises(LoadError, match="Unsupported DSN"):
+            load("mysql://localhost/db", [])
+
+
+def test_postgres_merge_only_touches_changed_rows():
+    table = SeedTable("resume_job", ("id", "title"), [])
+    assert merge_sql(table, POSTGRES) == (
+        "INSERT INTO resume_job (id, title) SELECT id, title FROM stage_resume_job WHERE true "
+        "ON CONFLICT (id) DO UPDATE SET title = EXCLUDED.title "
+        "WHERE (resume_job.title) IS DISTINCT FROM (EXCLUDED.title)"
+    )
@@ -0,0 +1,69 @@
+"""Tests for the single-pass corpus table tokenizer."""
+
+import io
+
+from scripts.corpus_tables import iter_rows, split_cells
+
+CORPUS = """\
+# Bullet Corpus
+
+## job-a
+
+| id | text | metric_types | highlight | status |
+|----|------|:-------------|:---------:|-------:|
+| a-01 | Shipped search | Output | ⭐ | validated |
+| a-02 | Cut cost \\| latency | Speed | | |
+
+Notes.
+
+| id | text |
+|----|------|
+| a-99 | second table |
+
+## job-b
+
+```markdown
+| id | text |
+|----|------|
+| fake | example only |
+```
+
+| id | text | metric_types | highlight | status |
+|---|---|---|---|---|
+| b-01 | Grew revenue | Output | | raw |
+"""
+
+
+class TestSplitCells:
+    def test_outer_pipes_and_empty_cells(self):
+        assert split_cells("| a | | c |") == ["a", "", "c"]
+        assert split_cells("| a ||") == ["a", ""]
+        assert split_cells("a | b") == ["a", "b"]
+
+    def test_escaped_pipe(self):
+        assert split_cells("| a \\| b | c |") == ["a | b", "c"]
+
+
+class TestIterRows:
+    def test_rows_carry_section_table_and_line(self):
+        rows = list(iter_rows(CORPUS, "BULLET_CORPUS.md"))
+        assert [(r.section, r.table, r.cells[0], r.line) for r in rows] == [
+            ("job-a", 0, "a-01", 7),
+            ("job-a", 0, "a-02", 8),
+            ("job-a", 1, "a-99", 14),
+            ("job-b", 0, "b-01", 26),
+        ]
+        assert rows[1].get("text") == "Cut cost | latency"
+        assert rows[1].get("status") == ""
+        assert rows[3].where == "BULLET_CORPUS.md:26"
+
+    def test_streams_from_a_file_object(self):
+        assert list(iter_rows(io.StringIO(CORPUS))) == list(iter_rows(CORPUS))
+
+    def test_pipe_lines_without_delimiter_are_not_tables(self):
+        assert list(iter_rows("| not | a table |\n| still | not |\n")) == []
+
+    def test_reports_delimiter_width_mismatch(self, capsys):
+        rows = list(iter_rows("## s\n| a | b |\n|---|\n| 1 | 2 |\n", "X.md"))
+        assert [r.cells for r in rows] == [("1", "2")]
+        assert "X.md:3: delimiter row has 1 columns, header has 2" in capsys.readouterr().err
@@ -0,0 +1,84 @@
+"""Tests for the corpus referential-integrity check."""
+
+from scripts.corpus_validate import Problem, Vocabulary, validate
+from scripts.resume_model import Bullet, Job, SkillMapping, SkillTag
+
+VOCABULARY = Vocabulary(
+    companies={"Roku"},
+    dimensions={
+        "resume_role": {"product-management"},
+        "resume_skill": {"ml-ai"},
+        "resume_platform": {"web"},
+        "resume_product_domain": {"search"},
+    },
+    labels={
+        "platforms": ("resume_platform", {"Web": "web"}),
+        "domains": ("resume_product_domain", {"Search": "search", "Comms": "real-time-comms"}),
+    },
+    role_allocations={"job-roku": [("product-management", 1.0)]},
+)
+
+
+def _job(job_id="job-roku", company="Roku", domains=("Search",), platforms=("Web",), line=3):
+    return Job(job_id, company, "PM", "2015-01", "present", "Senior", False, 0, 0, "B2C",
+               [], "Streaming/OTT", list(domains), list(platforms), line=line)
+
+
+def _bullet(bullet_id, job_id="job-roku", line=4):
+    return Bullet(bullet_id, job_id, "Shipped it", ["Output"], False, "raw", line=line)
+
+
+class TestValidate:
+    def test_clean_corpus_has_no_problems(self):
+        problems = validate(
+            [_job()], [_bullet("r-01")], [SkillMapping("job-roku", "ml-ai", "expert", line=3)],
+            [SkillTag("ml", "ML", "technical", [], True, line=3)], VOCABULARY,
+        )
+        assert problems == []
+
+    def test_broken_references_are_reported_by_line(self):
+        problems = validate(
+            [_job(company="Acme", domains=("Search", "Comms", "Video"))],
+            [_bullet("r-01", line=4), _bullet("x-01", job_id="job-gone", line=9)],
+            [SkillMapping("job-roku", "kubernetes", "expert", line=5)],
+            [], VOCABULARY,
+        )
+        assert [str(p) for p in problems] == [
+            "BULLET_CORPUS.md:9: error: x-01: job 'job-gone' is not in RESUME_CORPUS.md",
+            "RESUME_CORPUS.md:3: error: job-roku: company 'Acme' has no UUID in COMPANY_UUIDS",
+            "RESUME_CORPUS.md:3: error: job-roku: domains 'Comms' maps to 'real-time-comms', "
+            "which is not in resume_product_domain",
+            "RESUME_CORPUS.md:3: warning: job-roku: domains 'Video' has no "
+            "resume_product_domain mapping and is dropped",
+            "SKILL_MAPPING.md:5: error: skill 'kubernetes' is not in resume_skill",
+        ]
+
+    def test_duplicate_keys_point_at_the_first_occurrence(self):
+        problems = validate(
+            [_job(line=3), _job(line=8)],
+            [_bullet("r-01", line=4), _bullet("r-01", line=6)],
+            [SkillMapping("job-roku", "ml-ai", "expert", line=3),
+             SkillMapping("job-roku", "ml-ai", "advanced", line=4)],
+            [], VOCABULARY,
+        )
+        assert [(p.source, p.line) for p in problems] == [
+            ("BULLET_CORPUS.md", 6), ("RESUME_CORPUS.md", 8), ("SKILL_MAPPING.md", 4)
+        ]
+        assert problems[1].message == "duplicate job id 'job-roku' (first at line 3)"
+
+    def test_role_allocations_are_checked_against_parsed_jobs(self):
+        vocabulary = Vocabulary(
+            VOCABULARY.companies, VOCABULARY.dimensions,
+            role_allocations={"job-roku": [("product-management", 1.0)],
+                              "job-old": [("sales", 1.0)]},
+        )
+        problems = validate([_job()], [], [], [], vocabulary)
+        assert problems == [
+            Problem("corpus_to_sql.py", 0, "ROLE_ALLOCATIONS: job 'job-old' is not in "
+                    "RESUME_CORPUS.md"),
+            Problem("corpus_to_sql.py", 0, "ROLE_ALLOCATIONS['job-old']: role 'sales' is not "
+                    "in resume_role"),
+        ]
+        assert str(problems[0]).startswith("corpus_to_sql.py: error: ")
+        # Without jobs (bullets-only runs) there is nothing to check job ids against
+        assert len(validate([], [], [], [], vocabulary)) == 1
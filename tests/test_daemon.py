@@ -0,0 +1,107 @@
+"""Tests for the publisher daemon's JSON-lines protocol and in-process fallback."""
+
+import os
+import socket
+import stat
+import threading
+
+import pytest
+
+from daemon import DaemonError, PublisherDaemon, PublisherRuntime, is_running, run_job, submit
+
+
+class FakeResearchAgent:
+    def research(self, notes_content):
+        if notes_content == "boom":
+            raise RuntimeError("research failed")
+        return f"research on {notes_content}"
+
+
+@pytest.fixture
+def fake_agents(monkeypatch):
+    monkeypatch.setattr(PublisherRuntime, "agent", lambda self, name: FakeResearchAgent())
+
+
+@pytest.fixture
+def daemon(tmp_path, fake_agents):
+    socket_path = tmp_path / "run" / "publisher.sock"
+    server = PublisherDaemon(socket_path)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield socket_path
+    server.shutdown()
+    server.server_close()
+    thread.join()
+
+
+class TestProtocol:
+    def test_round_trip_streams_progress_then_result(self, daemon):
+        events = list(submit("research", {"notes_content": "notes"}, daemon))
+        assert [e["event"] for e in events] == ["progress", "progress", "result"]
+        assert events[0]["message"] == "Researching..."
+        assert events[-1]["output"] == "research on notes"
+
+    def test_ping_reports_the_daemon_process(self, daemon):
+        (result,) = submit("ping", socket_path=daemon)
+        assert result["output"]["pid"] == os.getpid()
+        assert is_running(daemon)
+
+    def test_failures_come_back_as_error_events(self, daemon):
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.connect(str(daemon))
+            sock.sendall(b"not json\n")
+            reply = sock.makefile("r").readline()
+        assert '"event": "error"' in reply and "Bad request" in reply
+
+        with pytest.raises(DaemonError, match="RuntimeError: research failed"):
+            run_job("research", {"notes_content": "boom"}, socket_path=daemon)
+        with pytest.raises(DaemonError, match="Unknown job"):
+            run_job("publish", {}, socket_path=daemon)
+
+    def test_socket_is_owner_only(self, daemon):
+        assert stat.S_IMODE(daemon.stat().st_mode) == 0o600
+        assert stat.S_IMODE(daemon.parent.stat().st_mode) == 0o700
+
+    def test_shutdown_removes_the_socket(self, tmp_path, fake_agents):
+        socket_path = tmp_path / "publisher.sock"
+        server = PublisherDaemon(socket_path)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        assert [e["output"] for e in submit("shutdown", socket_path=socket_path)] == ["stopping"]
+        thread.join(timeout=5)
+        server.server_close()
+        assert not socket_path.exists()
+        assert not is_running(socket_path)
+
+
+class TestRuntime:
+    def test_concurrent_jobs_are_all_counted(self, fake_agents):
+        runtime = PublisherRuntime()
+
+        def work():
+            for _ in range(200):
+                runtime.run("research", {"notes_content": "n"}, lambda message: None)
+
+        threads = [threading.Thread(target=work) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert runtime.jobs_served == 1600
+        assert runtime.run("ping", {}, lambda message: None)["jobs_served"] == 1600
+
+
+class TestFallback:
+    def test_runs_in_process_without_a_daemon(self, tmp_path, fake_agents):
+        progress = []
+        output = run_job("research", {"notes_content": "notes"}, progress.append,
+                         socket_path=tmp_path / "none.sock")
+        assert output == "research on notes"
+        assert progress[0] == "Researching..."
+
+    def test_stale_socket_counts_as_not_running(self, tmp_path, fake_agents):
+        stale = tmp_path / "stale.sock"
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.bind(str(stale))  # bound but never listening, like a crashed daemon
+        assert not is_running(stale)
+        assert run_job("ping", {}, socket_path=stale)["pid"] == os.getpid()
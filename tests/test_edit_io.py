@@ -0,0 +1,67 @@
+"""Tests for corpus and sidecar serialization."""
+
+import json
+
+import yaml
+
+from scripts.edit_io import (
+    count_jsonl_edits,
+    count_yaml_edits,
+    iter_jsonl,
+    load_yaml,
+    write_document,
+)
+from scripts.sidecar_log import SidecarLog
+
+
+def _edits(n):
+    return [
+        {"id": f"edit-{i:03d}", "original": "a: b", "edited": "ü", "flagged": i % 3 == 0,
+         "meta": {"flagged": True}, "tags": ["flagged", True], "line_number": i}
+        for i in range(n)
+    ]
+
+
+class TestWriteDocument:
+    def test_matches_whole_document_dump(self, tmp_path):
+        corpus = {"source_file": "posts/a.md", "style": None, "edits": _edits(20), "message": "x"}
+        path = write_document(tmp_path / "c.yaml", corpus)
+        assert path.read_text() == yaml.dump(
+            corpus, default_flow_style=False, sort_keys=False, allow_unicode=True
+        )
+        assert load_yaml(path) == corpus
+
+    def test_streams_items_from_a_generator(self, tmp_path):
+        path = write_document(tmp_path / "c.yaml", {"source_file": "a.md", "edits": None},
+                              items=(e for e in _edits(3)))
+        assert load_yaml(path)["edits"] == _edits(3)
+
+    def test_empty_items(self, tmp_path):
+        path = write_document(tmp_path / "c.yaml", {"source_file": "a.md", "edits": []})
+        assert load_yaml(path) == {"source_file": "a.md", "edits": []}
+
+
+class TestCounts:
+    def test_yaml_counts_only_top_level_flags(self, tmp_path):
+        path = write_document(tmp_path / "c.yaml", {"source_file": "a.md", "edits": _edits(10)})
+        assert count_yaml_edits(path) == (10, 4)
+
+    def test_yaml_without_edits(self, tmp_path):
+        path = tmp_path / "c.yaml"
+        path.write_text("source_file: a.md\nflagged: true\n")
+        assert count_yaml_edits(path) == (0, 0)
+
+    def test_jsonl_counts_and_torn_lines(self, tmp_path):
+        path = tmp_path / "log.jsonl"
+        lines = [json.dumps(e) for e in _edits(5)] + ['{"original": "x", "flagged": tr']
+        path.write_text("\n".join(lines) + "\n")
+        assert count_jsonl_edits(path) == (5, 2)
+        assert len(list(iter_jsonl(path))) == 5
+
+    def test_sidecar_summary_spans_yaml_and_log(self, tmp_path):
+        log = SidecarLog("post", tmp_path)
+        for i in range(4):
+            log.append({"original": f"o{i}", "flagged": i == 0})
+        log.compact()
+        log.append({"original": "late", "flagged": True})
+        assert log.summary() == (5, 2)
@@ -0,0 +1,134 @@
+"""Tests for matching sidecar intent entries to diff-extracted edits."""
+
+from scripts.edit_matching import collapse_watch, dedupe_sidecar, match_sidecar, normalize
+
+
+def _edit(original, edited, sentence_o="", sentence_e="", line=0):
+    return {
+        "original": original,
+        "edited": edited,
+        "full_sentence_original": sentence_o,
+        "full_sentence_edited": sentence_e,
+        "line_number": line,
+    }
+
+
+class TestNormalize:
+    def test_whitespace_and_quotes(self):
+        assert normalize("  It’s   a\n“draft” ") == "It's a \"draft\""
+
+
+class TestMatchSidecar:
+    def test_exact_pair(self):
+        edits = [_edit("Our", "The"), _edit("very", "quite")]
+        matches, unmatched = match_sidecar(edits, [{"original": "very ", "edited": "quite"}])
+        assert matches == {1: 0}
+        assert unmatched == []
+
+    def test_repeated_span_prefers_nearest_line(self):
+        edits = [_edit("we", "I", line=3), _edit("we", "I", line=40)]
+        matches, _ = match_sidecar(edits, [{"original": "we", "edited": "I", "line_number": 38}])
+        assert matches == {1: 0}
+
+    def test_sentence_context_annotates_every_edit_in_sentence(self):
+        sentence_o = "Our team thinks this is very good."
+        sentence_e = "The team thinks this is quite good."
+        edits = [
+            _edit("Our", "The", sentence_o, sentence_e),
+            _edit("very", "quite", sentence_o, sentence_e),
+        ]
+        matches, _ = match_sidecar(edits, [{"original": sentence_o, "edited": sentence_e}])
+        assert matches == {0: 0, 1: 0}
+
+    def test_fuzzy_match_on_near_identical_text(self):
+        edits = [_edit(
+            "captures", "records",
+            "The pipeline captures every edit.", "The pipeline records every edit.",
+        )]
+        sidecar = [{
+            "original": "pipeline captures every edit",
+            "edited": "pipeline records every edit",
+        }]
+        matches, unmatched = match_sidecar(edits, sidecar)
+        assert matches == {0: 0}
+        assert unmatched == []
+
+    def test_unrelated_entries_stay_unmatched(self):
+        edits = [_edit("Our", "The", "Our focus is outcomes.", "The focus is outcomes.")]
+        sidecar = [{"original": "Completely different words here.", "edited": "Nothing alike."}]
+        matches, unmatched = match_sidecar(edits, sidecar)
+        assert matches == {}
+        assert unmatched == [0]
+
+    def test_each_diff_edit_matched_once_in_fuzzy_stage(self):
+        edits = [_edit("a", "b", "Shared sentence about edits.", "Shared sentence about changes.")]
+        sidecar = [
+            {"original": "Shared sentence about edits", "edited": "Shared sentence about changes"},
+            {"original": "Shared sentence about edit", "edited": "Shared sentence about change"},
+        ]
+        matches, unmatched = match_sidecar(edits, sidecar)
+        assert matches == {0: 0}
+        assert unmatched == [1]
+
+
+class TestDedupeSidecar:
+    def test_agent_entry_absorbs_one_matching_watch_entry(self):
+        agent = {"original": "utilize", "edited": "use", "editor_type": "agent", "reason": "plain"}
+        watch = {"original": "utilize ", "edited": "use", "captured_by": "watch"}
+        other = {"original": "very good", "edited": "good", "captured_by": "watch"}
+        assert dedupe_sidecar([watch, agent, dict(watch), other]) == [agent, watch, other]
+
+
+def _watch(original, edited, sentence_o, sentence_e, save, file="posts/a/draft.md"):
+    return {**_edit(original, edited, sentence_o, sentence_e), "captured_by": "watch",
+            "timestamp": f"t{save}", "file": file, "change_type": "replace"}
+
+
+class TestCollapseWatch:
+    def test_chained_saves_fold_into_one_edit(self):
+        first = _watch("utilize", "employ", "We utilize tools.", "We employ tools.", 1)
+        second = _watch("employ", "use", "We employ tools.", "We use tools.", 2)
+        [entry] = collapse_watch([first, second])
+        assert (entry["original"], entry["edited"]) == ("utilize", "use")
+        assert entry["full_sentence_original"] == "We utilize tools."
+        assert entry["full_sentence_edited"] == "We use tools."
+        assert entry["timestamp"] == "t2"
+
+    def test_wider_and_narrower_later_edits(self):
+        first = _watch("utilize", "make use of", "We utilize it.", "We make use of it.", 1)
+        wider = _watch("We make use of", "I use", "We make use of it.", "I use it.", 2)
+        narrower = _watch("make", "put", "We make use of it.", "We put use of it.", 2)
+        assert [(e["original"], e["edited"]) for e in collapse_watch([first, wider])] == [
+            ("We utilize", "I use"),
+        ]
+        assert [(e["original"], e["edited"]) for e in collapse_watch([first, narrower])] == [
+            ("utilize", "put use of"),
+        ]
+
+    def test_undone_edit_drops_out(self):
+        first = _watch("utilize", "use", "We utilize tools.", "We use tools.", 1)
+        undo = _watch("use", "utilize", "We use tools.", "We utilize tools.", 2)
+        assert collapse_watch([first, undo]) == []
+
+    def test_sibling_edits_follow_the_sentence(self):
+        # Save 1 makes two edits in one sentence; saves 2 and 3 each rewrite one of them
+        s0, s1 = "It is very good to utilize it.", "It is good to use it."
+        s2, s3 = "It is great to use it.", "It is great to apply it."
+        saves = [
+            _watch("very good", "good", s0, s1, 1),
+            _watch("utilize", "use", s0, s1, 1),
+            _watch("good", "great", s1, s2, 2),
+            _watch("use", "apply", s2, s3, 3),
+        ]
+        assert sorted((e["original"], e["edited"]) for e in collapse_watch(saves)) == [
+            ("utilize", "apply"), ("very good", "great"),
+        ]
+
+    def test_other_files_agent_entries_and_unrelated_spans_are_kept(self):
+        first = _watch("utilize", "use", "We utilize tools.", "We use tools.", 1)
+        elsewhere = _watch("use", "apply", "We use tools.", "We apply tools.", 2, file="b.md")
+        agent = {**_edit("use", "apply", "We use tools.", "We apply tools."),
+                 "editor_type": "agent"}
+        unrelated = _watch("tools", "kits", "We use tools.", "We use kits.", 2)
+        sidecar = [first, elsewhere, agent, unrelated]
+        assert collapse_watch(sidecar) == sidecar
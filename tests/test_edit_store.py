@@ -0,0 +1,105 @@
+"""Tests for the SQLite edit corpus store."""
+
+import json
+import os
+
+import pytest
+import yaml
+
+from scripts.edit_store import connect, ingest, query, report
+
+
+def _write_corpus(root, name, source, edits, **extra):
+    path = root / "edits" / name
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(yaml.safe_dump({"source_file": source, **extra, "edits": edits}))
+    return path
+
+
+@pytest.fixture
+def store(tmp_path):
+    _write_corpus(tmp_path, "2026-01-10-post-a.yaml", "posts/a/content.md", [
+        {"id": "edit-001", "original": "Our methodology", "edited": "The methodology",
+         "reason": "Remove first person", "rule_applied": "whitepaper.md#voice",
+         "editor_type": "agent", "flagged": True},
+        {"id": "edit-002", "original": "utilize", "edited": "use",
+         "reason": "Plain language", "editor_type": "human"},
+    ], style="whitepaper")
+    _write_corpus(tmp_path, "2026-02-01-post-b.yaml", "posts/b/content.md", [
+        {"id": "edit-001", "original": "leverage synergies", "edited": "work together",
+         "reason": "Jargon reduction", "style": "blog", "editor_type": "human"},
+    ])
+    conn = connect(tmp_path / "edits.db")
+    ingest(conn, tmp_path)
+    return tmp_path, conn
+
+
+class TestIngest:
+    def test_counts_and_defaults(self, store):
+        _, conn = store
+        assert query(conn, count=True) == 3
+        # Corpus-level style applies to edits that don't set their own
+        assert query(conn, style="whitepaper", count=True) == 2
+
+    def test_unchanged_files_are_skipped(self, store):
+        root, conn = store
+        stats = ingest(conn, root)
+        assert (stats["ingested"], stats["skipped"]) == (0, 2)
+
+    def test_changed_and_deleted_files_are_refreshed(self, store):
+        root, conn = store
+        path = _write_corpus(root, "2026-01-10-post-a.yaml", "posts/a/content.md", [
+            {"id": "edit-001", "original": "x", "edited": "y"},
+        ])
+        os.utime(path, ns=(1, 1))
+        (root / "edits" / "2026-02-01-post-b.yaml").unlink()
+        stats = ingest(conn, root)
+        assert (stats["ingested"], stats["removed"]) == (1, 1)
+        assert query(conn, count=True) == 1
+        assert query(conn, text="synergies", count=True) == 0
+
+    def test_archived_sidecars_are_included(self, store):
+        root, conn = store
+        archive = root / "edits" / ".pending" / "archive" / "2026-03-01-post-c.yaml"
+        archive.parent.mkdir(parents=True)
+        archive.write_text(yaml.safe_dump({"source_file": "posts/c.md", "edits": [
+            {"id": "edit-001", "original": "a", "edited": "b", "editor_type": "agent"},
+        ]}))
+        ingest(conn, root)
+        assert query(conn, editor_type="agent", count=True) == 2
+
+
+class TestQuery:
+    def test_rule_and_flag_filters(self, store):
+        _, conn = store
+        rows = query(conn, rule="whitepaper.md#voice", flagged=True, style="whitepaper")
+        assert [(r["source_file"], r["edit_id"]) for r in rows] == [
+            ("posts/a/content.md", "edit-001"),
+        ]
+
+    def test_date_range_and_source_glob(self, store):
+        _, conn = store
+        assert query(conn, since="2026-02-01", count=True) == 1
+        assert query(conn, until="2026-01-31", source="posts/a/*", count=True) == 2
+
+    def test_full_text_search(self, store):
+        _, conn = store
+        rows = query(conn, text="jargon OR utilize")
+        assert {r["edited"] for r in rows} == {"work together", "use"}
+
+
+class TestReport:
+    def test_table_json_and_count(self, store):
+        _, conn = store
+        table = report(conn, rule="whitepaper.md#voice")
+        assert table.splitlines() == [
+            "* 2026-01-10 posts/a/content.md edit-001 (agent, whitepaper) [whitepaper.md#voice]",
+            "    - Our methodology",
+            "    + The methodology",
+            "    why: Remove first person",
+            "",
+            "1 edit(s)",
+        ]
+        rows = json.loads(report(conn, "json", limit=1, style="blog"))
+        assert [r["edited"] for r in rows] == ["work together"]
+        assert report(conn, "count", editor_type="human") == "2"
@@ -0,0 +1,126 @@
+"""Tests for batched rule extraction over flagged edits."""
+
+import json
+
+from scripts.extract_rules import (
+    RuleCache,
+    cluster_edits,
+    extract_rules,
+    parse_response,
+    plan_batches,
+    to_distilled,
+)
+
+
+def _edit(original, edited, style="blog", rule=None, n=0, reason="Plain words"):
+    return {
+        "original": original, "edited": edited, "style": style, "rule_applied": rule,
+        "reason": reason, "source_file": "posts/a.md", "edit_id": f"edit-{n:03d}",
+    }
+
+
+def _fake_model(calls):
+    """complete() stand-in: one rule per cluster id found in the batch text."""
+    def complete(batch):
+        calls.append(batch)
+        ids = [line.split()[-1] for line in batch.splitlines() if line.startswith("## Cluster")]
+        return "Here you go:\n" + json.dumps([
+            {"cluster": c, "statement": f"Rule for {c}", "confidence": "high", "scope": "global"}
+            for c in ids
+        ])
+    return complete
+
+
+class TestClusterEdits:
+    def test_groups_by_style_and_rule_then_merges_near_duplicates(self):
+        edits = [
+            _edit("We utilize the tool.", "We use the tool.", n=1),
+            _edit("We utilize the tools.", "We use the tools.", n=2),
+            _edit("It is very good.", "It is good.", n=3),
+            _edit("We utilize the tool.", "We use the tool.", style="whitepaper", n=4),
+            _edit("We utilize the tool.", "We use the tool.", rule="blog.md#plain", n=5),
+        ]
+        clusters = cluster_edits(edits)
+        sizes = sorted((c.style, c.rule or "", len(c.edits)) for c in clusters)
+        assert sizes == [
+            ("blog", "", 1), ("blog", "", 2), ("blog", "blog.md#plain", 1),
+            ("whitepaper", "", 1),
+        ]
+
+    def test_key_changes_with_members(self):
+        a = cluster_edits([_edit("Utilize it.", "Use it.", n=1)])[0]
+        b = cluster_edits([_edit("Utilize it.", "Use it.", n=1)])[0]
+        c = cluster_edits([_edit("Utilize it.", "Use it.", n=1, reason="Shorter")])[0]
+        assert a.key == b.key != c.key
+
+    def test_newer_edit_leaves_existing_cluster_keys_alone(self):
+        def dated(original, n, date):
+            return {**_edit(f"Act {original} now.", "Act now.", n=n), "date": date}
+
+        old = [dated("in order", 1, "2026-01-01"), dated("order to", 2, "2026-01-02")]
+        before = {c.key for c in cluster_edits(old)}
+        assert len(before) == 2
+        # Close to both old edits; newest first (edit_store order) it would lead and absorb both
+        newer = dated("in order to", 3, "2026-02-01")
+        after = cluster_edits([newer, *reversed(old)])
+        assert [e["edit_id"] for e in after[0].edits] == ["edit-001", "edit-003"]
+        assert len(before & {c.key for c in after}) == 1
+
+
+class TestPlanBatches:
+    def test_batch_size_and_run_budget(self):
+        clusters = cluster_edits([
+            _edit(f"Phrase number {i} utilize.", f"Sentence {i} use.", rule=f"r{i}", n=i)
+            for i in range(10)
+        ])
+        batches, deferred = plan_batches(clusters, batch_tokens=80, token_budget=10_000)
+        assert not deferred
+        assert len(batches) > 1 and sum(len(b) for b in batches) == 10
+
+        batches, deferred = plan_batches(clusters, batch_tokens=80, token_budget=500)
+        assert deferred and sum(len(b) for b in batches) + len(deferred) == 10
+
+
+class TestExtractRules:
+    def test_cached_clusters_are_not_resent(self, tmp_path):
+        edits = [_edit(f"Text {i} utilize.", f"Text {i} use.", rule=f"r{i}", n=i)
+                 for i in range(4)]
+        clusters = cluster_edits(edits)
+        cache = RuleCache(tmp_path)
+        calls = []
+
+        first = extract_rules(clusters, _fake_model(calls), cache, batch_tokens=60)
+        assert (first["extracted"], first["cached"], first["failed"]) == (4, 0, 0)
+        n_calls = len(calls)
+        assert n_calls == first["batches"] > 1
+
+        edits.append(_edit("Brand new edit here.", "New edit.", rule="r9", n=9))
+        second = extract_rules(cluster_edits(edits), _fake_model(calls), cache)
+        assert (second["extracted"], second["cached"]) == (1, 4)
+        assert len(calls) == n_calls + 1
+
+    def test_failed_batches_are_retried_next_run(self, tmp_path):
+        clusters = cluster_edits([_edit("Utilize it.", "Use it.")])
+        cache = RuleCache(tmp_path)
+
+        def broken(batch):
+            raise RuntimeError("overloaded")
+
+        assert extract_rules(clusters, broken, cache)["failed"] == 1
+        assert extract_rules(clusters, _fake_model([]), cache)["extracted"] == 1
+
+    def test_distilled_shape(self, tmp_path):
+        clusters = cluster_edits([_edit("Utilize it.", "Use it.", n=n) for n in range(3)])
+        result = extract_rules(clusters, _fake_model([]), RuleCache(tmp_path))
+        [rule] = to_distilled(clusters, result["rules"])
+        assert rule["id"] == "rule-001"
+        assert rule["frequency"] == 3
+        assert (rule["scope"], rule["style"], rule["flagged"]) == ("global", None, True)
+        assert rule["status"] == "candidate"
+        assert rule["source_edits"][0] == "posts/a.md#edit-000"
+
+
+def test_parse_response_ignores_malformed_items():
+    text = 'Sure. [{"cluster": "abc", "statement": "Be brief"}, {"cluster": "x"}, 3]'
+    assert list(parse_response(text)) == ["abc"]
+    assert parse_response("no json here") == {}
@@ -0,0 +1,72 @@
+"""Tests for merging per-key-point research findings."""
+
+from agents.findings import merge_findings
+
+
+def _findings(evidence, citations="", concepts="", entities="", quality=""):
+    return (
+        f"## Supporting Evidence (1P)\n{evidence}\n\n"
+        f"## Recommended 3P Citations\n{citations}\n\n"
+        f"## Key Concepts\n{concepts}\n\n"
+        f"## Entities to Link\n{entities}\n\n"
+        f"## Research Quality Notes\n{quality}\n"
+    )
+
+
+FIRST = _findings(
+    "### semops-core\n- **Location**: docs/a.md",
+    citations="### Fowler on metrics\n- **Link**: https://martinfowler.com/metrics/",
+    concepts="- {{Semantic Layer}}: shared metric definitions",
+    entities="- [dbt Labs]: semantic layer vendor",
+    quality="- 1P coverage is thin",
+)
+SECOND = _findings(
+    "### semops-core\n- **Location**: docs/b.md",
+    citations=(
+        "### Martin Fowler: Metrics\n- **Link**: https://MartinFowler.com/metrics\n\n"
+        "### Benn Stancil\n- **Link**: n/a"
+    ),
+    concepts=(
+        "- {{semantic layer}}: shared, governed metric definitions across tools\n"
+        "- {{Metric Drift}}: diverging numbers"
+    ),
+    entities="- dbt Labs: vendor (second mention)\n- Looker: BI tool",
+    quality="- 1P coverage is thin\n- No counterexamples found",
+)
+
+
+class TestMergeFindings:
+    def test_evidence_stays_grouped_per_point(self):
+        results = [("Drift", FIRST), ("Owner", SECOND)]
+        merged = merge_findings("Semantic Ops", "Ops own it.", results)
+        assert merged.startswith("# Research Findings: Semantic Ops\n\n## POV Summary\nOps own it.")
+        assert "## Key Point 1: Drift\n\n### Supporting Evidence (1P)\n#### semops-core" in merged
+        assert merged.index("docs/a.md") < merged.index("## Key Point 2: Owner")
+        assert merged.index("## Key Point 2: Owner") < merged.index("docs/b.md")
+
+    def test_citations_dedupe_by_link_and_list_their_points(self):
+        merged = merge_findings("T", "P", [("Drift", FIRST), ("Owner", SECOND)])
+        assert merged.count("**Link**: https://") == 1
+        assert "### Fowler on metrics" in merged
+        assert "- **Supports**: Key Point 1, Key Point 2" in merged
+        # No usable link: keyed by heading instead
+        assert "### Benn Stancil\n- **Link**: n/a\n- **Supports**: Key Point 2" in merged
+
+    def test_concepts_keep_the_longest_definition(self):
+        merged = merge_findings("T", "P", [("Drift", FIRST), ("Owner", SECOND)])
+        concepts = merged.split("## Key Concepts\n")[1].split("\n\n")[0]
+        assert concepts.split("\n") == [
+            "- {{semantic layer}}: shared, governed metric definitions across tools",
+            "- {{Metric Drift}}: diverging numbers",
+        ]
+
+    def test_entities_and_notes_keep_the_first_mention(self):
+        merged = merge_findings("T", "P", [("Drift", FIRST), ("Owner", SECOND)])
+        assert "- dbt Labs: semantic layer vendor\n- Looker: BI tool" in merged
+        assert merged.endswith(
+            "## Research Quality Notes\n- 1P coverage is thin\n- No counterexamples found\n"
+        )
+
+    def test_empty_sections_are_left_out(self):
+        merged = merge_findings("T", "P", [("Drift", "## Supporting Evidence (1P)\n\n")])
+        assert merged == "# Research Findings: T\n\n## POV Summary\nP\n\n## Key Point 1: Drift\n"
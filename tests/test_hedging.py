@@ -0,0 +1,134 @@
+"""Tests for hedged requests: latency percentiles, the hedge budget and run_hedged."""
+
+import threading
+import time
+
+import pytest
+
+from agents.hedging import Attempt, HedgeBudget, LatencyTracker, run_hedged
+
+DELAY = 0.05
+
+
+def _budget(calls=100, fraction=1.0):
+    budget = HedgeBudget(fraction)
+    budget.calls = calls
+    return budget
+
+
+def _stalled(attempt: Attempt):
+    """A call that never produces a token until cancelled (or 2s pass)."""
+    attempt.cancelled.wait(2)
+    return f"{attempt.model} (cancelled)" if attempt.cancelled.is_set() else attempt.model
+
+
+class TestLatencyTracker:
+    def test_no_percentile_until_min_samples(self):
+        tracker = LatencyTracker()
+        for i in range(19):
+            tracker.add("outline", i / 10)
+        assert tracker.percentile("outline", 95, min_samples=20) is None
+        tracker.add("outline", 1.9)
+        assert tracker.percentile("outline", 95, min_samples=20) == 1.8
+        assert tracker.percentile("draft", 95, min_samples=1) is None
+
+    def test_window_drops_old_samples(self):
+        tracker = LatencyTracker(window=3)
+        for seconds in (9.0, 1.0, 1.0, 1.0):
+            tracker.add("t", seconds)
+        assert tracker.percentile("t", 100, min_samples=1) == 1.0
+
+
+class TestHedgeBudget:
+    def test_hedges_stay_under_the_fraction(self):
+        budget = HedgeBudget(0.1)
+        assert not budget.try_acquire()  # no traffic yet
+        for _ in range(20):
+            budget.count_call()
+        assert [budget.try_acquire() for _ in range(3)] == [True, True, False]
+        for _ in range(10):
+            budget.count_call()
+        assert budget.try_acquire()
+        assert (budget.calls, budget.hedges) == (30, 3)
+
+    def test_exhausted_budget_does_not_hedge(self):
+        def call(attempt):
+            time.sleep(DELAY * 2)
+            return attempt.model
+
+        budget = HedgeBudget(0.0)
+        result, winner, hedged = run_hedged(call, "primary", "hedge", DELAY, budget)
+        assert (result, winner.model, hedged) == ("primary", "primary", False)
+        assert budget.hedges == 0
+
+
+class TestRunHedged:
+    def test_no_delay_means_no_hedge(self):
+        calls = []
+
+        def call(attempt):
+            calls.append(attempt.model)
+            time.sleep(DELAY * 2)
+            return attempt.model
+
+        result, _, hedged = run_hedged(call, "primary", "hedge", None, _budget())
+        assert (result, hedged, calls) == ("primary", False, ["primary"])
+
+    def test_hedge_fires_after_the_delay_and_cancels_the_loser(self):
+        started = {}
+        closed = threading.Event()
+
+        def call(attempt):
+            started[attempt.model] = time.monotonic()
+            if attempt.model == "primary":
+                attempt.on_cancel(closed.set)
+                return _stalled(attempt)
+            attempt.mark_first_token()
+            return "hedge"
+
+        begin = time.monotonic()
+        result, winner, hedged = run_hedged(call, "primary", "hedge", DELAY, _budget())
+        assert (result, winner.model, hedged) == ("hedge", "hedge", True)
+        assert started["hedge"] - begin >= DELAY
+        assert closed.wait(1)
+        # Time-to-first-token counts from the request's start, delay included
+        assert winner.first_token_at >= DELAY
+
+    def test_first_token_before_the_delay_prevents_a_hedge(self):
+        def call(attempt):
+            attempt.mark_first_token()
+            time.sleep(DELAY * 3)
+            return attempt.model
+
+        result, winner, hedged = run_hedged(call, "primary", "hedge", DELAY, _budget())
+        assert (result, hedged) == ("primary", False)
+        assert winner.first_token_at < DELAY
+
+    def test_primary_can_still_win_after_a_hedge(self):
+        def call(attempt):
+            if attempt.model == "primary":
+                time.sleep(DELAY * 2)
+                return "primary"
+            return _stalled(attempt)
+
+        result, winner, hedged = run_hedged(call, "primary", "hedge", DELAY, _budget())
+        assert (result, winner.model, hedged) == ("primary", "primary", True)
+
+    def test_error_propagates_when_both_attempts_fail(self):
+        def call(attempt):
+            if attempt.model == "primary":
+                time.sleep(DELAY * 2)
+            raise RuntimeError(f"{attempt.model} failed")
+
+        with pytest.raises(RuntimeError, match="failed"):
+            run_hedged(call, "primary", "hedge", DELAY, _budget())
+
+    def test_one_failure_is_not_fatal(self):
+        def call(attempt):
+            if attempt.model == "hedge":
+                raise RuntimeError("hedge failed")
+            time.sleep(DELAY * 2)
+            return "primary"
+
+        result, _, hedged = run_hedged(call, "primary", "hedge", DELAY, _budget())
+        assert (result, hedged) == ("primary", True)
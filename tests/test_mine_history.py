@@ -0,0 +1,139 @@
+"""Tests for history-wide edit mining over git log -p."""
+
+import json
+import subprocess
+from pathlib import Path
+
+from scripts.edit_io import load_yaml
+from scripts.mine_history import HistoryMiner, apply_hunks, parse_log
+from scripts.sidecar_log import file_key
+
+
+def _git(repo, *args):
+    subprocess.run(
+        ["git", "-c", "user.name=Test", "-c", "user.email=test@example.com", *args],
+        cwd=repo, check=True, capture_output=True,
+    )
+
+
+def _commit(repo, message, files):
+    for name, text in files.items():
+        path = repo / name
+        if text is None:
+            _git(repo, "rm", "-q", name)
+            continue
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text)
+        _git(repo, "add", name)
+    _git(repo, "commit", "-q", "-m", message)
+
+
+def _init(tmp_path):
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    _git(repo, "init", "-q")
+    return repo
+
+
+def _mined(out):
+    return sorted(
+        (c["source_file"], c["session_reason"], [(e["original"], e["edited"]) for e in c["edits"]])
+        for c in (load_yaml(p) for p in out.glob("*.yaml"))
+    )
+
+
+class TestApplyHunks:
+    def test_insertion_replacement_and_mismatch(self):
+        old = "a\nb\nc\n"
+        assert apply_hunks(old, [(2, 1, ["-b", "+B"])]) == "a\nB\nc\n"
+        assert apply_hunks(old, [(1, 0, ["+x"])]) == "a\nx\nb\nc\n"
+        assert apply_hunks(old, [(0, 0, ["+top"])]) == "top\na\nb\nc\n"
+        assert apply_hunks(old, [(2, 1, ["-z", "+B"])]) is None
+
+
+class TestParseLog:
+    def test_commits_files_and_hunks(self):
+        lines = [
+            "\x1eabc\x1f2026-01-02T00:00:00+00:00\x1f[ai-draft] Draft post",
+            "",
+            "diff --git a/posts/p/draft.md b/posts/p/draft.md",
+            "new file mode 100644",
+            "--- /dev/null",
+            "+++ b/posts/p/draft.md",
+            "@@ -0,0 +1,2 @@",
+            "+line one",
+            "+--- not a header",
+            "\x1edef\x1f2026-01-03T00:00:00+00:00\x1fRename",
+            "diff --git a/old.md b/new.md",
+            "similarity index 100%",
+            "rename from old.md",
+            "rename to new.md",
+        ]
+        first, second = parse_log(iter(lines))
+        assert first.ai_draft and not second.ai_draft
+        [diff] = first.files
+        assert (diff.old_path, diff.new_path) == (None, "posts/p/draft.md")
+        assert diff.hunks == [(0, 0, ["+line one", "+--- not a header"])]
+        assert (second.files[0].old_path, second.files[0].new_path) == ("old.md", "new.md")
+
+
+class TestHistoryMiner:
+    def test_follows_files_from_their_ai_draft_baseline(self, tmp_path):
+        repo = _init(tmp_path)
+        _commit(repo, "Notes", {"posts/p/notes.md": "Some notes here.\n"})
+        _commit(repo, "[ai-draft] Draft",
+                {"posts/p/draft.md": "We utilize tools. It is very good.\n"})
+        _commit(repo, "Plain words", {"posts/p/draft.md": "We use tools. It is very good.\n"})
+        _commit(repo, "Edit notes", {"posts/p/notes.md": "Other notes.\n"})
+        _commit(repo, "Trim", {"posts/p/draft.md": "We use tools. It is good.\n"})
+
+        out = tmp_path / "history"
+        stats = HistoryMiner(repo, out).run()
+
+        assert stats["commits"] == 5
+        assert _mined(out) == [
+            ("posts/p/draft.md", "Plain words", [("utilize", "use")]),
+            ("posts/p/draft.md", "Trim", [("very", "")]),
+        ]
+        corpus = load_yaml(next(out.glob("*-p-draft-*.yaml")))
+        assert corpus["ai_draft_commit"] and corpus["commit"] != corpus["ai_draft_commit"]
+
+    def test_corpus_names_use_the_capture_file_key(self, tmp_path, monkeypatch):
+        repo = _init(tmp_path)
+        _commit(repo, "[ai-draft] Draft", {"posts/p/draft.md": "We utilize tools.\n"})
+        _commit(repo, "Plain words", {"posts/p/draft.md": "We use tools.\n"})
+        monkeypatch.chdir(repo)
+        HistoryMiner(Path("."), tmp_path / "history").run()
+        [corpus] = (tmp_path / "history").glob("*.yaml")
+        assert f"-{file_key('posts/p/draft.md')}-" in corpus.name
+
+    def test_resumes_from_checkpoint(self, tmp_path):
+        repo = _init(tmp_path)
+        _commit(repo, "[ai-draft] Draft", {"a.md": "First line.\n\nSecond line.\n"})
+        _commit(repo, "Edit one", {"a.md": "First line!\n\nSecond line.\n"})
+        out = tmp_path / "history"
+        HistoryMiner(repo, out).run()
+        checkpoint = json.loads((out / ".checkpoint.json").read_text())
+        assert list(checkpoint["baselines"]) == ["a.md"]
+
+        _commit(repo, "Edit two", {"a.md": "First line!\n\nSecond line, revised.\n"})
+        stats = HistoryMiner(repo, out).run()
+
+        assert stats["commits"] == 1
+        assert [reason for _, reason, _ in _mined(out)] == ["Edit one", "Edit two"]
+
+    def test_renames_rebaselines_and_deletions(self, tmp_path):
+        repo = _init(tmp_path)
+        _commit(repo, "[ai-draft] Draft", {"a.md": "Alpha text.\n"})
+        _git(repo, "mv", "a.md", "b.md")
+        _commit(repo, "Rename", {})
+        _commit(repo, "Edit", {"b.md": "Beta text.\n"})
+        _commit(repo, "[ai-draft] Redraft", {"b.md": "Gamma text.\n"})
+        _commit(repo, "Delete", {"b.md": None})
+
+        out = tmp_path / "history"
+        miner = HistoryMiner(repo, out)
+        miner.run()
+
+        assert _mined(out) == [("b.md", "Edit", [("Alpha", "Beta")])]
+        assert miner.baselines == {}
@@ -0,0 +1,74 @@
+"""Tests for style-rule mining over captured edits."""
+
+from scripts.mine_rules import extract_patterns, mine
+
+
+def _edit(original, edited, editor="human", style="blog", flagged=False, n=0):
+    return {
+        "original": original, "edited": edited, "editor_type": editor, "style": style,
+        "flagged": flagged, "source_file": "posts/a.md", "edit_id": f"edit-{n:03d}",
+    }
+
+
+class TestExtractPatterns:
+    def test_substitution(self):
+        assert extract_patterns("We utilize the tool.", "We use the tool.") == [
+            (0, ["utilize"], ["use"]),
+        ]
+
+    def test_deletion(self):
+        assert extract_patterns("It is very good.", "It is good.") == [(1, ["very"], [])]
+
+    def test_insertion_anchored_on_previous_token(self):
+        assert extract_patterns("Run it now.", "Run it right now.") == [
+            (2, ["it"], ["it", "right"]),
+        ]
+
+    def test_case_only_and_long_rewrites_ignored(self):
+        assert extract_patterns("Same words", "same words") == []
+        assert extract_patterns("one two three four five", "six seven eight nine ten") == []
+
+
+class TestMine:
+    def test_ranking_consistency_and_editors(self):
+        edits = (
+            [_edit(f"We utilize tool {i}.", f"We use tool {i}.", editor="human", n=i)
+             for i in range(6)]
+            + [_edit(f"We utilize tool {i}.", f"We use tool {i}.", editor="agent", n=10 + i)
+               for i in range(4)]
+            + [_edit(f"We utilize tool {i}.", f"We employ tool {i}.", n=20 + i) for i in range(2)]
+            + [_edit("Alone once.", "Single once.", n=30)]
+        )
+        candidates = mine(edits, min_frequency=2)
+
+        top = candidates[0]
+        assert top["statement"] == 'Prefer "use" over "utilize"'
+        assert top["frequency"] == 10
+        assert top["consistency"] == round(10 / 12, 3)
+        assert top["editors"] == {"human": 6, "agent": 4}
+        assert (top["confidence"], top["status"]) == ("high", "candidate")
+        assert top["source_edits"][0] == "posts/a.md#edit-000"
+
+        # Below min_frequency
+        assert all(c["original"] != "alone" for c in candidates)
+
+    def test_consistency_is_per_kind(self):
+        edits = [_edit(f"Run it {i}.", f"Run this {i}.", n=i) for i in range(3)]
+        edits += [_edit(f"Run it {i}.", f"Run it right {i}.", n=10 + i) for i in range(3)]
+        by_kind = {c["kind"]: c for c in mine(edits)}
+        assert by_kind["substitution"]["original"] == by_kind["insertion"]["original"] == "it"
+        assert by_kind["substitution"]["consistency"] == by_kind["insertion"]["consistency"] == 1.0
+
+    def test_scope_from_style_distribution(self):
+        edits = [_edit(f"Our claim {i}.", f"The claim {i}.", style="whitepaper", n=i)
+                 for i in range(5)]
+        edits += [_edit(f"Very nice {i}.", f"Nice {i}.", style=s, n=10 + i)
+                  for i, s in enumerate(["blog", "whitepaper", "technical", "blog"])]
+        by_original = {c["original"]: c for c in mine(edits)}
+        assert (by_original["our"]["scope"], by_original["our"]["style"]) == (
+            "style-specific", "whitepaper",
+        )
+        assert by_original["very"]["scope"] == "global"
+
+    def test_empty(self):
+        assert mine([_edit("Same.", "Same.")]) == []
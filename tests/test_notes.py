@@ -0,0 +1,61 @@
+"""Tests for parsing the notes.md template."""
+
+from agents.notes import parse_notes
+
+NOTES = """# Semantic Ops
+
+## Topic
+How semantic layers change ops.
+
+## POV (Point of View)
+What argument or perspective am I making?
+Ops teams should own the semantic layer.
+
+## Key Points
+- Metrics drift without a shared model
+- Ownership belongs with ops,
+  not with the BI team
+-
+
+## Knowledge Base & References
+Topics for KB search (resolved automatically via RAG):
+- semantic layer
+- metric drift
+
+Optional pinned file references (read directly, bypassing KB):
+- semops-core/docs/ADR-0004.md#decision
+-
+
+## Initial Research Direction
+What should the research agent focus on?
+Find counterexamples from analytics engineering.
+
+## Target Audience
+Data leads.
+"""
+
+
+class TestParseNotes:
+    def test_template_sections(self):
+        notes = parse_notes(NOTES)
+        assert notes.title == "Semantic Ops"
+        assert notes.topic == "How semantic layers change ops."
+        assert notes.research_direction == "Find counterexamples from analytics engineering."
+
+    def test_guiding_questions_are_dropped(self):
+        assert parse_notes(NOTES).pov == "Ops teams should own the semantic layer."
+
+    def test_bullets_join_continuations_and_skip_empty_items(self):
+        assert parse_notes(NOTES).key_points == [
+            "Metrics drift without a shared model",
+            "Ownership belongs with ops, not with the BI team",
+        ]
+
+    def test_kb_topics_and_pinned_refs_are_split(self):
+        notes = parse_notes(NOTES)
+        assert notes.kb_topics == ["semantic layer", "metric drift"]
+        assert notes.pinned_refs == ["semops-core/docs/ADR-0004.md#decision"]
+
+    def test_empty_template(self):
+        notes = parse_notes("# Untitled\n\n## Key Points\n-\n")
+        assert (notes.title, notes.key_points, notes.pinned_refs) == ("Untitled", [], [])
@@ -0,0 +1,80 @@
+"""Tests for pinned reference loading from notes.md."""
+
+from agents.pinned import PinnedLoader, extract_section, parse_ref, slugify
+
+GUIDE = """# Guide
+
+Intro text.
+
+## Edit Capture (v2)
+
+Capture details.
+
+### Sidecar
+
+Sidecar details.
+
+## Publishing
+
+Publishing details.
+"""
+
+
+class TestSlugify:
+    def test_github_style(self):
+        assert slugify("Edit Capture (v2)") == "edit-capture-v2"
+
+
+class TestExtractSection:
+    def test_whole_file_without_anchor(self, tmp_path):
+        path = tmp_path / "guide.md"
+        path.write_text(GUIDE)
+        assert extract_section(path, None) == GUIDE
+
+    def test_section_includes_subsections(self, tmp_path):
+        path = tmp_path / "guide.md"
+        path.write_text(GUIDE)
+        section = extract_section(path, "edit-capture-v2")
+        assert section.startswith("## Edit Capture (v2)")
+        assert "Sidecar details." in section
+        assert "Publishing" not in section
+
+    def test_missing_anchor(self, tmp_path):
+        path = tmp_path / "guide.md"
+        path.write_text(GUIDE)
+        assert extract_section(path, "nope") == ""
+
+
+class TestParseRef:
+    def test_resolves_against_search_dirs(self, tmp_path):
+        (tmp_path / "docs").mkdir()
+        (tmp_path / "docs" / "guide.md").write_text(GUIDE)
+        ref = parse_ref("`docs/guide.md#publishing`", [tmp_path])
+        assert ref.path == tmp_path / "docs" / "guide.md"
+        assert ref.anchor == "publishing"
+
+    def test_repo_path_syntax(self, tmp_path):
+        repo = tmp_path / "semops-core"
+        repo.mkdir()
+        (repo / "guide.md").write_text(GUIDE)
+        ref = parse_ref("repo:semops-ai/semops-core path:guide.md", [repo])
+        assert ref.path == repo / "guide.md"
+
+    def test_unresolvable(self, tmp_path):
+        assert parse_ref("missing.md", [tmp_path]) is None
+
+
+class TestPinnedLoader:
+    def test_budget_truncates_and_caches(self, tmp_path):
+        path = tmp_path / "big.md"
+        path.write_text("\n\n".join(f"Paragraph {i} " + "x" * 200 for i in range(50)))
+        loader = PinnedLoader(tmp_path / "cache", [tmp_path])
+
+        text = loader.load(["big.md"], token_budget=100)
+        assert "[... truncated]" in text
+        assert len(text) < 600
+        assert len(list((tmp_path / "cache" / "pinned").iterdir())) == 1
+
+    def test_lists_unresolved(self, tmp_path):
+        loader = PinnedLoader(tmp_path / "cache", [tmp_path])
+        assert "missing.md" in loader.load(["missing.md"], token_budget=100)
@@ -0,0 +1,106 @@
+"""Tests for bitmap-indexed resume composition."""
+
+import numpy as np
+import pytest
+
+from scripts.resume_composer import BulletIndex, Target
+from scripts.resume_model import Bullet, Job, SkillMapping, SkillTag
+
+
+def _job(job_id, domains=(), platforms=()):
+    return Job(job_id, "Acme", "PM", "2020-01", "present", "Senior", False, 0, 0, "B2B",
+               [], "AdTech", list(domains), list(platforms))
+
+
+def _bullet(bullet_id, job_id, text, metrics, highlight=False, status="validated"):
+    return Bullet(bullet_id, job_id, text, list(metrics), highlight, status)
+
+
+@pytest.fixture
+def index():
+    jobs = [_job("job-ml", ["ML/AI"], ["Cloud"]), _job("job-tv", ["Search"], ["Connected TV"])]
+    bullets = [
+        _bullet("ml-01", "job-ml", "Launched model inference platform", ["Capability", "0-to-1"]),
+        _bullet("ml-02", "job-ml", "Grew usage 3x", ["Output"], highlight=True),
+        _bullet("ml-03", "job-ml", "Cut training cost", ["Capability"], status="raw"),
+        _bullet("tv-01", "job-tv", "Rebuilt search ranking", ["Output", "Capability"]),
+        _bullet("tv-02", "job-tv", "Ran the voice beta", ["Adoption"]),
+    ]
+    mappings = [SkillMapping("job-ml", "ml-ai", "expert"), SkillMapping("job-tv", "search", "x")]
+    tags = [SkillTag("ml-ai", "ML", "technical", ["ai-pm"], True),
+            SkillTag("search", "Search", "technical", ["media-pm"], False)]
+    return BulletIndex(jobs, bullets, mappings, tags)
+
+
+class TestBulletIndex:
+    def test_bitmaps_per_dimension(self, index):
+        assert index.mask("metric_type", "Capability").tolist() == [1, 0, 1, 1, 0]
+        assert index.mask("domain", "ML/AI").tolist() == [1, 1, 1, 0, 0]
+        assert index.mask("role", "media-pm").tolist() == [0, 0, 0, 1, 1]
+        assert index.mask("status", "raw").tolist() == [0, 0, 1, 0, 0]
+        assert not index.mask("platform", "Web").any()
+
+    def test_scores_all_targets_at_once(self, index):
+        targets = [
+            Target("ai", weights={"metric_type": {"Capability": 2}, "role": {"ai-pm": 1}},
+                   keywords={"inference": 3}, highlight=0),
+            Target("media", weights={"domain": {"Search": 1}}, highlight=0.5),
+        ]
+        scores = index.scores(targets)
+        assert scores.shape == (5, 2)
+        np.testing.assert_allclose(scores[:, 0], [6, 1, 3, 2, 0])
+        np.testing.assert_allclose(scores[:, 1], [0, 0.5, 0, 1, 1])
+
+
+    def test_keywords_match_at_sentence_end_and_in_compounds(self):
+        jobs = [_job("job-ml")]
+        bullets = [
+            _bullet("a", "job-ml", "Shipped the ranking model.", []),
+            _bullet("b", "job-ml", "Led the ML/AI roadmap, in C++ and C#.", []),
+        ]
+        index = BulletIndex(jobs, bullets, [], [])
+        targets = [Target(k, keywords={k: 1}) for k in ("model", "ml", "ml/ai", "c++", "c#")]
+        np.testing.assert_allclose(index.scores(targets), [[1, 0, 0, 0, 0], [0, 1, 1, 1, 1]])
+
+    def test_words_drop_trailing_punctuation(self):
+        text = "Cut p99 by 40%. Used node.js, e.g. real-time/batch."
+        index = BulletIndex([_job("job-ml")], [_bullet("a", "job-ml", text, [])], [], [])
+        assert set(index.word_index) == {
+            "cut", "p99", "by", "40", "used", "node.js", "e.g", "real-time/batch",
+            "real-time", "batch",
+        }
+
+
+class TestSelect:
+    def test_per_job_quota(self, index):
+        target = Target("ai", weights={"metric_type": {"Capability": 2, "Output": 1}},
+                        max_bullets=3, max_per_job=1)
+        variant = index.compose([target])[0]
+        assert variant.selected_bullets == {"job-ml": ["ml-01"], "job-tv": ["tv-01"]}
+        # Jobs keep corpus order even though tv-01 outscores every job-ml bullet
+        assert variant.job_order == ["job-ml", "job-tv"]
+
+    def test_min_per_job_guarantees_coverage(self, index):
+        target = Target("ai", weights={"metric_type": {"Capability": 5, "Adoption": 0.1}},
+                        highlight=0, max_bullets=3, min_per_job=1)
+        variant = index.compose([target])[0]
+        assert variant.selected_bullets == {"job-ml": ["ml-01", "ml-03"], "job-tv": ["tv-01"]}
+
+    def test_min_per_job_includes_jobs_that_score_nothing(self, index):
+        target = Target("tv", weights={"domain": {"Search": 1}}, highlight=0, min_per_job=1)
+        variant = index.compose([target])[0]
+        assert variant.job_order == ["job-ml", "job-tv"]
+        assert variant.selected_bullets == {"job-ml": ["ml-01"], "job-tv": ["tv-01", "tv-02"]}
+
+    def test_dict_quota_limits_jobs_and_zero_scores_are_dropped(self, index):
+        target = Target("tv", weights={"domain": {"Search": 1}}, highlight=0,
+                        max_per_job={"job-tv": 5})
+        variant = index.compose([target])[0]
+        assert variant.job_order == ["job-tv"]
+        assert sorted(variant.selected_bullets["job-tv"]) == ["tv-01", "tv-02"]
+
+    def test_target_from_dict(self):
+        target = Target.from_dict({"name": "x", "keywords": ["Model"], "max_per_job": 2})
+        assert target.keywords == {"model": 1.0}
+        with pytest.raises(ValueError, match="unknown dimensions"):
+            Target.from_dict({"name": "x", "weights": {"colour": {}}})
@@ -0,0 +1,76 @@
+"""Tests for the BM25 index over local repo Markdown."""
+
+import os
+from pathlib import Path
+
+from agents.retrieval import RepoIndex, chunk_markdown, tokenize
+
+
+def _write(path: Path, text: str, mtime: int | None = None) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text)
+    if mtime is not None:
+        os.utime(path, ns=(mtime, mtime))
+    return path
+
+
+class TestChunking:
+    def test_tokenize_drops_stopwords_and_single_characters(self):
+        assert tokenize("The semantic-layer and a KPI for dbt_core") == [
+            "semantic-layer", "kpi", "dbt_core",
+        ]
+
+    def test_chunks_split_at_headings(self):
+        chunks = chunk_markdown(Path("a.md"), "intro\n# One\nfirst\n## Two\nsecond\n")
+        assert [(c.heading, c.text) for c in chunks] == [
+            ("", "intro"), ("One", "first"), ("Two", "second"),
+        ]
+
+    def test_long_sections_split_on_paragraph_breaks(self):
+        paragraph = "word " * 300
+        chunks = chunk_markdown(Path("a.md"), f"# H\n{paragraph}\n\n{paragraph}\n")
+        assert [c.heading for c in chunks] == ["H", "H"]
+
+
+class TestRepoIndex:
+    def test_ranks_by_term_relevance(self, tmp_path):
+        _write(tmp_path / "repo" / "drift.md", "# Drift\nmetric drift drift across dashboards")
+        _write(tmp_path / "repo" / "layer.md", "# Layer\nsemantic layer owns metric definitions")
+        _write(tmp_path / "repo" / "other.md", "# Other\nunrelated deployment notes")
+        results = RepoIndex([str(tmp_path / "repo")]).search("metric drift")
+        assert [Path(r["path"]).name for r in results] == ["drift.md", "layer.md"]
+        assert results[0]["heading"] == "Drift"
+        assert results[0]["score"] > results[1]["score"] > 0
+
+    def test_rare_terms_outweigh_common_ones(self, tmp_path):
+        for i in range(5):
+            _write(tmp_path / f"common{i}.md", "metric notes")
+        _write(tmp_path / "rare.md", "ontology notes")
+        results = RepoIndex([str(tmp_path)]).search("metric ontology", limit=1)
+        assert Path(results[0]["path"]).name == "rare.md"
+
+    def test_hidden_and_vendor_directories_are_skipped(self, tmp_path):
+        _write(tmp_path / ".git" / "x.md", "ontology")
+        _write(tmp_path / "node_modules" / "pkg" / "README.md", "ontology")
+        assert RepoIndex([str(tmp_path)]).search("ontology") == []
+
+    def test_refresh_tracks_changed_and_deleted_files(self, tmp_path):
+        doc = _write(tmp_path / "doc.md", "ontology", mtime=1_000_000_000)
+        index = RepoIndex([str(tmp_path), str(tmp_path / "missing")])
+        assert index.search("ontology")
+
+        _write(doc, "taxonomy", mtime=2_000_000_000)
+        assert index.search("ontology") == []
+        assert index.search("taxonomy")
+
+        doc.unlink()
+        assert index.search("taxonomy") == []
+        assert index._total_length == 0
+
+    def test_search_without_refresh_uses_the_last_refresh(self, tmp_path):
+        index = RepoIndex([str(tmp_path)])
+        index.refresh()
+        _write(tmp_path / "new.md", "ontology")
+        assert index.search("ontology", refresh=False) == []
+        index.refresh()
+        assert index.search("ontology", refresh=False)
@@ -0,0 +1,127 @@
+"""Tests for the learned-rewrite pre-pass over drafts."""
+
+import yaml
+
+from scripts.rewrite_draft import Rewriter, Rule, load_rules, rewrite_file
+from scripts.sidecar_log import SidecarLog
+
+
+def _rewriter(*pairs):
+    return Rewriter([Rule(f"rule-{n:03d}", o, e, f"Rule {n}") for n, (o, e) in enumerate(pairs, 1)])
+
+
+class TestRewrite:
+    def test_substitution_preserves_case(self):
+        text, apps = _rewriter(("utilize", "use")).rewrite("Utilize it. We utilize. UTILIZE!")
+        assert text == "Use it. We use. USE!"
+        assert [a.original for a in apps] == ["Utilize", "utilize", "UTILIZE"]
+
+    def test_word_boundaries(self):
+        text, apps = _rewriter(("very", "")).rewrite("Every delivery is very good.")
+        assert text == "Every delivery is good."
+        assert len(apps) == 1
+
+    def test_leftmost_longest_wins(self):
+        rw = _rewriter(("order", "sequence"), ("in order to", "to"))
+        assert rw.rewrite("Do it in order to win, in\norder to finish.")[0] == (
+            "Do it to win, to finish."
+        )
+
+    def test_overlapping_suffix_patterns(self):
+        rw = _rewriter(("she sells", "she offers"), ("he", "they"))
+        assert rw.rewrite("he said she sells shells")[0] == "they said she offers shells"
+
+    def test_deleting_sentence_opener_capitalizes_next_word(self):
+        text, _ = _rewriter(("basically", "")).rewrite("Basically it works. It basically works.")
+        assert text == "It works. It works."
+
+    def test_protected_regions_untouched(self):
+        draft = (
+            "---\ntitle: We utilize tools\n---\n"
+            "We utilize `utilize()` here.\n\n"
+            "```python\nutilize = 1\n```\n"
+            "See [utilize](https://example.com/utilize) and https://x.io/utilize.\n"
+        )
+        text, apps = _rewriter(("utilize", "use")).rewrite(draft)
+        assert len(apps) == 2
+        assert "title: We utilize tools" in text
+        assert "We use `utilize()` here." in text
+        assert "utilize = 1" in text
+        assert "[use](https://example.com/utilize)" in text
+
+    def test_non_idempotent_rules_skipped(self):
+        text, apps = _rewriter(("data", "the data")).rewrite("Use data well.")
+        assert (text, apps) == ("Use data well.", [])
+
+
+class TestLoadRules:
+    def test_filters_kind_style_and_confidence(self, tmp_path):
+        rules_file = tmp_path / "distilled-rules.yaml"
+        rules_file.write_text(yaml.dump({"rules": [
+            {"id": "rule-001", "kind": "substitution", "original": "Utilize", "edited": "use",
+             "style": None, "confidence": "high"},
+            {"id": "rule-002", "kind": "deletion", "original": "very", "edited": "",
+             "style": "whitepaper", "confidence": "medium"},
+            {"id": "rule-003", "kind": "insertion", "original": "it", "edited": "it now"},
+            {"id": "rule-004", "statement": "Prefer active voice", "confidence": "high"},
+            {"id": "rule-005", "original": "leverage", "edited": "use", "confidence": "low"},
+        ]}))
+
+        assert [r.id for r in load_rules(rules_file)] == ["rule-001", "rule-002"]
+        assert [r.id for r in load_rules(rules_file, style="blog")] == ["rule-001"]
+        assert [r.id for r in load_rules(rules_file, min_confidence="low")] == [
+            "rule-001", "rule-002", "rule-005",
+        ]
+        assert load_rules(rules_file)[0].pattern == "utilize"
+
+    def test_unreviewed_rules_need_opting_in(self, tmp_path):
+        rules_file = tmp_path / "rule-candidates.yaml"
+        rules_file.write_text(yaml.dump({"rules": [
+            {"id": "cand-001", "original": "utilize", "edited": "use", "confidence": "high",
+             "status": "candidate"},
+            {"id": "rule-002", "original": "very", "edited": "", "confidence": "high",
+             "status": "approved"},
+            {"id": "rule-003", "original": "just", "edited": "", "confidence": "high",
+             "status": "rejected"},
+            {"id": "rule-004", "original": "leverage", "edited": "use"},
+        ]}))
+
+        assert [r.id for r in load_rules(rules_file)] == ["rule-002"]
+        assert [r.id for r in load_rules(rules_file, include_candidates=True)] == [
+            "cand-001", "rule-002",
+        ]
+
+
+class TestRewriteFile:
+    def test_writes_draft_and_logs_agent_edits(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        rules_file = tmp_path / "rules.yaml"
+        rules_file.write_text(yaml.dump({"rules": [
+            {"id": "rule-001", "original": "utilize", "edited": "use", "confidence": "high",
+             "statement": 'Prefer "use" over "utilize"'},
+        ]}))
+        draft = tmp_path / "draft.md"
+        draft.write_text("# Title\n\nWe utilize tools.\n")
+
+        apps = rewrite_file(draft, rules_file, style="blog")
+
+        assert len(apps) == 1
+        assert draft.read_text() == "# Title\n\nWe use tools.\n"
+        [entry] = SidecarLog.for_file(str(draft)).read()
+        assert entry["editor_type"] == "agent"
+        assert entry["rule_applied"] == "rules.yaml#rule-001"
+        assert entry["line_number"] == 3
+        assert (entry["original"], entry["edited"], entry["style"]) == ("utilize", "use", "blog")
+
+    def test_dry_run_leaves_draft_alone(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        rules_file = tmp_path / "rules.yaml"
+        rules_file.write_text(yaml.dump({"rules": [
+            {"original": "utilize", "edited": "use", "confidence": "medium"},
+        ]}))
+        draft = tmp_path / "draft.md"
+        draft.write_text("We utilize tools.\n")
+
+        assert len(rewrite_file(draft, rules_file, dry_run=True)) == 1
+        assert draft.read_text() == "We utilize tools.\n"
+        assert not SidecarLog.for_file(str(draft)).exists()
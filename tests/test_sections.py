@@ -0,0 +1,118 @@
+"""Tests for outline/draft section alignment used by incremental re-drafting."""
+
+from agents.sections import (
+    align_sections,
+    changed_sections,
+    deleted_sections,
+    join_sections,
+    normalize_heading,
+    split_sections,
+)
+
+OUTLINE = """# Outline: Fast Pipelines
+
+## Meta
+- **Target Audience**: engineers
+
+## I. Introduction
+### Hook
+Why builds are slow
+
+## II. Caching Strategies
+- Key point [^1]
+
+## III. Measuring Wins
+- Benchmarks
+
+## IV. Conclusion
+Wrap up
+"""
+
+DRAFT = """# Fast Pipelines
+
+![Hero](hero.png)
+
+## Introduction
+
+Builds are slow. I edited this by hand.
+
+## Caching Strategies
+
+Cache everything.
+
+```python
+## not a heading
+```
+
+## Measuring Wins
+
+Measure first.
+
+## Conclusion
+
+Done.
+"""
+
+
+class TestSplitSections:
+    def test_round_trips(self):
+        assert join_sections(split_sections(DRAFT)) == DRAFT
+
+    def test_ignores_headings_in_code_fences(self):
+        headings = [s.heading for s in split_sections(DRAFT)]
+        assert "## not a heading" not in headings
+
+    def test_keeps_preamble(self):
+        assert split_sections(DRAFT)[0].heading == ""
+
+
+class TestNormalizeHeading:
+    def test_strips_roman_numerals_and_brackets(self):
+        assert normalize_heading("## II. [Main Section 1]") == "main section 1"
+
+    def test_plain_heading(self):
+        assert normalize_heading("## Conclusion") == "conclusion"
+
+
+class TestAlignSections:
+    def test_matches_by_heading(self):
+        outline = split_sections(OUTLINE)
+        draft = split_sections(DRAFT)
+        mapping = align_sections(outline, draft)
+        pairs = {outline[o].key: draft[d].key for o, d in mapping.items()}
+        assert pairs["caching strategies"] == "caching strategies"
+        assert pairs["conclusion"] == "conclusion"
+
+    def test_skips_outline_only_sections(self):
+        outline = split_sections(OUTLINE)
+        mapping = align_sections(outline, split_sections(DRAFT))
+        assert all(outline[o].key != "meta" for o in mapping)
+
+    def test_renamed_section_paired_by_position(self):
+        outline = split_sections(OUTLINE.replace("## III. Measuring Wins", "## III. Proving It"))
+        draft = split_sections(DRAFT)
+        mapping = align_sections(outline, draft)
+        renamed = next(i for i, s in enumerate(outline) if s.key == "proving it")
+        assert draft[mapping[renamed]].key == "measuring wins"
+
+
+class TestChangedSections:
+    def test_only_edited_section_changes(self):
+        previous = split_sections(OUTLINE)
+        current = split_sections(OUTLINE.replace("- Benchmarks", "- Benchmarks and profiles"))
+        assert changed_sections(current, previous) == {"measuring wins"}
+
+
+class TestDeletedSections:
+    def test_deleted_outline_section_is_found_in_the_draft(self):
+        previous = split_sections(OUTLINE)
+        current = split_sections(OUTLINE.replace("## III. Measuring Wins\n- Benchmarks\n", ""))
+        draft = split_sections(DRAFT)
+        assert [draft[d].key for d in deleted_sections(current, previous, draft)] == [
+            "measuring wins"
+        ]
+
+    def test_renamed_section_is_not_deleted(self):
+        previous = split_sections(OUTLINE)
+        current = split_sections(OUTLINE.replace("## III. Measuring Wins", "## III. Proving It"))
+        assert deleted_sections(current, previous, split_sections(DRAFT)) == []
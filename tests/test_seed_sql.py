@@ -0,0 +1,115 @@
+"""Tests for seed SQL rendering: INSERT batches, COPY blocks and snapshot deltas."""
+
+from scripts.seed_sql import (
+    Manifest,
+    SeedTable,
+    copy_field,
+    render_deletes,
+    render_table,
+    render_upserts,
+    sql_literal,
+)
+
+COLUMNS = ("id", "text", "tags", "flag", "n")
+
+
+def _table(rows, comment=None):
+    return SeedTable("t", COLUMNS, iter(rows), comment)
+
+
+class TestLiterals:
+    def test_sql_literal(self):
+        assert sql_literal(None) == "NULL"
+        assert sql_literal(True) == "TRUE"
+        assert sql_literal(0.6) == "0.6"
+        assert sql_literal("O'Brien") == "'O''Brien'"
+        assert sql_literal(["a", "b'c"]) == "ARRAY['a', 'b''c']::text[]"
+
+    def test_copy_field_escapes_text_format(self):
+        assert copy_field(None) == "\\N"
+        assert copy_field(False) == "f"
+        assert copy_field("a\tb\nc\\d") == "a\\tb\\nc\\\\d"
+        assert copy_field(['x "y"', "z\\"]) == '{"x \\\\"y\\\\"","z\\\\\\\\"}'
+
+
+class TestRenderTable:
+    ROWS = [(f"id-{i}", f"row {i}", ["t"], i % 2 == 0, i) for i in range(5)]
+
+    def test_values_in_batches(self):
+        sql = "".join(render_table(_table(self.ROWS), "values", batch=2))
+        assert sql.count("INSERT INTO t (id, text, tags, flag, n) VALUES") == 3
+        assert "  ('id-4', 'row 4', ARRAY['t']::text[], TRUE, 4);\n" in sql
+
+    def test_values_single_statement(self):
+        sql = "".join(render_table(_table(self.ROWS), "values", batch=0))
+        assert sql.count("INSERT INTO") == 1
+        assert sql.count("),\n") == 4
+
+    def test_copy_block(self):
+        sql = "".join(render_table(_table(self.ROWS[:2], "Things"), "copy"))
+        assert sql == (
+            "-- Things\n"
+            "COPY t (id, text, tags, flag, n) FROM stdin;\n"
+            'id-0\trow 0\t{"t"}\tt\t0\n'
+            'id-1\trow 1\t{"t"}\tf\t1\n'
+            "\\.\n"
+        )
+
+    def test_empty_table_is_only_a_comment(self):
+        assert "".join(render_table(_table([]), "copy")) == "-- (no rows for t)\n"
+
+
+class TestManifest:
+    ROWS = [("a", "Alpha"), ("b", "Beta"), ("c", "Gamma")]
+
+    def _snapshot(self, rows, **kwargs):
+        manifest = Manifest()
+        list(manifest.track(SeedTable("dim", ("id", "name"), rows, **kwargs)).rows)
+        return manifest
+
+    def test_delta_finds_changed_new_and_deleted_rows(self, tmp_path):
+        self._snapshot(self.ROWS).save(tmp_path / "snap.json")
+        since = Manifest.load(tmp_path / "snap.json")
+        rows = [("a", "Alpha"), ("b", "Beta v2"), ("d", "Delta")]
+        delta = since.delta(SeedTable("dim", ("id", "name"), rows))
+        assert delta.upserts == [("b", "Beta v2"), ("d", "Delta")]
+        assert delta.deleted_keys == [("c",)]
+
+        sql = "".join(render_deletes(delta)) + "".join(render_upserts(delta))
+        assert sql == (
+            "DELETE FROM dim WHERE id IN ('c');\n"
+            "INSERT INTO dim (id, name) VALUES\n"
+            "  ('b', 'Beta v2'),\n"
+            "  ('d', 'Delta')\n"
+            "ON CONFLICT (id) DO UPDATE SET name = EXCLUDED.name;\n"
+        )
+
+    def test_unchanged_table_has_empty_delta(self):
+        delta = self._snapshot(self.ROWS).delta(SeedTable("dim", ("id", "name"), self.ROWS))
+        assert (delta.upserts, delta.deleted_keys) == ([], [])
+        assert "".join(render_upserts(delta)) == ""
+
+    def test_snapshot_under_another_key_is_all_upserts(self):
+        since = self._snapshot(self.ROWS, key=("id", "name"))
+        delta = since.delta(SeedTable("dim", ("id", "name"), self.ROWS))
+        assert (delta.upserts, delta.deleted_keys) == (self.ROWS, [])
+
+    def test_non_unique_key_deletes_then_inserts(self):
+        since = self._snapshot(self.ROWS, key=("id",), unique_key=False)
+        table = SeedTable("dim", ("id", "name"), [("a", "Alpha 2")], unique_key=False)
+        delta = since.delta(table)
+        assert "".join(render_deletes(delta)) == "DELETE FROM dim WHERE id IN ('b', 'c', 'a');\n"
+        assert "ON CONFLICT" not in "".join(render_upserts(delta))
+
+    def test_composite_key_bridge(self):
+        def bridge(rows):
+            return SeedTable("bridge", ("job_id", "role_id"), rows, key=("job_id", "role_id"))
+
+        delta = Manifest().delta(bridge([("j", "r")]))
+        assert "ON CONFLICT (job_id, role_id) DO NOTHING" in "".join(render_upserts(delta))
+        since = Manifest()
+        list(since.track(bridge([("j", "r")])).rows)
+        gone = since.delta(bridge([]))
+        assert "".join(render_deletes(gone)) == (
+            "DELETE FROM bridge WHERE (job_id, role_id) IN (('j', 'r'));\n"
+        )
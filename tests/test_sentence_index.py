@@ -0,0 +1,42 @@
+"""Tests for the sentence offset index used by edit capture."""
+
+from scripts.sentence_index import SentenceIndex, split_into_sentences
+
+DOC = """# Title
+First sentence here. Second sentence
+wraps onto a new line.
+  Indented item text.
+## Next
+Final words."""
+
+
+class TestSplitIntoSentences:
+    def test_headings_are_boundaries(self):
+        sentences = split_into_sentences(DOC)
+        assert sentences[0] == "# Title"
+        assert sentences[-1] == "Final words."
+
+
+class TestSentenceIndex:
+    def test_context_for_line(self):
+        ctx = SentenceIndex(DOC.split("\n")).context(3)
+        assert ctx["full_sentence"] == "Second sentence\nwraps onto a new line."
+        assert ctx["sentence_before"] == "First sentence here."
+
+    def test_first_line_has_no_sentence_before(self):
+        ctx = SentenceIndex(DOC.split("\n")).context(1)
+        assert ctx == {"sentence_before": "", "full_sentence": "# Title"}
+
+    def test_indented_line_resolves_to_following_sentence(self):
+        ctx = SentenceIndex(DOC.split("\n")).context(4)
+        assert ctx["full_sentence"].startswith("Indented item text.")
+
+    def test_column_selects_sentence_within_line(self):
+        index = SentenceIndex(DOC.split("\n"))
+        assert index.context(2, column=25)["full_sentence"].startswith("Second sentence")
+
+    def test_line_number_clamped(self):
+        assert SentenceIndex(DOC.split("\n")).context(99)["full_sentence"] == "Final words."
+
+    def test_empty_document(self):
+        assert SentenceIndex([""]).context(1) == {"sentence_before": "", "full_sentence": ""}
@@ -0,0 +1,151 @@
+"""Tests for the append-only JSONL sidecar log."""
+
+import json
+import subprocess
+from multiprocessing import Pool
+
+import yaml
+
+from scripts.sidecar_log import SidecarLog, file_key
+
+
+def _append(args):
+    pending_dir, i = args
+    return SidecarLog("post", pending_dir).append({"original": f"o{i}", "edited": "e"})
+
+
+class TestAppend:
+    def test_ids_are_sequential(self, tmp_path):
+        log = SidecarLog("post", tmp_path)
+        assert [log.append({"original": "a", "edited": "b"}) for _ in range(3)] == [
+            "edit-001", "edit-002", "edit-003",
+        ]
+        assert [e["id"] for e in log.read()] == ["edit-001", "edit-002", "edit-003"]
+
+    def test_concurrent_appends_keep_every_edit(self, tmp_path):
+        with Pool(4) as pool:
+            ids = pool.map(_append, [(tmp_path, i) for i in range(100)])
+        assert len(set(ids)) == 100
+        entries = SidecarLog("post", tmp_path).read()
+        assert sorted(int(e["id"][5:]) for e in entries) == list(range(1, 101))
+
+    def test_counter_seeded_from_existing_yaml_sidecar(self, tmp_path):
+        legacy = {"source_file": "post.md", "edits": [{"id": "edit-001", "original": "x"}]}
+        (tmp_path / "post.yaml").write_text(yaml.dump(legacy))
+        log = SidecarLog("post", tmp_path)
+        assert log.append({"original": "y"}) == "edit-002"
+        assert [e["original"] for e in log.read()] == ["x", "y"]
+
+    def test_torn_line_is_skipped(self, tmp_path):
+        log = SidecarLog("post", tmp_path)
+        log.append({"original": "a"})
+        with open(log.log_path, "a") as f:
+            f.write('{"id": "edit-0')
+        assert len(log.read()) == 1
+
+
+class TestCompact:
+    def test_compact_renders_yaml_and_truncates_log(self, tmp_path):
+        log = SidecarLog("post", tmp_path)
+        log.append({"original": "a", "edited": "b", "file": "posts/x/post.md"})
+        log.append({"original": "c", "edited": "d"})
+
+        path = log.compact()
+        data = yaml.safe_load(path.read_text())
+        assert data["source_file"] == "posts/x/post.md"
+        assert [e["id"] for e in data["edits"]] == ["edit-001", "edit-002"]
+        assert not log.log_path.exists()
+
+        # New appends continue the sequence after compaction
+        assert log.append({"original": "e"}) == "edit-003"
+        assert [e["id"] for e in log.read()] == ["edit-001", "edit-002", "edit-003"]
+
+    def test_compact_empty_returns_none(self, tmp_path):
+        assert SidecarLog("post", tmp_path).compact() is None
+
+    def test_clear_resets_sequence(self, tmp_path):
+        log = SidecarLog("post", tmp_path)
+        log.append({"original": "a"})
+        log.clear()
+        assert not log.exists()
+        assert log.append({"original": "b"}) == "edit-001"
+
+
+class TestArchive:
+    def test_archive_moves_yaml_and_clears(self, tmp_path):
+        log = SidecarLog("post", tmp_path)
+        log.append({"original": "a", "edited": "b"})
+        dest = log.archive(tmp_path / "archive" / "2026-01-01-post.yaml")
+        assert [e["id"] for e in yaml.safe_load(dest.read_text())["edits"]] == ["edit-001"]
+        assert not log.exists() and not log.seq_path.exists()
+        assert log.archive(tmp_path / "archive" / "again.yaml") is None
+        assert log.append({"original": "c"}) == "edit-001"
+
+    def test_appends_during_archiving_are_not_lost(self, tmp_path):
+        log = SidecarLog("post", tmp_path)
+        archived = []
+        with Pool(4) as pool:
+            pending = pool.map_async(_append, [(tmp_path, i) for i in range(200)])
+            while not pending.ready():
+                dest = log.archive(tmp_path / "archive" / f"{len(archived)}.yaml")
+                if dest:
+                    archived.append(dest)
+            pending.get()
+        if log.exists():
+            archived.append(log.archive(tmp_path / "archive" / "last.yaml"))
+        originals = [
+            e["original"] for path in archived for e in yaml.safe_load(path.read_text())["edits"]
+        ]
+        assert sorted(originals) == sorted(f"o{i}" for i in range(200))
+
+
+def _checkout(path):
+    (path / "posts" / "a").mkdir(parents=True)
+    (path / "posts" / "a" / "draft.md").write_text("Draft.\n")
+    subprocess.run(["git", "init", "-q"], cwd=path, check=True)
+    return path
+
+
+class TestFileKey:
+    def test_same_post_same_key_on_every_checkout(self, tmp_path, monkeypatch):
+        first = _checkout(tmp_path / "one" / "semops-publisher")
+        second = _checkout(tmp_path / "two" / "semops-publisher")
+        monkeypatch.chdir(first)
+        key = file_key("posts/a/draft.md")
+        assert key.startswith("a-draft-")
+        assert file_key(first / "posts" / "a" / "draft.md") == key
+        monkeypatch.chdir(first / "posts")
+        assert file_key("a/draft.md") == key
+        monkeypatch.chdir(second)
+        assert file_key("posts/a/draft.md") == key
+        assert file_key("posts/b/draft.md") != key
+
+    def test_files_in_another_repo_keep_its_name(self, tmp_path, monkeypatch):
+        here = _checkout(tmp_path / "semops-publisher")
+        other = _checkout(tmp_path / "semops-core")
+        monkeypatch.chdir(here)
+        assert file_key(other / "posts" / "a" / "draft.md") != file_key("posts/a/draft.md")
+
+
+class TestLegacySidecar:
+    def test_stem_sidecar_for_the_same_file_is_adopted(self, tmp_path, capsys):
+        draft = tmp_path / "posts" / "a" / "draft.md"
+        (tmp_path / "draft.jsonl").write_text(
+            json.dumps({"id": "edit-001", "original": "x", "file": str(draft)}) + "\n"
+        )
+        log = SidecarLog.for_file(str(draft), tmp_path)
+        assert [e["original"] for e in log.read()] == ["x"]
+        assert not (tmp_path / "draft.jsonl").exists()
+        assert log.append({"original": "y"}) == "edit-002"
+        assert capsys.readouterr().err == ""
+
+    def test_stem_sidecar_for_another_file_is_reported_once(self, tmp_path, capsys):
+        other = tmp_path / "posts" / "b" / "draft.md"
+        (tmp_path / "draft.jsonl").write_text(
+            json.dumps({"id": "edit-001", "original": "x", "file": str(other)}) + "\n"
+        )
+        draft = tmp_path / "posts" / "a" / "draft.md"
+        assert not SidecarLog.for_file(str(draft), tmp_path).exists()
+        SidecarLog.for_file(str(draft), tmp_path)
+        assert capsys.readouterr().err.count("Warning:") == 1
+        assert (tmp_path / "draft.jsonl").exists()
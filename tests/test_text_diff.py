@@ -0,0 +1,80 @@
+"""Tests for the in-process text diff used by edit capture."""
+
+import random
+
+from scripts.text_diff import diff_sequences, diff_texts
+
+
+def _apply(a: list, b: list, opcodes: list) -> list:
+    """Rebuild b from opcodes, checking they tile both sequences."""
+    out, i, j = [], 0, 0
+    for tag, i1, i2, j1, j2 in opcodes:
+        assert (i1, j1) == (i, j)
+        if tag == "equal":
+            assert a[i1:i2] == b[j1:j2]
+        out += b[j1:j2]
+        i, j = i2, j2
+    assert (i, j) == (len(a), len(b))
+    return out
+
+
+class TestDiffSequences:
+    def test_opcodes_reconstruct_target(self):
+        rng = random.Random(7)
+        for _ in range(500):
+            a = [rng.choice("abcde") for _ in range(rng.randint(0, 25))]
+            b = [rng.choice("abcde") for _ in range(rng.randint(0, 25))]
+            assert _apply(a, b, diff_sequences(a, b)) == b
+
+    def test_unique_anchors_align_around_rewrite(self):
+        a = ["intro", "x", "y", "middle", "z", "outro"]
+        b = ["intro", "p", "middle", "q", "r", "outro"]
+        equal = [op for op in diff_sequences(a, b) if op[0] == "equal"]
+        assert [(a[i1], b[j1]) for _, i1, _, j1, _ in equal] == [
+            ("intro", "intro"), ("middle", "middle"), ("outro", "outro"),
+        ]
+
+    def test_edit_cap_degrades_to_replace(self):
+        a, b = list("ab" * 50), list("ba" * 50)
+        opcodes = diff_sequences(a, b, max_d=1)
+        assert _apply(a, b, opcodes) == b
+
+
+class TestDiffTexts:
+    def test_word_level_span(self):
+        original = "# Title\nOur methodology focuses on outcomes."
+        edited = "# Title\nThe methodology focuses on outcomes."
+        [edit] = diff_texts(original, edited)
+        assert (edit.kind, edit.original, edit.edited) == ("replace", "Our", "The")
+        assert original[edit.orig_start:edit.orig_end] == "Our"
+        assert edited[edit.edit_start:edit.edit_end] == "The"
+
+    def test_reflowed_paragraph_is_not_an_edit(self):
+        original = "First sentence is long. Second one\nwraps here."
+        edited = "First sentence is\nlong. Second one wraps here."
+        assert diff_texts(original, edited) == []
+
+    def test_nearby_word_changes_merge(self):
+        original = "We think this is very good, and the team agrees with it."
+        edited = "We believe this is quite good, and the team agrees with us."
+        edits = diff_texts(original, edited)
+        assert [(e.original, e.edited) for e in edits] == [
+            ("think this is very", "believe this is quite"),
+            ("it.", "us."),
+        ]
+
+    def test_insert_delete_and_move(self):
+        original = "Keep this. Drop this sentence. Moved one. Final words."
+        edited = "Keep this. Final words. Moved one. Brand new."
+        kinds = {e.kind: e for e in diff_texts(original, edited)}
+        assert kinds["delete"].original == "Drop this sentence."
+        assert kinds["insert"].edited == "Brand new."
+        move = kinds["move"]
+        assert original[move.orig_start:move.orig_end] == "Moved one."
+        assert edited[move.edit_start:move.edit_end] == "Moved one."
+
+    def test_large_rewrite_is_bounded(self):
+        original = " ".join(f"Alpha {i} text." for i in range(3000))
+        edited = " ".join(f"Beta {i} prose." for i in range(3000))
+        edits = diff_texts(original, edited, max_d=50)
+        assert len(edits) == 1 and edits[0].kind == "replace"